@@ -6,11 +6,18 @@ This module implements a classic producer-consumer pattern demonstrating:
 - Concurrent programming
 - Blocking queues
 - Wait/Notify mechanism using threading.Condition
+- An asyncio variant for single-threaded event loops
 """
 
 from .blocking_queue import BlockingQueue
 from .producer import Producer
 from .consumer import Consumer
+from .spsc_ring_queue import SPSCRingQueue
+from .work_stealing_queue import WorkStealingQueue
+from .async_blocking_queue import AsyncBlockingQueue, AsyncProducer, AsyncConsumer
 
-__all__ = ['BlockingQueue', 'Producer', 'Consumer']
+__all__ = [
+    'BlockingQueue', 'Producer', 'Consumer', 'SPSCRingQueue', 'WorkStealingQueue',
+    'AsyncBlockingQueue', 'AsyncProducer', 'AsyncConsumer',
+]
 
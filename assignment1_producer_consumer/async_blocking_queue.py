@@ -0,0 +1,365 @@
+"""
+Asyncio Blocking Queue Implementation
+
+An asyncio-native counterpart to BlockingQueue for I/O-shaped workloads.
+Producers and consumers run as coroutines on a single event loop, so no
+OS threads or locks are involved: waiting is done on asyncio futures and
+state changes are atomic between await points.
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Iterable, List, Optional, Tuple
+
+
+class AsyncBlockingQueue:
+    """
+    A bounded asyncio queue with the same contract as BlockingQueue.
+    
+    put() suspends the calling coroutine while the queue is full and get()
+    suspends while it is empty. shutdown() releases all suspended
+    coroutines; consumers may still drain items left in the queue.
+    
+    Attributes:
+        capacity (int): Maximum number of items the queue can hold.
+    """
+    
+    def __init__(self, capacity: int = 10):
+        """
+        Initialize the async blocking queue.
+        
+        Args:
+            capacity: Maximum capacity of the queue. Default is 10.
+        
+        Raises:
+            ValueError: If capacity is less than 1.
+        """
+        if capacity < 1:
+            raise ValueError("Capacity must be at least 1")
+        
+        self._capacity = capacity
+        self._queue: deque = deque()
+        
+        # Futures of coroutines waiting for space / for items
+        self._putters: Deque[asyncio.Future] = deque()
+        self._getters: Deque[asyncio.Future] = deque()
+        
+        # Flag to signal shutdown
+        self._shutdown = False
+        
+        # Statistics tracking
+        self._total_items_added = 0
+        self._total_items_removed = 0
+    
+    @property
+    def capacity(self) -> int:
+        """Return the maximum capacity of the queue."""
+        return self._capacity
+    
+    async def _wait(self, waiters: Deque[asyncio.Future], deadline: Optional[float]) -> bool:
+        """
+        Suspend until woken by _wake_one() or _wake_all(), or until deadline.
+        
+        A waiter that is woken but times out or is cancelled before it runs
+        passes the wakeup on, so the item or slot it was woken for is not
+        left with nobody waiting for it.
+        
+        Returns:
+            True if woken, False if the deadline passed.
+        """
+        timeout = None
+        if deadline is not None:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                return False
+        future = asyncio.get_running_loop().create_future()
+        waiters.append(future)
+        woken = False
+        try:
+            await asyncio.wait_for(future, timeout)
+            woken = True
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            if not woken:
+                if future.done() and not future.cancelled():
+                    self._wake_one(waiters)
+                else:
+                    future.cancel()
+                    try:
+                        waiters.remove(future)
+                    except ValueError:
+                        pass
+    
+    @staticmethod
+    def _wake_one(waiters: Deque[asyncio.Future]) -> None:
+        """Wake the longest-waiting coroutine on the given side of the queue."""
+        while waiters:
+            future = waiters.popleft()
+            if not future.done():
+                future.set_result(None)
+                return
+    
+    @staticmethod
+    def _wake_all(waiters: Deque[asyncio.Future]) -> None:
+        """Wake every coroutine waiting on the given side of the queue."""
+        while waiters:
+            future = waiters.popleft()
+            if not future.done():
+                future.set_result(None)
+    
+    async def put(self, item: Any, timeout: Optional[float] = None) -> bool:
+        """
+        Add an item to the queue, suspending if full.
+        
+        Args:
+            item: The item to add to the queue.
+            timeout: Maximum time to wait in seconds. None means wait forever.
+        
+        Returns:
+            True if item was added successfully, False if timeout expired
+            or queue is shutdown.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while len(self._queue) >= self._capacity and not self._shutdown:
+            if not await self._wait(self._putters, deadline):
+                return False
+        
+        if self._shutdown:
+            return False
+        
+        self._queue.append(item)
+        self._total_items_added += 1
+        self._wake_one(self._getters)
+        return True
+    
+    async def get(self, timeout: Optional[float] = None) -> Tuple[bool, Any]:
+        """
+        Remove and return an item from the queue, suspending if empty.
+        
+        Args:
+            timeout: Maximum time to wait in seconds. None means wait forever.
+        
+        Returns:
+            A tuple (success, item) where success is True if an item was
+            retrieved, False if timeout expired or queue is shutdown.
+            When success is False, item is None.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self._queue and not self._shutdown:
+            if not await self._wait(self._getters, deadline):
+                return (False, None)
+        
+        if not self._queue:
+            return (False, None)
+        
+        item = self._queue.popleft()
+        self._total_items_removed += 1
+        self._wake_one(self._putters)
+        return (True, item)
+    
+    def size(self) -> int:
+        """Return the current number of items in the queue."""
+        return len(self._queue)
+    
+    def is_empty(self) -> bool:
+        """Check if the queue is empty."""
+        return not self._queue
+    
+    def is_full(self) -> bool:
+        """Check if the queue is at capacity."""
+        return len(self._queue) >= self._capacity
+    
+    def shutdown(self) -> None:
+        """
+        Shutdown the queue, releasing all suspended coroutines.
+        
+        After shutdown, put() returns False immediately and get() returns
+        remaining items until the queue is empty.
+        """
+        self._shutdown = True
+        self._wake_all(self._putters)
+        self._wake_all(self._getters)
+    
+    def is_shutdown(self) -> bool:
+        """Check if the queue has been shutdown."""
+        return self._shutdown
+    
+    def drained(self) -> bool:
+        """Check if the queue is shutdown and empty."""
+        return self._shutdown and not self._queue
+    
+    async def __aenter__(self) -> 'AsyncBlockingQueue':
+        """Async context manager entry - returns the queue instance."""
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Async context manager exit - automatically shuts down the queue."""
+        self.shutdown()
+    
+    def __len__(self) -> int:
+        """Return the current size of the queue."""
+        return len(self._queue)
+    
+    def __repr__(self) -> str:
+        """Return string representation of the queue."""
+        return (f"AsyncBlockingQueue(capacity={self._capacity}, "
+                f"size={len(self._queue)}, shutdown={self._shutdown})")
+    
+    def get_statistics(self) -> dict:
+        """
+        Get queue statistics.
+        
+        Returns:
+            Dictionary with total_items_added, total_items_removed,
+            current_size and capacity.
+        """
+        return {
+            "total_items_added": self._total_items_added,
+            "total_items_removed": self._total_items_removed,
+            "current_size": len(self._queue),
+            "capacity": self._capacity
+        }
+
+
+class AsyncProducer:
+    """
+    A producer coroutine that reads from a source and adds items to a queue.
+    
+    Attributes:
+        name (str): Name of the producer.
+    """
+    
+    def __init__(
+        self,
+        queue: AsyncBlockingQueue,
+        source: Iterable[Any],
+        name: str = "AsyncProducer",
+        delay: float = 0.0,
+        on_produce: Optional[Callable[[Any], None]] = None
+    ):
+        """
+        Initialize the producer.
+        
+        Args:
+            queue: The async queue to put items into.
+            source: An iterable source of items to produce.
+            name: Name for the producer.
+            delay: Optional delay between producing items (in seconds).
+            on_produce: Optional callback called after each item is produced.
+        """
+        self.name = name
+        self._queue = queue
+        self._source = source
+        self._delay = delay
+        self._on_produce = on_produce
+        self._items_produced = 0
+        self._stopped = False
+    
+    @property
+    def items_produced(self) -> int:
+        """Return the number of items produced so far."""
+        return self._items_produced
+    
+    async def run(self) -> None:
+        """Read items from the source and put them into the queue."""
+        for item in self._source:
+            if self._stopped:
+                break
+            
+            if not await self._queue.put(item):
+                # Queue is shutdown
+                break
+            
+            self._items_produced += 1
+            
+            if self._on_produce:
+                self._on_produce(item)
+            
+            if self._delay > 0:
+                await asyncio.sleep(self._delay)
+    
+    def stop(self) -> None:
+        """Signal the producer to stop after the current item."""
+        self._stopped = True
+    
+    def __repr__(self) -> str:
+        return f"AsyncProducer(name={self.name}, produced={self._items_produced})"
+
+
+class AsyncConsumer:
+    """
+    A consumer coroutine that reads from a queue and stores items.
+    
+    Attributes:
+        name (str): Name of the consumer.
+    """
+    
+    def __init__(
+        self,
+        queue: AsyncBlockingQueue,
+        destination: Optional[List[Any]] = None,
+        name: str = "AsyncConsumer",
+        delay: float = 0.0,
+        on_consume: Optional[Callable[[Any], None]] = None,
+        timeout: Optional[float] = 1.0
+    ):
+        """
+        Initialize the consumer.
+        
+        Args:
+            queue: The async queue to get items from.
+            destination: Optional list to store consumed items. If None,
+                        a new list will be created.
+            name: Name for the consumer.
+            delay: Optional delay between consuming items (in seconds).
+            on_consume: Optional callback called after each item is consumed.
+            timeout: Timeout for queue.get() operations. Allows checking
+                    for stop signals periodically.
+        """
+        self.name = name
+        self._queue = queue
+        self._destination = destination if destination is not None else []
+        self._delay = delay
+        self._on_consume = on_consume
+        self._timeout = timeout
+        self._items_consumed = 0
+        self._stopped = False
+    
+    @property
+    def items_consumed(self) -> int:
+        """Return the number of items consumed so far."""
+        return self._items_consumed
+    
+    @property
+    def destination(self) -> List[Any]:
+        """Return the destination container with consumed items."""
+        return self._destination
+    
+    async def run(self) -> None:
+        """Get items from the queue until it is shutdown and drained."""
+        while not self._stopped:
+            success, item = await self._queue.get(timeout=self._timeout)
+            
+            if not success:
+                if self._queue.drained():
+                    break
+                continue
+            
+            self._destination.append(item)
+            self._items_consumed += 1
+            
+            if self._on_consume:
+                self._on_consume(item)
+            
+            if self._delay > 0:
+                await asyncio.sleep(self._delay)
+    
+    def stop(self) -> None:
+        """Signal the consumer to stop after the current item."""
+        self._stopped = True
+    
+    def __repr__(self) -> str:
+        return f"AsyncConsumer(name={self.name}, consumed={self._items_consumed})"
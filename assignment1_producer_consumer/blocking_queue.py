@@ -7,13 +7,10 @@ producer and consumer threads.
 """
 
 import threading
-import logging
-from typing import Any, Optional, Tuple
+import time
+from typing import Any, List, Optional, Sequence, Tuple
 from collections import deque
 
-# Configure module logger
-logger = logging.getLogger(__name__)
-
 
 class BlockingQueue:
     """
@@ -40,21 +37,35 @@ class BlockingQueue:
             raise ValueError("Capacity must be at least 1")
         
         self._capacity = capacity
+        # Capacity is enforced under the lock by put()/put_many(); no
+        # maxlen, which would silently drop the oldest item on overflow
         self._queue: deque = deque()
         self._lock = threading.Lock()
         
-        # Condition variable for wait/notify mechanism
+        # Pre-bound C-level deque operations used on the put/get hot path
+        self._append = self._queue.append
+        self._popleft = self._queue.popleft
+        
+        # Condition variables for the wait/notify mechanism, both on _lock
         # not_full: signaled when queue has space available
         # not_empty: signaled when queue has items available
         self._not_full = threading.Condition(self._lock)
         self._not_empty = threading.Condition(self._lock)
         
+        # Number of producers and consumers currently blocked in wait().
+        # Python cannot signal a Condition without holding its lock, so
+        # instead the notify call is skipped when nobody on that side waits.
+        self._put_waiters = 0
+        self._get_waiters = 0
+        
         # Flag to signal shutdown
         self._shutdown = False
         
-        # Statistics tracking
+        # Statistics tracking. Removed items are not counted in get();
+        # get_statistics() derives them from the added, discarded and
+        # current counts instead.
         self._total_items_added = 0
-        self._total_items_removed = 0
+        self._total_items_discarded = 0
         self._total_blocked_puts = 0
         self._total_blocked_gets = 0
     
@@ -63,6 +74,23 @@ class BlockingQueue:
         """Return the maximum capacity of the queue."""
         return self._capacity
     
+    @staticmethod
+    def _wait(condition: threading.Condition, deadline: Optional[float]) -> bool:
+        """
+        Wait on a condition, which must be held, until notified or deadline.
+        
+        Returns:
+            False if the deadline has already passed, True otherwise.
+        """
+        if deadline is None:
+            condition.wait()
+            return True
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        condition.wait(timeout=remaining)
+        return True
+    
     def put(self, item: Any, timeout: Optional[float] = None) -> bool:
         """
         Add an item to the queue, blocking if full.
@@ -78,14 +106,22 @@ class BlockingQueue:
             True if item was added successfully, False if timeout expired
             or queue is shutdown.
         """
-        with self._not_full:
+        queue = self._queue
+        capacity = self._capacity
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
             # Wait while queue is full (and not shutdown)
             blocked = False
-            while len(self._queue) >= self._capacity and not self._shutdown:
+            while len(queue) >= capacity and not self._shutdown:
                 if not blocked:
                     self._total_blocked_puts += 1
                     blocked = True
-                if not self._not_full.wait(timeout=timeout):
+                self._put_waiters += 1
+                try:
+                    waited = self._wait(self._not_full, deadline)
+                finally:
+                    self._put_waiters -= 1
+                if not waited:
                     # Timeout expired
                     return False
             
@@ -93,11 +129,12 @@ class BlockingQueue:
                 return False
             
             # Add item to queue
-            self._queue.append(item)
+            self._append(item)
             self._total_items_added += 1
             
-            # Notify waiting consumers that queue is not empty
-            self._not_empty.notify()
+            # Notify a waiting consumer that queue is not empty
+            if self._get_waiters:
+                self._not_empty.notify()
             
             return True
     
@@ -116,29 +153,184 @@ class BlockingQueue:
             retrieved, False if timeout expired or queue is shutdown.
             When success is False, item is None.
         """
-        with self._not_empty:
+        queue = self._queue
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
             # Wait while queue is empty (and not shutdown)
             blocked = False
-            while len(self._queue) == 0 and not self._shutdown:
+            while not queue and not self._shutdown:
                 if not blocked:
                     self._total_blocked_gets += 1
                     blocked = True
-                if not self._not_empty.wait(timeout=timeout):
+                self._get_waiters += 1
+                try:
+                    waited = self._wait(self._not_empty, deadline)
+                finally:
+                    self._get_waiters -= 1
+                if not waited:
                     # Timeout expired
                     return (False, None)
             
-            if self._shutdown and len(self._queue) == 0:
+            if not queue:
+                # Queue is shutdown and drained
                 return (False, None)
             
             # Remove item from queue
-            item = self._queue.popleft()
-            self._total_items_removed += 1
+            item = self._popleft()
             
-            # Notify waiting producers that queue is not full
-            self._not_full.notify()
+            # Notify a waiting producer that queue is not full
+            if self._put_waiters:
+                self._not_full.notify()
             
             return (True, item)
     
+    def get_with_status(self, timeout: Optional[float] = None) -> Tuple[bool, Any, bool]:
+        """
+        Like get(), but also reports whether the queue is finished.
+        
+        Lets a consumer decide under a single lock acquisition whether to
+        process an item, retry after a timeout, or stop.
+        
+        Args:
+            timeout: Maximum time to wait in seconds. None means wait forever.
+        
+        Returns:
+            A tuple (success, item, done). On success, (True, item, False).
+            On timeout, (False, None, False). When the queue is shutdown and
+            empty, (False, None, True).
+        """
+        queue = self._queue
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            # Wait while queue is empty (and not shutdown)
+            blocked = False
+            while not queue and not self._shutdown:
+                if not blocked:
+                    self._total_blocked_gets += 1
+                    blocked = True
+                self._get_waiters += 1
+                try:
+                    waited = self._wait(self._not_empty, deadline)
+                finally:
+                    self._get_waiters -= 1
+                if not waited:
+                    # Timeout expired; the queue may have been shutdown meanwhile
+                    return (False, None, self._shutdown and not queue)
+            
+            if not queue:
+                # Queue is shutdown and drained
+                return (False, None, True)
+            
+            # Remove item from queue
+            item = self._popleft()
+            
+            # Notify a waiting producer that queue is not full
+            if self._put_waiters:
+                self._not_full.notify()
+            
+            return (True, item, False)
+    
+    def put_many(self, items: Sequence[Any], timeout: Optional[float] = None) -> int:
+        """
+        Add several items to the queue, blocking while it is full.
+        
+        Items are appended in order, as many as fit per lock acquisition,
+        with a single notify per batch instead of one per item.
+        
+        Args:
+            items: The items to add to the queue.
+            timeout: Maximum time in seconds to wait in total while the
+                    queue is full. None means wait forever.
+        
+        Returns:
+            The number of items added. Less than len(items) if a timeout
+            expired or the queue was shutdown.
+        """
+        total = len(items)
+        added = 0
+        queue = self._queue
+        capacity = self._capacity
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            while added < total:
+                # Wait while queue is full (and not shutdown)
+                blocked = False
+                while len(queue) >= capacity and not self._shutdown:
+                    if not blocked:
+                        self._total_blocked_puts += 1
+                        blocked = True
+                    self._put_waiters += 1
+                    try:
+                        waited = self._wait(self._not_full, deadline)
+                    finally:
+                        self._put_waiters -= 1
+                    if not waited:
+                        # Timeout expired
+                        return added
+                
+                if self._shutdown:
+                    return added
+                
+                # Add as many items as fit
+                count = min(capacity - len(queue), total - added)
+                queue.extend(items[added:added + count])
+                self._total_items_added += count
+                added += count
+                
+                # One consumer can proceed per item added
+                if self._get_waiters:
+                    self._not_empty.notify(count)
+        
+        return added
+    
+    def get_many(self, max_items: int, timeout: Optional[float] = None) -> List[Any]:
+        """
+        Remove and return up to max_items items, blocking if empty.
+        
+        Waits only until at least one item is available, then takes as
+        many as are queued (up to max_items) under a single lock.
+        
+        Args:
+            max_items: Maximum number of items to return.
+            timeout: Maximum time to wait in seconds. None means wait forever.
+        
+        Returns:
+            A list of retrieved items in FIFO order. Empty if timeout
+            expired or the queue is shutdown and empty.
+        
+        Raises:
+            ValueError: If max_items is less than 1.
+        """
+        if max_items < 1:
+            raise ValueError("max_items must be at least 1")
+        
+        queue = self._queue
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            # Wait while queue is empty (and not shutdown)
+            blocked = False
+            while not queue and not self._shutdown:
+                if not blocked:
+                    self._total_blocked_gets += 1
+                    blocked = True
+                self._get_waiters += 1
+                try:
+                    waited = self._wait(self._not_empty, deadline)
+                finally:
+                    self._get_waiters -= 1
+                if not waited:
+                    # Timeout expired
+                    return []
+            
+            popleft = self._popleft
+            items = [popleft() for _ in range(min(max_items, len(queue)))]
+            
+            # Notify waiting producers that queue is not full
+            if items and self._put_waiters:
+                self._not_full.notify(len(items))
+            
+            return items
+    
     def size(self) -> int:
         """
         Return the current number of items in the queue.
@@ -192,6 +384,16 @@ class BlockingQueue:
         with self._lock:
             return self._shutdown
     
+    def drained(self) -> bool:
+        """
+        Check if the queue is shutdown and empty, as one atomic read.
+        
+        Returns:
+            True once no further items can ever be retrieved.
+        """
+        with self._lock:
+            return self._shutdown and not self._queue
+    
     def clear(self) -> None:
         """
         Remove all items from the queue.
@@ -199,6 +401,7 @@ class BlockingQueue:
         This operation is thread-safe and will notify any waiting producers.
         """
         with self._lock:
+            self._total_items_discarded += len(self._queue)
             self._queue.clear()
             self._not_full.notify_all()
     
@@ -230,12 +433,15 @@ class BlockingQueue:
             - blocked_gets: Times get() had to wait
         """
         with self._lock:
+            size = len(self._queue)
             return {
                 "total_items_added": self._total_items_added,
-                "total_items_removed": self._total_items_removed,
+                "total_items_removed": (
+                    self._total_items_added - self._total_items_discarded - size
+                ),
                 "blocked_puts": self._total_blocked_puts,
                 "blocked_gets": self._total_blocked_gets,
-                "current_size": len(self._queue),
+                "current_size": size,
                 "capacity": self._capacity
             }
 
@@ -5,8 +5,8 @@ The Consumer class reads items from a shared blocking queue and stores
 them in a destination container.
 """
 
+import sys
 import threading
-import time
 from typing import Any, Callable, List, Optional
 from .blocking_queue import BlockingQueue
 
@@ -32,7 +32,9 @@ class Consumer(threading.Thread):
         name: str = "Consumer",
         delay: float = 0.0,
         on_consume: Optional[Callable[[Any], None]] = None,
-        timeout: Optional[float] = 1.0
+        timeout: Optional[float] = 1.0,
+        batch_size: int = 32,
+        local_buffer: bool = False
     ):
         """
         Initialize the consumer.
@@ -46,6 +48,15 @@ class Consumer(threading.Thread):
             on_consume: Optional callback called after each item is consumed.
             timeout: Timeout for queue.get() operations. Allows checking
                     for stop signals periodically.
+            batch_size: Maximum number of items taken from the queue per
+                       get_many() call. Items are taken one at a time when
+                       a delay is set.
+            local_buffer: If True, consumed items are collected in a list
+                         private to this thread and added to the destination
+                         in one extend() when the consumer finishes, so
+                         consumers sharing a destination do not contend on
+                         it per item. The destination only fills once the
+                         thread has been joined.
         """
         super().__init__(name=name)
         self._queue = queue
@@ -53,8 +64,13 @@ class Consumer(threading.Thread):
         self._delay = delay
         self._on_consume = on_consume
         self._timeout = timeout
+        self._batch_size = batch_size
+        self._local_buffer = local_buffer
         self._items_consumed = 0
         self._running = False
+        # Plain flag checked once per iteration; the Event is only used to
+        # cut a delay short
+        self._stop_requested = False
         self._stop_event = threading.Event()
     
     @property
@@ -80,44 +96,123 @@ class Consumer(threading.Thread):
         This method is called when the thread is started.
         """
         self._running = True
+        buffer: List[Any] = []
+        store = buffer.append if self._local_buffer else self._destination.append
         
         try:
-            while not self._stop_event.is_set():
-                # Try to get item from queue with timeout
-                success, item = self._queue.get(timeout=self._timeout)
-                
-                if not success:
-                    # Check if queue is shutdown and empty
-                    if self._queue.is_shutdown() and self._queue.is_empty():
-                        break
-                    # Otherwise, it was just a timeout - continue loop
-                    continue
-                
-                # Store item in destination
-                self._destination.append(item)
-                self._items_consumed += 1
-                
-                # Call callback if provided
-                if self._on_consume:
-                    self._on_consume(item)
-                
-                # Optional delay between items
-                if self._delay > 0:
-                    time.sleep(self._delay)
-                    
+            # A paced consumer takes one item at a time so that stop() is
+            # honoured between items instead of after a whole batch.
+            if self._delay > 0 or self._batch_size <= 1:
+                self._run_single(store)
+            else:
+                self._run_batched(store)
         finally:
+            if buffer:
+                self._destination.extend(buffer)
             self._running = False
     
+    def _run_single(self, store: Callable[[Any], None]) -> None:
+        """
+        Consumer loop taking one item per queue operation.
+        
+        Uses get_with_status() so the stop-or-retry decision after an
+        unsuccessful get is made under the same lock acquisition.
+        Attribute lookups that do not change during the run are bound to
+        locals up front.
+        
+        Args:
+            store: Callable that records one consumed item.
+        """
+        queue_get = self._queue.get_with_status
+        wait_for_stop = self._stop_event.wait
+        on_consume = self._on_consume
+        delay = self._delay
+        timeout = self._timeout
+        
+        while not self._stop_requested:
+            success, item, done = queue_get(timeout=timeout)
+            
+            if done:
+                # Queue is shutdown and empty
+                break
+            if not success:
+                # It was just a timeout - continue loop
+                continue
+            
+            # Store item in destination
+            store(item)
+            self._items_consumed += 1
+            
+            # Call callback if provided
+            if on_consume:
+                on_consume(item)
+            
+            # Optional delay between items; returns early if stop() is called
+            if delay > 0 and wait_for_stop(timeout=delay):
+                break
+    
+    def _run_batched(self, store: Callable[[Any], None]) -> None:
+        """
+        Consumer loop for the unpaced case.
+        
+        Takes up to batch_size items per get_many() call.
+        
+        Args:
+            store: Callable that records one consumed item.
+        """
+        queue_get_many = self._queue.get_many
+        queue_drained = self._queue.drained
+        on_consume = self._on_consume
+        batch_size = self._batch_size
+        timeout = self._timeout
+        
+        while not self._stop_requested:
+            # Try to get a batch of items from queue with timeout
+            items = queue_get_many(batch_size, timeout=timeout)
+            
+            if not items:
+                # Check if queue is shutdown and empty
+                if queue_drained():
+                    break
+                # Otherwise, it was just a timeout - continue loop
+                continue
+            
+            # Store items in destination
+            for item in items:
+                store(item)
+            self._items_consumed += len(items)
+            
+            # Call callback if provided; checked once per batch
+            if on_consume:
+                for item in items:
+                    on_consume(item)
+    
     def stop(self) -> None:
         """
         Signal the consumer to stop.
         
-        This sets a stop event that will be checked in the main loop.
-        The consumer will finish processing the current item before stopping.
+        This sets a stop flag that is checked in the main loop and wakes
+        the thread if it is waiting out its delay.
+        The consumer finishes the item it is processing before stopping; in
+        batched mode that is the whole current batch (up to batch_size
+        items taken from the queue).
         """
+        self._stop_requested = True
         self._stop_event.set()
     
-    def get_results(self) -> List[Any]:
+    def view(self) -> List[Any]:
+        """
+        Return the destination itself, without copying.
+        
+        Only safe to read after join(); while the consumer is running the
+        returned list is still being appended to.
+        
+        Returns:
+            The destination container with consumed items.
+        """
+        return self._destination
+    
+    def snapshot(self) -> List[Any]:
         """
         Get a copy of the consumed items.
         
@@ -126,6 +221,18 @@ class Consumer(threading.Thread):
         """
         return list(self._destination)
     
+    def get_results(self) -> List[Any]:
+        """
+        Get a copy of the consumed items.
+        
+        Returns a copy, like snapshot(); use view() to avoid the O(N) copy
+        once the consumer has been joined.
+        
+        Returns:
+            A list containing all items consumed so far.
+        """
+        return self.snapshot()
+    
     def __repr__(self) -> str:
         return f"Consumer(name={self.name}, consumed={self._items_consumed})"
 
@@ -141,6 +248,11 @@ class DestinationContainer:
         """Initialize the thread-safe container."""
         self._items: List[Any] = []
         self._lock = threading.Lock()
+        # list.append is atomic under the GIL, so with the GIL enabled the
+        # list's own append is bound in place of the locking method below;
+        # free-threaded builds keep the lock
+        if getattr(sys, "_is_gil_enabled", lambda: True)():
+            self.append = self._items.append
     
     def append(self, item: Any) -> None:
         """
@@ -152,6 +264,16 @@ class DestinationContainer:
         with self._lock:
             self._items.append(item)
     
+    def extend(self, items: List[Any]) -> None:
+        """
+        Add several items to the container under one lock acquisition.
+        
+        Args:
+            items: The items to add, in order.
+        """
+        with self._lock:
+            self._items.extend(items)
+    
     def get_all(self) -> List[Any]:
         """
         Get a copy of all items in the container.
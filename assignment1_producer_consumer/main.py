@@ -5,11 +5,16 @@ This module demonstrates the producer-consumer pattern with thread
 synchronization using a blocking queue.
 """
 
+import asyncio
+import sys
 import time
 from typing import List
 from .blocking_queue import BlockingQueue
 from .producer import Producer, ItemGenerator
 from .consumer import Consumer, DestinationContainer
+from .async_blocking_queue import AsyncBlockingQueue, AsyncProducer, AsyncConsumer
+from .spsc_ring_queue import SPSCRingQueue
+from .work_stealing_queue import WorkStealingQueue
 
 
 def demo_basic_producer_consumer():
@@ -73,14 +78,17 @@ def demo_multiple_producers_consumers():
     Demonstrate multiple producers and consumers.
     
     Multiple producers add items to the queue and multiple consumers
-    process them concurrently.
+    process them concurrently. Each consumer works from its own deque of
+    a WorkStealingQueue and steals from the others when it runs dry.
     """
     print("\n" + "=" * 60)
     print("Demo 2: Multiple Producers and Consumers")
     print("=" * 60)
     
-    # Create shared blocking queue with capacity of 3
-    queue = BlockingQueue(capacity=3)
+    num_consumers = 3
+    
+    # Create shared work-stealing queue, one deque of capacity 3 per consumer
+    queue = WorkStealingQueue(num_workers=num_consumers, capacity=3)
     
     # Thread-safe destination container
     destination = DestinationContainer()
@@ -100,13 +108,13 @@ def demo_multiple_producers_consumers():
     # Create multiple consumers
     consumers = [
         Consumer(
-            queue=queue,
+            queue=queue.worker(i),
             destination=destination,
             name=f"Consumer-{i}",
             delay=0.02,
             on_consume=lambda item, name=f"Consumer-{i}": print(f"  [{name}] Consumed: {item}")
         )
-        for i in range(3)
+        for i in range(num_consumers)
     ]
     
     print(f"\nStarting {len(producers)} producers and {len(consumers)} consumers...")
@@ -150,8 +158,12 @@ def demo_with_item_generator():
     print("Demo 3: Using Item Generator")
     print("=" * 60)
     
-    # Create shared queue
-    queue = BlockingQueue(capacity=5)
+    # One producer and one consumer: the lock-free ring queue suffices.
+    # It relies on the GIL, so free-threaded builds use the locking queue.
+    if getattr(sys, "_is_gil_enabled", lambda: True)():
+        queue = SPSCRingQueue(capacity=5)
+    else:
+        queue = BlockingQueue(capacity=5)
     
     # Create an item generator that generates custom objects
     def generate_task(index: int) -> dict:
@@ -312,6 +324,47 @@ def demo_context_manager_and_stats():
     print(f"  - Times consumer blocked (queue empty): {stats['blocked_gets']}")
 
 
+def demo_async_producer_consumer():
+    """
+    Demonstrate the asyncio variant of the producer-consumer pattern.
+    
+    Producer and consumer run as coroutines on a single event loop
+    instead of OS threads.
+    """
+    print("\n" + "=" * 60)
+    print("Demo 6: Asyncio Producer-Consumer")
+    print("=" * 60)
+    
+    queue = AsyncBlockingQueue(capacity=3)
+    source = [f"Async-{i}" for i in range(8)]
+    destination: List[str] = []
+    
+    producer = AsyncProducer(
+        queue=queue,
+        source=source,
+        name="AsyncProducer",
+        on_produce=lambda item: print(f"  [AsyncProducer] Produced: {item}")
+    )
+    consumer = AsyncConsumer(
+        queue=queue,
+        destination=destination,
+        name="AsyncConsumer",
+        on_consume=lambda item: print(f"  [AsyncConsumer] Consumed: {item}")
+    )
+    
+    async def run():
+        consumer_task = asyncio.create_task(consumer.run())
+        await producer.run()
+        queue.shutdown()
+        await consumer_task
+    
+    asyncio.run(run())
+    
+    print(f"\nItems produced: {producer.items_produced}")
+    print(f"Items consumed: {consumer.items_consumed}")
+    print(f"All items transferred: {source == destination}")
+
+
 def main():
     """Run all demonstrations."""
     print("\n" + "=" * 60)
@@ -324,6 +377,7 @@ def main():
     demo_with_item_generator()
     demo_bounded_buffer()
     demo_context_manager_and_stats()
+    demo_async_producer_consumer()
     
     print("\n" + "=" * 60)
     print("  All demonstrations completed successfully!")
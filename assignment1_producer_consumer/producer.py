@@ -6,8 +6,8 @@ into a shared blocking queue for consumption by consumer threads.
 """
 
 import threading
-import time
-from typing import Any, Callable, Iterable, Optional
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, List, Optional
 from .blocking_queue import BlockingQueue
 
 
@@ -31,7 +31,8 @@ class Producer(threading.Thread):
         source: Iterable[Any],
         name: str = "Producer",
         delay: float = 0.0,
-        on_produce: Optional[Callable[[Any], None]] = None
+        on_produce: Optional[Callable[[Any], None]] = None,
+        batch_size: int = 32
     ):
         """
         Initialize the producer.
@@ -42,14 +43,21 @@ class Producer(threading.Thread):
             name: Name for the producer thread.
             delay: Optional delay between producing items (in seconds).
             on_produce: Optional callback called after each item is produced.
+            batch_size: Maximum number of items handed to the queue per
+                       put_many() call. Items are put one at a time when
+                       a delay is set.
         """
         super().__init__(name=name)
         self._queue = queue
         self._source = source
         self._delay = delay
         self._on_produce = on_produce
+        self._batch_size = batch_size
         self._items_produced = 0
         self._running = False
+        # Plain flag checked once per iteration; the Event is only used to
+        # cut a delay short
+        self._stop_requested = False
         self._stop_event = threading.Event()
     
     @property
@@ -72,38 +80,100 @@ class Producer(threading.Thread):
         self._running = True
         
         try:
-            for item in self._source:
-                # Check if we should stop
-                if self._stop_event.is_set():
-                    break
-                
-                # Try to put item in queue
-                success = self._queue.put(item)
-                
-                if not success:
-                    # Queue is shutdown or operation failed
-                    break
-                
-                self._items_produced += 1
-                
-                # Call callback if provided
-                if self._on_produce:
-                    self._on_produce(item)
-                
-                # Optional delay between items
-                if self._delay > 0:
-                    time.sleep(self._delay)
-                    
+            if self._delay <= 0 and self._batch_size > 1:
+                self._run_batched()
+            else:
+                self._run_single()
         finally:
             self._running = False
     
+    def _run_single(self) -> None:
+        """
+        Producer loop putting one item per queue operation.
+        
+        Attribute lookups that do not change during the run are bound to
+        locals up front.
+        """
+        queue_put = self._queue.put
+        wait_for_stop = self._stop_event.wait
+        on_produce = self._on_produce
+        delay = self._delay
+        
+        for item in self._source:
+            # Check if we should stop
+            if self._stop_requested:
+                break
+            
+            # Try to put item in queue
+            if not queue_put(item):
+                # Queue is shutdown or operation failed
+                break
+            
+            self._items_produced += 1
+            
+            # Call callback if provided
+            if on_produce:
+                on_produce(item)
+            
+            # Optional delay between items; returns early if stop() is called
+            if delay > 0 and wait_for_stop(timeout=delay):
+                break
+    
+    def _run_batched(self) -> None:
+        """
+        Producer loop for the unpaced case.
+        
+        Moves up to batch_size items per put_many() call so the queue lock
+        is taken once per batch rather than once per item.
+        """
+        queue_put_many = self._queue.put_many
+        on_produce = self._on_produce
+        batch_size = self._batch_size
+        
+        for batch in self._iter_batches(batch_size):
+            if self._stop_requested:
+                break
+            
+            added = queue_put_many(batch)
+            self._items_produced += added
+            
+            if on_produce:
+                for item in batch[:added]:
+                    on_produce(item)
+            
+            if added < len(batch):
+                # Queue is shutdown or operation failed
+                break
+    
+    def _iter_batches(self, batch_size: int) -> Iterator[List[Any]]:
+        """
+        Yield the source in lists of up to batch_size items.
+        
+        Uses the source's own iter_batches() when it provides one.
+        """
+        iter_batches = getattr(self._source, "iter_batches", None)
+        if iter_batches is not None:
+            yield from iter_batches(batch_size)
+            return
+        
+        items = iter(self._source)
+        while True:
+            batch = list(islice(items, batch_size))
+            if not batch:
+                return
+            yield batch
+    
     def stop(self) -> None:
         """
         Signal the producer to stop.
         
-        This sets a stop event that will be checked in the main loop.
-        The producer will finish processing the current item before stopping.
+        This sets a stop flag that is checked in the main loop and wakes
+        the thread if it is waiting out its delay.
+        The producer finishes the item it is processing before stopping; in
+        batched mode that is the whole current batch (up to batch_size
+        items handed to the queue).
         """
+        self._stop_requested = True
         self._stop_event.set()
     
     def __repr__(self) -> str:
@@ -134,10 +204,24 @@ class ItemGenerator:
         self._count = count
         self._generator_func = generator_func or (lambda i: f"Item-{i}")
     
-    def __iter__(self):
+    def __iter__(self) -> Iterator[Any]:
         """Iterate over generated items."""
-        for i in range(self._count):
-            yield self._generator_func(i)
+        return map(self._generator_func, range(self._count))
+    
+    def iter_batches(self, batch_size: int) -> Iterator[List[Any]]:
+        """
+        Iterate over generated items in lists of up to batch_size items.
+        
+        Args:
+            batch_size: Maximum number of items per list.
+        
+        Yields:
+            Lists of generated items, in order.
+        """
+        func = self._generator_func
+        count = self._count
+        for start in range(0, count, batch_size):
+            yield list(map(func, range(start, min(start + batch_size, count))))
     
     def __len__(self):
         """Return the number of items to generate."""
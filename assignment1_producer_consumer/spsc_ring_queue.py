@@ -0,0 +1,287 @@
+"""
+Single-Producer Single-Consumer Ring Queue
+
+A bounded queue specialised for exactly one producer thread and one
+consumer thread. Items live in a pre-allocated ring buffer; the producer
+only advances the tail index and the consumer only advances the head
+index, so the common (not full / not empty) path takes no lock. Threads
+block on a threading.Event only when the queue is full or empty.
+
+Relies on the GIL making single list stores and int attribute writes
+atomic; use BlockingQueue with several producers or consumers, or on a
+free-threaded build.
+"""
+
+import threading
+import time
+from typing import Any, List, Optional, Sequence, Tuple
+
+
+class SPSCRingQueue:
+    """
+    A lock-free bounded ring buffer for one producer and one consumer.
+    
+    Offers the same put/get contract as BlockingQueue, so it can be passed
+    to a single Producer and a single Consumer.
+    
+    Attributes:
+        capacity (int): Maximum number of items the queue can hold.
+    """
+    
+    def __init__(self, capacity: int = 10):
+        """
+        Initialize the ring queue.
+        
+        Args:
+            capacity: Maximum capacity of the queue. Default is 10.
+        
+        Raises:
+            ValueError: If capacity is less than 1.
+        """
+        if capacity < 1:
+            raise ValueError("Capacity must be at least 1")
+        
+        self._capacity = capacity
+        # One spare slot distinguishes a full ring from an empty one
+        self._slots = capacity + 1
+        self._buffer: List[Any] = [None] * self._slots
+        self._head = 0  # Next slot to read; written only by the consumer
+        self._tail = 0  # Next slot to write; written only by the producer
+        
+        # Slow-path signalling, used only when a side has to wait
+        self._not_full = threading.Event()
+        self._not_empty = threading.Event()
+        self._put_waiting = False
+        self._get_waiting = False
+        
+        # Flag to signal shutdown
+        self._shutdown = False
+        
+        # Statistics tracking; each counter has a single writer thread
+        self._total_blocked_puts = 0
+        self._total_blocked_gets = 0
+    
+    @property
+    def capacity(self) -> int:
+        """Return the maximum capacity of the queue."""
+        return self._capacity
+    
+    def put(self, item: Any, timeout: Optional[float] = None) -> bool:
+        """
+        Add an item to the queue, blocking if full.
+        
+        Must only be called from the single producer thread.
+        
+        Args:
+            item: The item to add to the queue.
+            timeout: Maximum time to wait in seconds. None means wait forever.
+        
+        Returns:
+            True if item was added successfully, False if timeout expired
+            or queue is shutdown.
+        """
+        if self._shutdown:
+            return False
+        
+        tail = self._tail
+        next_tail = tail + 1
+        if next_tail == self._slots:
+            next_tail = 0
+        
+        if next_tail == self._head:
+            # Full: announce we are waiting, then re-check so a get() that
+            # ran in between cannot be missed
+            blocked = False
+            while True:
+                self._not_full.clear()
+                self._put_waiting = True
+                if next_tail != self._head or self._shutdown:
+                    break
+                if not blocked:
+                    self._total_blocked_puts += 1
+                    blocked = True
+                if not self._not_full.wait(timeout=timeout):
+                    break
+            self._put_waiting = False
+            if next_tail == self._head or self._shutdown:
+                # Timeout expired or queue is shutdown
+                return False
+        
+        self._buffer[tail] = item
+        self._tail = next_tail
+        
+        if self._get_waiting:
+            self._not_empty.set()
+        return True
+    
+    def get(self, timeout: Optional[float] = None) -> Tuple[bool, Any]:
+        """
+        Remove and return an item from the queue, blocking if empty.
+        
+        Must only be called from the single consumer thread.
+        
+        Args:
+            timeout: Maximum time to wait in seconds. None means wait forever.
+        
+        Returns:
+            A tuple (success, item) where success is True if an item was
+            retrieved, False if timeout expired or queue is shutdown.
+            When success is False, item is None.
+        """
+        head = self._head
+        
+        if head == self._tail:
+            # Empty: announce we are waiting, then re-check so a put() that
+            # ran in between cannot be missed
+            blocked = False
+            while True:
+                self._not_empty.clear()
+                self._get_waiting = True
+                if head != self._tail or self._shutdown:
+                    break
+                if not blocked:
+                    self._total_blocked_gets += 1
+                    blocked = True
+                if not self._not_empty.wait(timeout=timeout):
+                    break
+            self._get_waiting = False
+            if head == self._tail:
+                # Timeout expired, or queue is shutdown and drained
+                return (False, None)
+        
+        item = self._buffer[head]
+        self._buffer[head] = None
+        next_head = head + 1
+        if next_head == self._slots:
+            next_head = 0
+        self._head = next_head
+        
+        if self._put_waiting:
+            self._not_full.set()
+        return (True, item)
+    
+    def get_with_status(self, timeout: Optional[float] = None) -> Tuple[bool, Any, bool]:
+        """
+        Like get(), but also reports whether the queue is finished.
+        
+        Returns:
+            A tuple (success, item, done) where done is True once the queue
+            is shutdown and empty.
+        """
+        success, item = self.get(timeout=timeout)
+        if success:
+            return (True, item, False)
+        return (False, None, self.drained())
+    
+    def put_many(self, items: Sequence[Any], timeout: Optional[float] = None) -> int:
+        """
+        Add several items to the queue, blocking while it is full.
+        
+        Must only be called from the single producer thread.
+        
+        Args:
+            items: The items to add to the queue.
+            timeout: Maximum time in seconds to wait in total while the
+                    queue is full. None means wait forever.
+        
+        Returns:
+            The number of items added. Less than len(items) if the timeout
+            expired or the queue was shutdown.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        added = 0
+        for item in items:
+            # Each put() gets only the time left, so the timeout is total
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            if not self.put(item, timeout=remaining):
+                break
+            added += 1
+        return added
+    
+    def get_many(self, max_items: int, timeout: Optional[float] = None) -> List[Any]:
+        """
+        Remove and return up to max_items items, blocking if empty.
+        
+        Waits only for the first item; the rest are taken if already queued.
+        
+        Returns:
+            A list of retrieved items in FIFO order, empty on timeout or
+            when the queue is shutdown and empty.
+        
+        Raises:
+            ValueError: If max_items is less than 1.
+        """
+        if max_items < 1:
+            raise ValueError("max_items must be at least 1")
+        
+        success, item = self.get(timeout=timeout)
+        if not success:
+            return []
+        
+        items = [item]
+        while len(items) < max_items and self._head != self._tail:
+            items.append(self.get()[1])
+        return items
+    
+    def size(self) -> int:
+        """Return the current number of items in the queue."""
+        return (self._tail - self._head) % self._slots
+    
+    def is_empty(self) -> bool:
+        """Check if the queue is empty."""
+        return self._head == self._tail
+    
+    def is_full(self) -> bool:
+        """Check if the queue is at capacity."""
+        return self.size() >= self._capacity
+    
+    def shutdown(self) -> None:
+        """
+        Shutdown the queue, releasing a blocked producer or consumer.
+        
+        After shutdown, put() returns False and get() returns remaining
+        items until the queue is empty.
+        """
+        self._shutdown = True
+        self._not_full.set()
+        self._not_empty.set()
+    
+    def is_shutdown(self) -> bool:
+        """Check if the queue has been shutdown."""
+        return self._shutdown
+    
+    def drained(self) -> bool:
+        """Check if the queue is shutdown and empty."""
+        return self._shutdown and self._head == self._tail
+    
+    def __enter__(self) -> 'SPSCRingQueue':
+        """Context manager entry - returns the queue instance."""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit - automatically shuts down the queue."""
+        self.shutdown()
+    
+    def __len__(self) -> int:
+        """Return the current size of the queue."""
+        return self.size()
+    
+    def __repr__(self) -> str:
+        """Return string representation of the queue."""
+        return f"SPSCRingQueue(capacity={self._capacity}, size={self.size()}, shutdown={self._shutdown})"
+    
+    def get_statistics(self) -> dict:
+        """
+        Get queue statistics.
+        
+        Returns:
+            Dictionary containing queue statistics:
+            - blocked_puts: Times put() had to wait
+            - blocked_gets: Times get() had to wait
+        """
+        return {
+            "blocked_puts": self._total_blocked_puts,
+            "blocked_gets": self._total_blocked_gets,
+            "current_size": self.size(),
+            "capacity": self._capacity
+        }
@@ -0,0 +1,29 @@
+"""
+GIL-aware helpers for concurrency tests.
+
+A free-threaded build runs the same tests in a different concurrency
+regime, so tests that measure or depend on it can be tagged to run on
+one build only, and thread counts can follow the build.
+"""
+
+import sys
+import unittest
+
+# Builds before 3.13 have no sys._is_gil_enabled and always have a GIL
+GIL_ENABLED = getattr(sys, "_is_gil_enabled", lambda: True)()
+
+# Only run the decorated test with the GIL enabled
+gil_only = unittest.skipUnless(GIL_ENABLED, "requires the GIL")
+
+# Only run the decorated test on a free-threaded build with the GIL disabled
+nogil_only = unittest.skipIf(GIL_ENABLED, "requires a free-threaded build")
+
+
+def nthreads() -> int:
+    """
+    Return the worker count for the running build.
+    
+    With the GIL extra threads only add switching overhead, so 4 is used;
+    without it 16 threads can actually run in parallel.
+    """
+    return 4 if GIL_ENABLED else 16
@@ -0,0 +1,61 @@
+"""
+Producer/consumer lifecycle helpers for tests.
+
+Starts and tears down a set of Producer and Consumer threads in the
+canonical order, so every test shuts the queue down and joins its
+threads even when an assertion fails part way through.
+"""
+
+from contextlib import contextmanager
+from typing import Iterator, Sequence
+
+
+@contextmanager
+def pipeline(queue, producers: Sequence, consumers: Sequence) -> Iterator[None]:
+    """
+    Run producers and consumers for the duration of a with block.
+    
+    Consumers are started before producers. On exit the producers are
+    joined, the queue is shut down and the consumers are joined. If the
+    block raises, the producers are stopped and the queue is shut down
+    first so no thread is left waiting.
+    
+    Args:
+        queue: The queue shared by the producers and consumers.
+        producers: Producer threads, not yet started.
+        consumers: Consumer threads, not yet started.
+    """
+    for consumer in consumers:
+        consumer.start()
+    for producer in producers:
+        producer.start()
+    
+    try:
+        yield
+    except BaseException:
+        for producer in producers:
+            producer.stop()
+        queue.shutdown()
+        raise
+    finally:
+        for producer in producers:
+            producer.join()
+        queue.shutdown()
+        for consumer in consumers:
+            consumer.join()
+
+
+def run_pipeline(queue, producers: Sequence, consumers: Sequence) -> None:
+    """
+    Run producers and consumers to completion.
+    
+    Starts the threads and tears them down as pipeline() does, for tests
+    that have nothing to do while the threads run.
+    
+    Args:
+        queue: The queue shared by the producers and consumers.
+        producers: Producer threads, not yet started.
+        consumers: Consumer threads, not yet started.
+    """
+    with pipeline(queue, producers, consumers):
+        pass
@@ -0,0 +1,29 @@
+"""
+Synchronization helpers for tests.
+
+Lets tests wait for a condition on another thread instead of sleeping
+for a fixed time.
+"""
+
+import time
+from typing import Callable
+
+
+def wait_until(predicate: Callable[[], bool], timeout: float = 2.0, poll: float = 0.001) -> bool:
+    """
+    Poll predicate until it returns True or timeout expires.
+    
+    Args:
+        predicate: Zero-argument callable checked every poll seconds.
+        timeout: Maximum time to wait in seconds.
+        poll: Interval between checks in seconds.
+    
+    Returns:
+        True if the predicate became true, False if timeout expired.
+    """
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(poll)
+    return True
@@ -0,0 +1,110 @@
+"""
+Wait-time sampling for concurrency tests.
+
+When the REPORT_WAIT_FRACTION environment variable names a file, the
+instrumented tests sample the current frame of each pipeline thread about
+once per millisecond and append one JSON line per test recording the
+fraction of samples in which a thread was parked in a threading
+Condition/Event wait. This is time spent blocked on the queue, not GIL
+contention. Without the variable the helper does nothing.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterable, Iterator, Set
+
+
+class PipelineThreads:
+    """
+    The threads a wait_fraction_report samples.
+    
+    Thread objects passed in are sampled while they run. Work submitted to
+    a shared pool is sampled only while it runs inside run(), so idle pool
+    threads are never counted.
+    """
+    
+    def __init__(self, threads: Iterable[threading.Thread] = ()):
+        """
+        Initialize the thread set.
+        
+        Args:
+            threads: Pipeline threads to sample once they are started.
+        """
+        self._threads = list(threads)
+        self._running: Set[int] = set()
+    
+    def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Call fn(*args), sampling the calling thread while it runs."""
+        ident = threading.get_ident()
+        self._running.add(ident)
+        try:
+            return fn(*args)
+        finally:
+            self._running.discard(ident)
+    
+    def idents(self) -> Set[int]:
+        """Return the idents of the pipeline threads running right now."""
+        idents = set(self._running)
+        idents.update(thread.ident for thread in self._threads if thread.ident is not None)
+        return idents
+
+
+@contextmanager
+def wait_fraction_report(
+    name: str,
+    threads: Iterable[threading.Thread] = (),
+    interval: float = 0.001
+) -> Iterator[PipelineThreads]:
+    """
+    Sample the pipeline threads for the duration of a with block.
+    
+    Only the given threads, and pool work wrapped with the yielded
+    PipelineThreads.run(), are sampled; the test thread, the sampler and
+    idle pool threads are not.
+    
+    Args:
+        name: Label for the JSON record, usually the test id.
+        threads: Pipeline threads to sample once they are started.
+        interval: Sampling period in seconds.
+    """
+    pipeline_threads = PipelineThreads(threads)
+    path = os.environ.get("REPORT_WAIT_FRACTION")
+    if not path:
+        yield pipeline_threads
+        return
+    
+    stop = threading.Event()
+    counts = {"samples": 0, "waiting": 0}
+    
+    def sample():
+        while not stop.wait(interval):
+            idents = pipeline_threads.idents()
+            for ident, frame in sys._current_frames().items():
+                if ident not in idents:
+                    continue
+                counts["samples"] += 1
+                code = frame.f_code
+                if code.co_name == "wait" and code.co_filename == threading.__file__:
+                    counts["waiting"] += 1
+    
+    sampler = threading.Thread(target=sample, name="wait-fraction-sampler", daemon=True)
+    start_time = time.perf_counter()
+    sampler.start()
+    try:
+        yield pipeline_threads
+    finally:
+        stop.set()
+        sampler.join()
+        record = {
+            "test": name,
+            "seconds": round(time.perf_counter() - start_time, 6),
+            "samples": counts["samples"],
+            "waiting": counts["waiting"],
+            "wait_fraction": counts["waiting"] / counts["samples"] if counts["samples"] else 0.0,
+        }
+        with open(path, "a") as f:
+            f.write(json.dumps(record) + "\n")
@@ -0,0 +1,183 @@
+"""
+Unit tests for the asyncio producer-consumer implementation.
+
+Tests AsyncBlockingQueue suspension, timeouts, shutdown, and the
+AsyncProducer/AsyncConsumer coroutines.
+"""
+
+import asyncio
+import unittest
+from operator import itemgetter
+from unittest import mock
+from ..async_blocking_queue import AsyncBlockingQueue, AsyncProducer, AsyncConsumer
+
+
+class TestAsyncBlockingQueue(unittest.IsolatedAsyncioTestCase):
+    """Test AsyncBlockingQueue operations."""
+    
+    def test_init_invalid_capacity(self):
+        """Test that invalid capacity raises ValueError."""
+        with self.assertRaises(ValueError):
+            AsyncBlockingQueue(capacity=0)
+    
+    async def test_put_and_get_fifo(self):
+        """Test FIFO order with multiple items."""
+        queue = AsyncBlockingQueue(capacity=5)
+        for item in ["a", "b", "c"]:
+            self.assertTrue(await queue.put(item))
+        
+        self.assertEqual(queue.size(), 3)
+        results = [await queue.get() for _ in range(3)]
+        self.assertListEqual(results, [(True, "a"), (True, "b"), (True, "c")])
+        self.assertTrue(queue.is_empty())
+    
+    async def test_get_timeout_on_empty_queue(self):
+        """Test that get times out on empty queue."""
+        queue = AsyncBlockingQueue(capacity=5)
+        self.assertEqual(await queue.get(timeout=0.05), (False, None))
+    
+    async def test_put_timeout_on_full_queue(self):
+        """Test that put times out on full queue."""
+        queue = AsyncBlockingQueue(capacity=1)
+        await queue.put("item1")
+        self.assertFalse(await queue.put("item2", timeout=0.05))
+        self.assertEqual(queue.size(), 1)
+    
+    async def test_put_suspends_then_succeeds(self):
+        """Test that put suspends when full and succeeds after get."""
+        queue = AsyncBlockingQueue(capacity=1)
+        await queue.put("item1")
+        
+        put_task = asyncio.create_task(queue.put("item2", timeout=1.0))
+        await asyncio.sleep(0)
+        self.assertFalse(put_task.done())
+        
+        self.assertEqual(await queue.get(), (True, "item1"))
+        self.assertTrue(await put_task)
+        self.assertEqual(await queue.get(), (True, "item2"))
+    
+    async def test_shutdown_releases_waiting_get(self):
+        """Test that shutdown releases coroutines waiting on get."""
+        queue = AsyncBlockingQueue(capacity=5)
+        
+        get_task = asyncio.create_task(queue.get(timeout=5.0))
+        await asyncio.sleep(0)
+        queue.shutdown()
+        
+        self.assertEqual(await get_task, (False, None))
+    
+    async def test_shutdown_releases_waiting_put(self):
+        """Test that shutdown releases coroutines waiting on put."""
+        queue = AsyncBlockingQueue(capacity=1)
+        await queue.put("item")
+        
+        put_task = asyncio.create_task(queue.put("item2", timeout=5.0))
+        await asyncio.sleep(0)
+        queue.shutdown()
+        
+        self.assertFalse(await put_task)
+    
+    async def test_get_timeout_is_total(self):
+        """Test that a get woken for items it keeps losing still times out on time."""
+        queue = AsyncBlockingQueue(capacity=5)
+        get_task = asyncio.create_task(queue.get(timeout=0.2))
+        
+        async def steal():
+            # Each put wakes the waiting get; the item is gone before it runs
+            while not get_task.done():
+                await queue.put("item")
+                await queue.get()
+                await asyncio.sleep(0.01)
+        
+        thief = asyncio.create_task(steal())
+        self.assertEqual(await asyncio.wait_for(get_task, 2.0), (False, None))
+        await thief
+    
+    async def test_put_wakes_one_waiting_get(self):
+        """Test that one item wakes one waiting get rather than all of them."""
+        queue = AsyncBlockingQueue(capacity=5)
+        with mock.patch.object(queue, "_wait", wraps=queue._wait) as wait:
+            get_tasks = [asyncio.create_task(queue.get(timeout=5.0)) for _ in range(3)]
+            await asyncio.sleep(0)
+            self.assertEqual(wait.call_count, 3)
+            
+            await queue.put("item")
+            await asyncio.sleep(0.05)
+            # A woken get that lost the item would have waited a second time
+            self.assertEqual(wait.call_count, 3)
+            self.assertEqual(sum(task.done() for task in get_tasks), 1)
+            
+            queue.shutdown()
+            results = await asyncio.gather(*get_tasks)
+        self.assertEqual(sorted(results, key=itemgetter(0)),
+                         [(False, None), (False, None), (True, "item")])
+    
+    async def test_operations_after_shutdown(self):
+        """Test that remaining items can be drained after shutdown."""
+        queue = AsyncBlockingQueue(capacity=5)
+        await queue.put("item")
+        queue.shutdown()
+        
+        self.assertFalse(await queue.put("new_item"))
+        self.assertEqual(await queue.get(), (True, "item"))
+        self.assertEqual(await queue.get(timeout=0.05), (False, None))
+
+
+class TestAsyncProducerConsumer(unittest.IsolatedAsyncioTestCase):
+    """Test AsyncProducer and AsyncConsumer together."""
+    
+    async def test_single_producer_single_consumer(self):
+        """Test basic producer-consumer scenario preserves order."""
+        queue = AsyncBlockingQueue(capacity=3)
+        source = list(range(20))
+        destination = []
+        
+        producer = AsyncProducer(queue=queue, source=source)
+        consumer = AsyncConsumer(queue=queue, destination=destination)
+        
+        consumer_task = asyncio.create_task(consumer.run())
+        await producer.run()
+        queue.shutdown()
+        await consumer_task
+        
+        self.assertEqual(producer.items_produced, 20)
+        self.assertEqual(consumer.items_consumed, 20)
+        self.assertEqual(destination, source)
+    
+    async def test_multiple_producers_multiple_consumers(self):
+        """Test that all items are transferred exactly once."""
+        queue = AsyncBlockingQueue(capacity=2)
+        producers = [
+            AsyncProducer(queue=queue, source=[f"P{i}-{j}" for j in range(10)])
+            for i in range(3)
+        ]
+        consumers = [AsyncConsumer(queue=queue) for _ in range(2)]
+        
+        consumer_tasks = [asyncio.create_task(c.run()) for c in consumers]
+        await asyncio.gather(*(p.run() for p in producers))
+        queue.shutdown()
+        await asyncio.gather(*consumer_tasks)
+        
+        consumed = [item for c in consumers for item in c.destination]
+        self.assertEqual(len(consumed), 30)
+        self.assertEqual(len(set(consumed)), 30)
+    
+    async def test_callbacks(self):
+        """Test on_produce and on_consume callbacks."""
+        queue = AsyncBlockingQueue(capacity=5)
+        produced, consumed = [], []
+        
+        producer = AsyncProducer(queue=queue, source=["x", "y"], on_produce=produced.append)
+        consumer = AsyncConsumer(queue=queue, on_consume=consumed.append)
+        
+        consumer_task = asyncio.create_task(consumer.run())
+        await producer.run()
+        queue.shutdown()
+        await consumer_task
+        
+        self.assertEqual(produced, ["x", "y"])
+        self.assertEqual(consumed, ["x", "y"])
+
+
+if __name__ == '__main__':
+    unittest.main()
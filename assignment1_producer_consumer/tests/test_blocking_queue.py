@@ -4,13 +4,31 @@ Unit tests for BlockingQueue implementation.
 Tests thread synchronization, blocking behavior, and wait/notify mechanism.
 """
 
+import queue as stdlib_queue
 import unittest
 import threading
 import time
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-from assignment1_producer_consumer.blocking_queue import BlockingQueue
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from ..blocking_queue import BlockingQueue
+from ._wait_fraction import wait_fraction_report
+from ._gil import nthreads
+from ._sync import wait_until
+
+
+# Worker threads shared by every test in the module
+_pool = None
+
+
+def setUpModule():
+    """Start the thread pool shared by this module's tests."""
+    global _pool
+    _pool = ThreadPoolExecutor(max_workers=32)
+
+
+def tearDownModule():
+    """Shut down the shared thread pool."""
+    _pool.shutdown(wait=True)
 
 
 class TestBlockingQueueBasic(unittest.TestCase):
@@ -30,10 +48,10 @@ class TestBlockingQueueBasic(unittest.TestCase):
     
     def test_init_invalid_capacity(self):
         """Test that invalid capacity raises ValueError."""
-        with self.assertRaises(ValueError):
-            BlockingQueue(capacity=0)
-        with self.assertRaises(ValueError):
-            BlockingQueue(capacity=-1)
+        for capacity in (0, -1, -1000):
+            with self.subTest(capacity=capacity):
+                with self.assertRaises(ValueError):
+                    BlockingQueue(capacity=capacity)
     
     def test_put_and_get_single_item(self):
         """Test putting and getting a single item."""
@@ -58,10 +76,8 @@ class TestBlockingQueueBasic(unittest.TestCase):
         
         self.assertEqual(queue.size(), 4)
         
-        for expected in items:
-            success, item = queue.get()
-            self.assertTrue(success)
-            self.assertEqual(item, expected)
+        results = [queue.get() for _ in items]
+        self.assertListEqual(results, [(True, item) for item in items])
     
     def test_is_empty_and_is_full(self):
         """Test is_empty and is_full properties."""
@@ -98,9 +114,9 @@ class TestBlockingQueueBlocking(unittest.TestCase):
         """Test that get times out on empty queue."""
         queue = BlockingQueue(capacity=5)
         
-        start_time = time.time()
+        start_time = time.perf_counter()
         success, item = queue.get(timeout=0.1)
-        elapsed = time.time() - start_time
+        elapsed = time.perf_counter() - start_time
         
         self.assertFalse(success)
         self.assertIsNone(item)
@@ -112,9 +128,9 @@ class TestBlockingQueueBlocking(unittest.TestCase):
         queue = BlockingQueue(capacity=1)
         queue.put("item1")
         
-        start_time = time.time()
+        start_time = time.perf_counter()
         success = queue.put("item2", timeout=0.1)
-        elapsed = time.time() - start_time
+        elapsed = time.perf_counter() - start_time
         
         self.assertFalse(success)
         self.assertGreaterEqual(elapsed, 0.1)
@@ -128,20 +144,18 @@ class TestBlockingQueueBlocking(unittest.TestCase):
         result = {"success": False}
         
         def delayed_get():
-            time.sleep(0.1)
+            # Only get once the putter is blocked on the full queue
+            wait_until(lambda: queue.get_statistics()["blocked_puts"] >= 1)
             queue.get()
         
         def producer():
             result["success"] = queue.put("item2", timeout=1.0)
         
-        getter = threading.Thread(target=delayed_get)
-        putter = threading.Thread(target=producer)
-        
-        putter.start()
-        getter.start()
+        putter = _pool.submit(producer)
+        getter = _pool.submit(delayed_get)
         
-        getter.join()
-        putter.join()
+        getter.result()
+        putter.result()
         
         self.assertTrue(result["success"])
     
@@ -152,20 +166,18 @@ class TestBlockingQueueBlocking(unittest.TestCase):
         result = {"item": None, "success": False}
         
         def delayed_put():
-            time.sleep(0.1)
+            # Only put once the getter is blocked on the empty queue
+            wait_until(lambda: queue.get_statistics()["blocked_gets"] >= 1)
             queue.put("delayed_item")
         
         def consumer():
             result["success"], result["item"] = queue.get(timeout=1.0)
         
-        putter = threading.Thread(target=delayed_put)
-        getter = threading.Thread(target=consumer)
+        getter = _pool.submit(consumer)
+        putter = _pool.submit(delayed_put)
         
-        getter.start()
-        putter.start()
-        
-        putter.join()
-        getter.join()
+        putter.result()
+        getter.result()
         
         self.assertTrue(result["success"])
         self.assertEqual(result["item"], "delayed_item")
@@ -184,13 +196,13 @@ class TestBlockingQueueShutdown(unittest.TestCase):
             success, _ = queue.get(timeout=5.0)  # Long timeout
             result["completed"] = True
         
-        consumer = threading.Thread(target=waiting_consumer)
-        consumer.start()
+        consumer = _pool.submit(waiting_consumer)
         
-        time.sleep(0.1)  # Let consumer start waiting
+        # Let consumer start waiting
+        wait_until(lambda: queue.get_statistics()["blocked_gets"] >= 1)
         queue.shutdown()
         
-        consumer.join(timeout=1.0)
+        consumer.result(timeout=1.0)
         self.assertTrue(result["completed"])
         self.assertTrue(queue.is_shutdown())
     
@@ -205,13 +217,12 @@ class TestBlockingQueueShutdown(unittest.TestCase):
             success = queue.put("item2", timeout=5.0)
             result["completed"] = True
         
-        producer = threading.Thread(target=waiting_producer)
-        producer.start()
+        producer = _pool.submit(waiting_producer)
         
-        time.sleep(0.1)
+        wait_until(lambda: queue.get_statistics()["blocked_puts"] >= 1)
         queue.shutdown()
         
-        producer.join(timeout=1.0)
+        producer.result(timeout=1.0)
         self.assertTrue(result["completed"])
     
     def test_operations_after_shutdown(self):
@@ -230,55 +241,316 @@ class TestBlockingQueueShutdown(unittest.TestCase):
         # Now queue is empty and shutdown
         success, item = queue.get(timeout=0.1)
         self.assertFalse(success)
+    
+    def test_drained(self):
+        """Test that drained is True only once shutdown and empty."""
+        queue = BlockingQueue(capacity=5)
+        queue.put("item")
+        self.assertFalse(queue.drained())
+        
+        queue.shutdown()
+        self.assertFalse(queue.drained())
+        
+        queue.get()
+        self.assertTrue(queue.drained())
+
+
+class TestBlockingQueueGetWithStatus(unittest.TestCase):
+    """Test get_with_status termination reporting."""
+    
+    def test_success(self):
+        """Test that an available item is returned with done=False."""
+        queue = BlockingQueue(capacity=5)
+        queue.put("item")
+        self.assertEqual(queue.get_with_status(), (True, "item", False))
+    
+    def test_timeout_not_done(self):
+        """Test that a timeout on a live queue reports done=False."""
+        queue = BlockingQueue(capacity=5)
+        self.assertEqual(queue.get_with_status(timeout=0.05), (False, None, False))
+    
+    def test_shutdown_drains_then_done(self):
+        """Test that remaining items are drained before done=True."""
+        queue = BlockingQueue(capacity=5)
+        queue.put("item")
+        queue.shutdown()
+        
+        self.assertEqual(queue.get_with_status(), (True, "item", False))
+        self.assertEqual(queue.get_with_status(timeout=0.05), (False, None, True))
 
 
 class TestBlockingQueueThreadSafety(unittest.TestCase):
     """Test thread safety with concurrent access."""
     
-    def test_concurrent_put_and_get(self):
-        """Test concurrent producers and consumers."""
+    def _run_concurrent_put_and_get(self, num_threads):
+        """Move items through a queue with num_threads producers and consumers."""
         queue = BlockingQueue(capacity=10)
-        num_items = 100
+        items_per_producer = 48
+        num_items = items_per_producer * num_threads
         produced = []
         consumed = []
         lock = threading.Lock()
         
-        def producer():
-            for i in range(num_items // 2):
-                item = f"item-{threading.current_thread().name}-{i}"
+        # Build every item up front so the threads only move them
+        sources = [
+            [f"item-P{producer_id}-{i}" for i in range(items_per_producer)]
+            for producer_id in range(num_threads)
+        ]
+        
+        def producer(source):
+            for item in source:
                 queue.put(item)
                 with lock:
                     produced.append(item)
         
         def consumer():
             while True:
-                success, item = queue.get(timeout=0.5)
-                if not success:
+                # Only an empty chunk after shutdown ends the loop
+                chunk = queue.get_many(32)
+                if not chunk:
                     break
                 with lock:
-                    consumed.append(item)
+                    consumed.extend(chunk)
+        
+        with wait_fraction_report(f"{self.id()}[{num_threads}]") as sampled:
+            consumers = [_pool.submit(sampled.run, consumer) for _ in range(num_threads)]
+            producers = [_pool.submit(sampled.run, producer, source) for source in sources]
+            
+            try:
+                for p in producers:
+                    p.result()
+            finally:
+                # Shutdown is the poison pill: every consumer drains what is
+                # left and then gets an empty chunk. It runs even if a
+                # producer failed, so no consumer is left blocked in get_many
+                queue.shutdown()
+            
+            for c in consumers:
+                c.result(timeout=5.0)
+        
+        self.assertEqual(len(produced), num_items)
+        self.assertEqual(len(consumed), num_items)
+        self.assertEqual(set(produced), set(consumed))
+    
+    def test_concurrent_put_and_get(self):
+        """Test concurrent producers and consumers sized for this build."""
+        self._run_concurrent_put_and_get(nthreads())
+    
+    def test_concurrent_put_and_get_thread_counts(self):
+        """Test 1, 4 and 16 producers and consumers each."""
+        for num_threads in (1, 4, 16):
+            with self.subTest(num_threads=num_threads):
+                self._run_concurrent_put_and_get(num_threads)
+
+
+class TestBlockingQueueBatch(unittest.TestCase):
+    """Test batched put_many/get_many operations."""
+    
+    def test_put_many_and_get_many(self):
+        """Test batched put and get preserve FIFO order."""
+        queue = BlockingQueue(capacity=5)
+        
+        self.assertEqual(queue.put_many(["a", "b", "c"]), 3)
+        self.assertEqual(queue.get_many(2), ["a", "b"])
+        self.assertEqual(queue.get_many(10), ["c"])
+        self.assertTrue(queue.is_empty())
+    
+    def test_get_many_invalid_max_items(self):
+        """Test that get_many rejects max_items below 1."""
+        queue = BlockingQueue(capacity=5)
+        with self.assertRaises(ValueError):
+            queue.get_many(0)
+    
+    def test_get_many_timeout_on_empty_queue(self):
+        """Test that get_many returns an empty list on timeout."""
+        queue = BlockingQueue(capacity=5)
+        self.assertEqual(queue.get_many(3, timeout=0.05), [])
+    
+    def test_put_many_timeout_returns_partial_count(self):
+        """Test that put_many reports how many items fit before timeout."""
+        queue = BlockingQueue(capacity=2)
+        
+        self.assertEqual(queue.put_many([1, 2, 3, 4], timeout=0.05), 2)
+        self.assertEqual(queue.get_many(5), [1, 2])
+    
+    def test_put_many_blocks_until_space(self):
+        """Test that put_many waits for consumers to free space."""
+        queue = BlockingQueue(capacity=2)
+        consumed = []
         
-        producers = [threading.Thread(target=producer, name=f"P{i}") for i in range(2)]
-        consumers = [threading.Thread(target=consumer, name=f"C{i}") for i in range(2)]
+        def consumer():
+            while len(consumed) < 6:
+                consumed.extend(queue.get_many(6, timeout=1.0))
         
-        for c in consumers:
-            c.start()
-        for p in producers:
-            p.start()
+        getter = _pool.submit(consumer)
+        added = queue.put_many(list(range(6)), timeout=1.0)
+        getter.result()
         
-        for p in producers:
-            p.join()
+        self.assertEqual(added, 6)
+        self.assertEqual(consumed, list(range(6)))
+    
+    def test_put_many_timeout_is_total(self):
+        """Test that put_many's timeout bounds the whole call, not each wait."""
+        queue = BlockingQueue(capacity=1)
+        stop = threading.Event()
         
-        # Wait for queue to drain
-        time.sleep(0.6)
+        def slow_consumer():
+            while not stop.wait(0.02):
+                queue.get(timeout=0.01)
+        
+        getter = _pool.submit(slow_consumer)
+        start = time.monotonic()
+        added = queue.put_many(list(range(1000)), timeout=0.2)
+        elapsed = time.monotonic() - start
+        stop.set()
+        getter.result()
+        
+        self.assertLess(added, 1000)
+        self.assertLess(elapsed, 1.0)
+    
+    def test_put_many_after_shutdown(self):
+        """Test that put_many adds nothing after shutdown."""
+        queue = BlockingQueue(capacity=5)
         queue.shutdown()
+        self.assertEqual(queue.put_many(["a", "b"]), 0)
+        self.assertEqual(queue.get_many(5), [])
+
+
+class TestBlockingQueueStatistics(unittest.TestCase):
+    """Test statistics tracking."""
+    
+    def test_added_and_removed_counts(self):
+        """Test that added/removed counts track put and get."""
+        queue = BlockingQueue(capacity=5)
+        for item in ["a", "b", "c"]:
+            queue.put(item)
+        queue.get()
         
-        for c in consumers:
-            c.join()
+        stats = queue.get_statistics()
+        self.assertEqual(stats["total_items_added"], 3)
+        self.assertEqual(stats["total_items_removed"], 1)
+        self.assertEqual(stats["current_size"], 2)
+    
+    def test_cleared_items_not_counted_as_removed(self):
+        """Test that clear() does not count discarded items as removed."""
+        queue = BlockingQueue(capacity=5)
+        for item in ["a", "b", "c"]:
+            queue.put(item)
+        queue.get()
+        queue.clear()
+        queue.put("d")
+        queue.get()
         
-        self.assertEqual(len(produced), num_items)
-        self.assertEqual(len(consumed), num_items)
-        self.assertEqual(set(produced), set(consumed))
+        stats = queue.get_statistics()
+        self.assertEqual(stats["total_items_added"], 4)
+        self.assertEqual(stats["total_items_removed"], 2)
+        self.assertEqual(stats["current_size"], 0)
+
+
+class _SimpleQueueAdaptor:
+    """
+    queue.SimpleQueue behind the BlockingQueue put/get/shutdown contract.
+    
+    SimpleQueue is unbounded, so only capacity-independent behavior can be
+    compared against it.
+    """
+    
+    _SHUTDOWN = object()
+    
+    def __init__(self, capacity: int = 10):
+        self._queue = stdlib_queue.SimpleQueue()
+        self._shutdown = False
+    
+    def put(self, item, timeout=None):
+        if self._shutdown:
+            return False
+        self._queue.put(item)
+        return True
+    
+    def get(self, timeout=None):
+        try:
+            item = self._queue.get(timeout=timeout)
+        except stdlib_queue.Empty:
+            return (False, None)
+        if item is self._SHUTDOWN:
+            # Leave the marker in place for other waiting getters
+            self._queue.put(item)
+            return (False, None)
+        return (True, item)
+    
+    def shutdown(self):
+        self._shutdown = True
+        self._queue.put(self._SHUTDOWN)
+    
+    def size(self):
+        return self._queue.qsize() - (1 if self._shutdown else 0)
+
+
+class TestQueueContract(unittest.TestCase):
+    """Test capacity-independent behavior against queue.SimpleQueue."""
+    
+    IMPLEMENTATIONS = [("custom", BlockingQueue), ("stdlib", _SimpleQueueAdaptor)]
+    
+    def test_fifo_order(self):
+        """Test FIFO order with multiple items."""
+        for name, factory in self.IMPLEMENTATIONS:
+            with self.subTest(impl=name):
+                queue = factory(capacity=10)
+                for item in range(5):
+                    queue.put(item)
+                
+                self.assertEqual(queue.size(), 5)
+                self.assertEqual([queue.get()[1] for _ in range(5)], list(range(5)))
+    
+    def test_get_timeout_on_empty_queue(self):
+        """Test that get reports failure on timeout."""
+        for name, factory in self.IMPLEMENTATIONS:
+            with self.subTest(impl=name):
+                queue = factory(capacity=10)
+                self.assertEqual(queue.get(timeout=0.01), (False, None))
+    
+    def test_shutdown_drains_then_fails(self):
+        """Test that remaining items are returned after shutdown."""
+        for name, factory in self.IMPLEMENTATIONS:
+            with self.subTest(impl=name):
+                queue = factory(capacity=10)
+                queue.put("item")
+                queue.shutdown()
+                
+                self.assertFalse(queue.put("late"))
+                self.assertEqual(queue.get(), (True, "item"))
+                self.assertEqual(queue.get(), (False, None))
+    
+    def test_concurrent_exactly_once(self):
+        """Test that concurrent producers and consumers move every item once."""
+        for name, factory in self.IMPLEMENTATIONS:
+            with self.subTest(impl=name):
+                queue = factory(capacity=10)
+                items = list(range(1000))
+                consumed = []
+                lock = threading.Lock()
+                
+                def producer(part):
+                    for item in part:
+                        queue.put(item)
+                
+                def consumer():
+                    while True:
+                        success, item = queue.get()
+                        if not success:
+                            break
+                        with lock:
+                            consumed.append(item)
+                
+                consumers = [_pool.submit(consumer) for _ in range(2)]
+                producers = [_pool.submit(producer, items[i::2]) for i in range(2)]
+                for p in producers:
+                    p.result()
+                queue.shutdown()
+                for c in consumers:
+                    c.result(timeout=5.0)
+                
+                self.assertEqual(Counter(consumed), Counter(items))
 
 
 if __name__ == '__main__':
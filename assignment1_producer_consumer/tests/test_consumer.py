@@ -5,13 +5,27 @@ Tests consumer functionality, thread behavior, and destination handling.
 """
 
 import unittest
-import threading
 import time
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-from assignment1_producer_consumer.blocking_queue import BlockingQueue
-from assignment1_producer_consumer.consumer import Consumer, DestinationContainer
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from ..blocking_queue import BlockingQueue
+from ..consumer import Consumer, DestinationContainer
+from ._sync import wait_until
+
+
+# Worker threads shared by every test in the module
+_pool = None
+
+
+def setUpModule():
+    """Start the thread pool shared by this module's tests."""
+    global _pool
+    _pool = ThreadPoolExecutor(max_workers=16)
+
+
+def tearDownModule():
+    """Shut down the shared thread pool."""
+    _pool.shutdown(wait=True)
 
 
 class TestConsumerBasic(unittest.TestCase):
@@ -29,7 +43,7 @@ class TestConsumerBasic(unittest.TestCase):
         consumer = Consumer(queue=queue, destination=destination, timeout=0.1)
         consumer.start()
         
-        time.sleep(0.3)  # Allow consumer to process
+        wait_until(lambda: consumer.items_consumed >= 3)  # Allow consumer to process
         queue.shutdown()
         consumer.join()
         
@@ -44,7 +58,7 @@ class TestConsumerBasic(unittest.TestCase):
         consumer = Consumer(queue=queue, timeout=0.1)
         consumer.start()
         
-        time.sleep(0.2)
+        wait_until(lambda: consumer.items_consumed >= 1)
         queue.shutdown()
         consumer.join()
         
@@ -60,16 +74,17 @@ class TestConsumerBasic(unittest.TestCase):
         
         consumer = Consumer(
             queue=queue,
-            on_consume=lambda item: consumed_items.append(f"processed-{item}"),
+            on_consume=consumed_items.append,
             timeout=0.1
         )
         consumer.start()
         
-        time.sleep(0.3)
+        wait_until(lambda: len(consumed_items) >= 3)
         queue.shutdown()
         consumer.join()
         
-        self.assertEqual(consumed_items, ["processed-x", "processed-y", "processed-z"])
+        processed = [f"processed-{item}" for item in consumed_items]
+        self.assertEqual(processed, ["processed-x", "processed-y", "processed-z"])
     
     def test_consumer_delay(self):
         """Test consumer with delay between items."""
@@ -80,13 +95,13 @@ class TestConsumerBasic(unittest.TestCase):
         
         consumer = Consumer(queue=queue, delay=0.05, timeout=0.1)
         
-        start_time = time.time()
+        start_time = time.perf_counter()
         consumer.start()
         
-        time.sleep(0.3)
+        wait_until(lambda: consumer.items_consumed >= 3)
         queue.shutdown()
         consumer.join()
-        elapsed = time.time() - start_time
+        elapsed = time.perf_counter() - start_time
         
         # Should have taken at least 0.1s for delays
         self.assertGreaterEqual(elapsed, 0.1)
@@ -101,7 +116,7 @@ class TestConsumerBasic(unittest.TestCase):
         consumer = Consumer(queue=queue, destination=destination, timeout=0.1)
         consumer.start()
         
-        time.sleep(0.2)
+        wait_until(lambda: consumer.items_consumed >= 1)
         queue.shutdown()
         consumer.join()
         
@@ -111,6 +126,22 @@ class TestConsumerBasic(unittest.TestCase):
         # Verify it's a copy
         results.append("modified")
         self.assertEqual(consumer.destination, ["initial", "added"])
+    
+    def test_consumer_view_and_snapshot(self):
+        """Test view returns the destination and snapshot returns a copy."""
+        queue = BlockingQueue(capacity=10)
+        destination = []
+        queue.put("item")
+        queue.shutdown()
+        
+        consumer = Consumer(queue=queue, destination=destination, timeout=0.1)
+        consumer.start()
+        consumer.join()
+        
+        self.assertIs(consumer.view(), destination)
+        snapshot = consumer.snapshot()
+        self.assertIsNot(snapshot, destination)
+        self.assertEqual(snapshot, ["item"])
 
 
 class TestConsumerBlocking(unittest.TestCase):
@@ -125,13 +156,13 @@ class TestConsumerBlocking(unittest.TestCase):
         consumer.start()
         
         # Consumer should be waiting
-        time.sleep(0.1)
+        wait_until(lambda: queue.get_statistics()["blocked_gets"] >= 1)
         self.assertTrue(consumer.is_running)
         self.assertEqual(len(destination), 0)
         
         # Add item - consumer should pick it up
         queue.put("delayed_item")
-        time.sleep(0.2)
+        wait_until(lambda: len(destination) >= 1)
         
         queue.shutdown()
         consumer.join()
@@ -146,13 +177,12 @@ class TestConsumerBlocking(unittest.TestCase):
         consumer = Consumer(queue=queue, destination=destination, timeout=0.3)
         consumer.start()
         
-        # Add items with delays
-        time.sleep(0.1)
+        # Add items one after the other
         queue.put("item1")
-        time.sleep(0.1)
+        wait_until(lambda: len(destination) >= 1)
         queue.put("item2")
         
-        time.sleep(0.2)
+        wait_until(lambda: len(destination) >= 2)
         queue.shutdown()
         consumer.join()
         
@@ -164,21 +194,43 @@ class TestConsumerStop(unittest.TestCase):
     
     def test_consumer_stop(self):
         """Test stopping consumer."""
-        queue = BlockingQueue(capacity=10)
+        queue = BlockingQueue(capacity=20)
         
         # Add many items
         for i in range(20):
             queue.put(f"item-{i}")
         
-        consumer = Consumer(queue=queue, delay=0.02, timeout=0.5)
+        seen = []
+        
+        def stop_after_five(item):
+            seen.append(item)
+            if len(seen) == 5:
+                consumer.stop()
+        
+        # One item per get so stop() is honoured right after the fifth
+        consumer = Consumer(queue=queue, on_consume=stop_after_five, timeout=0.5, batch_size=1)
         consumer.start()
+        consumer.join()
         
-        time.sleep(0.1)
+        # Should have stopped exactly after the fifth item
+        self.assertEqual(consumer.items_consumed, 5)
+        self.assertEqual(queue.size(), 15)
+    
+    def test_consumer_stop_interrupts_delay(self):
+        """Test that stop() cuts a long delay short."""
+        queue = BlockingQueue(capacity=10)
+        for i in range(3):
+            queue.put(f"item-{i}")
+        
+        consumer = Consumer(queue=queue, delay=5.0, timeout=0.5)
+        consumer.start()
+        
+        wait_until(lambda: consumer.items_consumed >= 1)
         consumer.stop()
-        consumer.join()
+        consumer.join(timeout=1.0)
         
-        # Should have stopped before processing all items
-        self.assertLess(consumer.items_consumed, 20)
+        self.assertFalse(consumer.is_alive())
+        self.assertEqual(consumer.items_consumed, 1)
     
     def test_consumer_stops_on_queue_shutdown(self):
         """Test consumer stops when queue is shutdown and empty."""
@@ -188,7 +240,7 @@ class TestConsumerStop(unittest.TestCase):
         consumer = Consumer(queue=queue, timeout=0.1)
         consumer.start()
         
-        time.sleep(0.2)
+        wait_until(lambda: consumer.items_consumed >= 1)
         queue.shutdown()
         consumer.join(timeout=1.0)
         
@@ -234,6 +286,8 @@ class TestDestinationContainer(unittest.TestCase):
     
     def test_thread_safety(self):
         """Test thread-safe concurrent access."""
+        # Under the GIL append() is list.append itself, which is atomic;
+        # free-threaded builds go through the container's lock
         container = DestinationContainer()
         num_threads = 5
         items_per_thread = 100
@@ -242,15 +296,10 @@ class TestDestinationContainer(unittest.TestCase):
             for i in range(items_per_thread):
                 container.append(f"t{thread_id}-{i}")
         
-        threads = [
-            threading.Thread(target=append_items, args=(i,))
-            for i in range(num_threads)
-        ]
+        tasks = [_pool.submit(append_items, i) for i in range(num_threads)]
         
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
+        for task in tasks:
+            task.result()
         
         self.assertEqual(container.size(), num_threads * items_per_thread)
 
@@ -271,12 +320,11 @@ class TestConsumerIntegration(unittest.TestCase):
         
         consumer = Consumer(queue=queue, destination=destination, timeout=0.3)
         
-        producer_thread = threading.Thread(target=producer)
         consumer.start()
-        producer_thread.start()
+        producer_task = _pool.submit(producer)
         
-        producer_thread.join()
-        time.sleep(0.2)
+        producer_task.result()
+        wait_until(lambda: len(destination) >= len(items_to_produce))
         queue.shutdown()
         consumer.join()
         
@@ -284,7 +332,7 @@ class TestConsumerIntegration(unittest.TestCase):
     
     def test_multiple_consumers_with_destination_container(self):
         """Test multiple consumers sharing a DestinationContainer."""
-        queue = BlockingQueue(capacity=10)
+        queue = BlockingQueue(capacity=20)
         destination = DestinationContainer()
         
         # Fill queue
@@ -299,7 +347,7 @@ class TestConsumerIntegration(unittest.TestCase):
         for c in consumers:
             c.start()
         
-        time.sleep(0.5)
+        wait_until(lambda: destination.size() >= 20)
         queue.shutdown()
         
         for c in consumers:
@@ -308,6 +356,28 @@ class TestConsumerIntegration(unittest.TestCase):
         total_consumed = sum(c.items_consumed for c in consumers)
         self.assertEqual(total_consumed, 20)
         self.assertEqual(destination.size(), 20)
+    
+    def test_multiple_consumers_with_local_buffers(self):
+        """Test that local buffers are merged into the destination on exit."""
+        queue = BlockingQueue(capacity=20)
+        destination = DestinationContainer()
+        
+        for i in range(20):
+            queue.put(f"item-{i}")
+        queue.shutdown()
+        
+        consumers = [
+            Consumer(queue=queue, destination=destination, timeout=0.1, local_buffer=True)
+            for _ in range(3)
+        ]
+        
+        for c in consumers:
+            c.start()
+        for c in consumers:
+            c.join()
+        
+        self.assertEqual(sum(c.items_consumed for c in consumers), 20)
+        self.assertEqual(Counter(destination.get_all()), Counter(f"item-{i}" for i in range(20)))
 
 
 if __name__ == '__main__':
@@ -4,12 +4,18 @@ Integration tests for the complete Producer-Consumer system.
 Tests end-to-end scenarios with producers and consumers working together.
 """
 
+import os
+import time
 import unittest
 import threading
-import time
+from collections import Counter
 from ..blocking_queue import BlockingQueue
 from ..producer import Producer, ItemGenerator
 from ..consumer import Consumer, DestinationContainer
+from ._wait_fraction import wait_fraction_report
+from ._gil import nogil_only
+from ._pipeline import pipeline, run_pipeline
+from ._sync import wait_until
 
 
 class TestProducerConsumerIntegration(unittest.TestCase):
@@ -24,12 +30,7 @@ class TestProducerConsumerIntegration(unittest.TestCase):
         producer = Producer(queue=queue, source=source, name="P1")
         consumer = Consumer(queue=queue, destination=destination, name="C1", timeout=0.3)
         
-        consumer.start()
-        producer.start()
-        
-        producer.join()
-        queue.shutdown()
-        consumer.join()
+        run_pipeline(queue, [producer], [consumer])
         
         self.assertEqual(producer.items_produced, 10)
         self.assertEqual(consumer.items_consumed, 10)
@@ -47,20 +48,12 @@ class TestProducerConsumerIntegration(unittest.TestCase):
             for i in range(3)
         ]
         
-        for c in consumers:
-            c.start()
-        producer.start()
-        
-        producer.join()
-        queue.shutdown()
-        
-        for c in consumers:
-            c.join()
+        run_pipeline(queue, [producer], consumers)
         
         total_consumed = sum(c.items_consumed for c in consumers)
         self.assertEqual(total_consumed, 20)
         self.assertEqual(destination.size(), 20)
-        self.assertEqual(sorted(destination.get_all()), source)
+        self.assertEqual(Counter(destination.get_all()), Counter(source))
     
     def test_multiple_producers_single_consumer(self):
         """Test multiple producers with one consumer."""
@@ -78,14 +71,7 @@ class TestProducerConsumerIntegration(unittest.TestCase):
         
         consumer = Consumer(queue=queue, destination=destination, timeout=0.3)
         
-        consumer.start()
-        for p in producers:
-            p.start()
-        
-        for p in producers:
-            p.join()
-        queue.shutdown()
-        consumer.join()
+        run_pipeline(queue, producers, [consumer])
         
         total_produced = sum(p.items_produced for p in producers)
         self.assertEqual(total_produced, 15)
@@ -122,16 +108,8 @@ class TestProducerConsumerIntegration(unittest.TestCase):
             for i in range(num_consumers)
         ]
         
-        for c in consumers:
-            c.start()
-        for p in producers:
-            p.start()
-        
-        for p in producers:
-            p.join()
-        queue.shutdown()
-        for c in consumers:
-            c.join()
+        with wait_fraction_report(self.id(), producers + consumers):
+            run_pipeline(queue, producers, consumers)
         
         expected_total = num_producers * items_per_producer
         total_produced = sum(p.items_produced for p in producers)
@@ -150,13 +128,8 @@ class TestProducerConsumerIntegration(unittest.TestCase):
         producer = Producer(queue=queue, source=source, delay=0.01)
         consumer = Consumer(queue=queue, destination=destination, delay=0.05, timeout=0.3)
         
-        consumer.start()
-        producer.start()
-        
         # During execution, queue should often be full
-        producer.join()
-        queue.shutdown()
-        consumer.join()
+        run_pipeline(queue, [producer], [consumer])
         
         self.assertEqual(destination, source)
     
@@ -169,13 +142,8 @@ class TestProducerConsumerIntegration(unittest.TestCase):
         producer = Producer(queue=queue, source=source, delay=0.05)
         consumer = Consumer(queue=queue, destination=destination, delay=0.01, timeout=0.3)
         
-        consumer.start()
-        producer.start()
-        
         # During execution, queue should often be empty
-        producer.join()
-        queue.shutdown()
-        consumer.join()
+        run_pipeline(queue, [producer], [consumer])
         
         self.assertEqual(destination, source)
     
@@ -192,12 +160,7 @@ class TestProducerConsumerIntegration(unittest.TestCase):
         producer = Producer(queue=queue, source=source)
         consumer = Consumer(queue=queue, destination=destination, timeout=0.3)
         
-        consumer.start()
-        producer.start()
-        
-        producer.join()
-        queue.shutdown()
-        consumer.join()
+        run_pipeline(queue, [producer], [consumer])
         
         self.assertEqual(len(destination), 15)
         self.assertEqual(destination[0], {"id": 0, "data": "payload-0"})
@@ -212,19 +175,12 @@ class TestProducerConsumerIntegration(unittest.TestCase):
         producer = Producer(queue=queue, source=source, delay=0.01)
         consumer = Consumer(queue=queue, destination=destination, timeout=0.3)
         
-        consumer.start()
-        producer.start()
-        
-        # Let some items be processed
-        time.sleep(0.2)
-        
-        # Stop producer
-        producer.stop()
-        producer.join()
-        
-        # Shutdown queue
-        queue.shutdown()
-        consumer.join()
+        with pipeline(queue, [producer], [consumer]):
+            # Let some items be processed
+            wait_until(lambda: len(destination) >= 5)
+            
+            # Stop producer
+            producer.stop()
         
         # Verify no items lost that were produced
         self.assertEqual(producer.items_produced, len(destination))
@@ -244,14 +200,8 @@ class TestProducerConsumerIntegration(unittest.TestCase):
             for _ in range(4)
         ]
         
-        for c in consumers:
-            c.start()
-        producer.start()
-        
-        producer.join()
-        queue.shutdown()
-        for c in consumers:
-            c.join()
+        with wait_fraction_report(self.id(), [producer] + consumers):
+            run_pipeline(queue, [producer], consumers)
         
         result = destination.get_all()
         
@@ -259,7 +209,7 @@ class TestProducerConsumerIntegration(unittest.TestCase):
         self.assertEqual(len(result), len(set(result)))
         
         # Check all items present
-        self.assertEqual(sorted(result), source)
+        self.assertEqual(Counter(result), Counter(source))
     
     def test_order_preserved_single_consumer(self):
         """Test FIFO order is preserved with single consumer."""
@@ -270,12 +220,7 @@ class TestProducerConsumerIntegration(unittest.TestCase):
         producer = Producer(queue=queue, source=source)
         consumer = Consumer(queue=queue, destination=destination, timeout=0.3)
         
-        consumer.start()
-        producer.start()
-        
-        producer.join()
-        queue.shutdown()
-        consumer.join()
+        run_pipeline(queue, [producer], [consumer])
         
         # Order should be preserved
         self.assertEqual(destination, source)
@@ -292,12 +237,7 @@ class TestEdgeCases(unittest.TestCase):
         producer = Producer(queue=queue, source=[])
         consumer = Consumer(queue=queue, destination=destination, timeout=0.2)
         
-        consumer.start()
-        producer.start()
-        
-        producer.join()
-        queue.shutdown()
-        consumer.join()
+        run_pipeline(queue, [producer], [consumer])
         
         self.assertEqual(producer.items_produced, 0)
         self.assertEqual(consumer.items_consumed, 0)
@@ -311,12 +251,7 @@ class TestEdgeCases(unittest.TestCase):
         producer = Producer(queue=queue, source=["only-item"])
         consumer = Consumer(queue=queue, destination=destination, timeout=0.2)
         
-        consumer.start()
-        producer.start()
-        
-        producer.join()
-        queue.shutdown()
-        consumer.join()
+        run_pipeline(queue, [producer], [consumer])
         
         self.assertEqual(destination, ["only-item"])
     
@@ -329,12 +264,7 @@ class TestEdgeCases(unittest.TestCase):
         producer = Producer(queue=queue, source=source)
         consumer = Consumer(queue=queue, destination=destination, timeout=0.3)
         
-        consumer.start()
-        producer.start()
-        
-        producer.join()
-        queue.shutdown()
-        consumer.join()
+        run_pipeline(queue, [producer], [consumer])
         
         self.assertEqual(destination, source)
     
@@ -347,16 +277,48 @@ class TestEdgeCases(unittest.TestCase):
         producer = Producer(queue=queue, source=source)
         consumer = Consumer(queue=queue, destination=destination, timeout=0.3)
         
-        consumer.start()
-        producer.start()
-        
-        producer.join()
-        queue.shutdown()
-        consumer.join()
+        run_pipeline(queue, [producer], [consumer])
         
         self.assertEqual(destination, source)
 
 
+class TestFreeThreadedScaling(unittest.TestCase):
+    """Contention tests that only mean something without the GIL."""
+    
+    @nogil_only
+    def test_scaling_under_nogil(self):
+        """
+        Test 8 producers and 8 consumers moving 100k items.
+        
+        Set MIN_TPS to the items/second floor calibrated for the host;
+        without it only correctness is checked.
+        """
+        num_workers = 8
+        num_items = 100_000
+        items = list(range(num_items))
+        queue = BlockingQueue(capacity=1024)
+        destination = DestinationContainer()
+        
+        producers = [
+            Producer(queue=queue, source=items[i::num_workers])
+            for i in range(num_workers)
+        ]
+        consumers = [
+            Consumer(queue=queue, destination=destination, timeout=0.5)
+            for _ in range(num_workers)
+        ]
+        
+        start_time = time.perf_counter()
+        run_pipeline(queue, producers, consumers)
+        elapsed = time.perf_counter() - start_time
+        
+        self.assertEqual(Counter(destination.get_all()), Counter(items))
+        
+        min_tps = os.environ.get("MIN_TPS")
+        if min_tps:
+            self.assertGreater(num_items / elapsed, float(min_tps))
+
+
 if __name__ == '__main__':
     unittest.main()
 
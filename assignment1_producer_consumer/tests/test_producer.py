@@ -7,11 +7,9 @@ Tests producer functionality, thread behavior, and source handling.
 import unittest
 import threading
 import time
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-from assignment1_producer_consumer.blocking_queue import BlockingQueue
-from assignment1_producer_consumer.producer import Producer, ItemGenerator
+from ..blocking_queue import BlockingQueue
+from ..producer import Producer, ItemGenerator
+from ._sync import wait_until
 
 
 class TestProducerBasic(unittest.TestCase):
@@ -100,10 +98,10 @@ class TestProducerBasic(unittest.TestCase):
         
         producer = Producer(queue=queue, source=source, delay=0.05)
         
-        start_time = time.time()
+        start_time = time.perf_counter()
         producer.start()
         producer.join()
-        elapsed = time.time() - start_time
+        elapsed = time.perf_counter() - start_time
         
         # Should take at least 0.1s (2 delays between 3 items)
         self.assertGreaterEqual(elapsed, 0.1)
@@ -118,13 +116,51 @@ class TestProducerBasic(unittest.TestCase):
         self.assertFalse(producer.is_running)
         
         producer.start()
-        time.sleep(0.05)
+        wait_until(lambda: producer.is_running)
         self.assertTrue(producer.is_running)
         
         producer.join()
         self.assertFalse(producer.is_running)
 
 
+class TestProducerBatching(unittest.TestCase):
+    """Test producer batched transfers."""
+    
+    def test_batched_producer_with_small_queue(self):
+        """Test that batches larger than the queue are split correctly."""
+        queue = BlockingQueue(capacity=3)
+        source = list(range(50))
+        received = []
+        
+        def consumer():
+            while len(received) < len(source):
+                received.extend(queue.get_many(10, timeout=1.0))
+        
+        getter = threading.Thread(target=consumer)
+        getter.start()
+        
+        producer = Producer(queue=queue, source=source, batch_size=8)
+        producer.start()
+        producer.join()
+        getter.join()
+        
+        self.assertEqual(producer.items_produced, 50)
+        self.assertEqual(received, source)
+    
+    def test_batched_producer_stops_on_shutdown(self):
+        """Test that a batched producer stops when the queue is shutdown."""
+        queue = BlockingQueue(capacity=2)
+        
+        producer = Producer(queue=queue, source=list(range(10)), batch_size=4)
+        producer.start()
+        
+        wait_until(queue.is_full)
+        queue.shutdown()
+        producer.join()
+        
+        self.assertEqual(producer.items_produced, 2)
+
+
 class TestProducerStop(unittest.TestCase):
     """Test producer stop functionality."""
     
@@ -136,13 +172,27 @@ class TestProducerStop(unittest.TestCase):
         producer = Producer(queue=queue, source=source, delay=0.01)
         producer.start()
         
-        time.sleep(0.05)
+        wait_until(lambda: producer.items_produced >= 1)
         producer.stop()
         producer.join()
         
         # Should have stopped before processing all items
         self.assertLess(producer.items_produced, 100)
     
+    def test_producer_stop_interrupts_delay(self):
+        """Test that stop() cuts a long delay short."""
+        queue = BlockingQueue(capacity=10)
+        
+        producer = Producer(queue=queue, source=list(range(10)), delay=5.0)
+        producer.start()
+        
+        wait_until(lambda: producer.items_produced >= 1)
+        producer.stop()
+        producer.join(timeout=1.0)
+        
+        self.assertFalse(producer.is_alive())
+        self.assertEqual(producer.items_produced, 1)
+    
     def test_producer_queue_shutdown(self):
         """Test producer behavior when queue is shutdown."""
         queue = BlockingQueue(capacity=2)
@@ -151,7 +201,7 @@ class TestProducerStop(unittest.TestCase):
         producer = Producer(queue=queue, source=source, delay=0.01)
         producer.start()
         
-        time.sleep(0.05)
+        wait_until(queue.is_full)
         queue.shutdown()
         producer.join()
         
@@ -170,14 +220,14 @@ class TestProducerBlocking(unittest.TestCase):
         producer = Producer(queue=queue, source=source, name="BlockingProducer")
         producer.start()
         
-        # Wait a bit - producer should have filled queue and be blocked
-        time.sleep(0.1)
+        # Wait until producer has filled queue and is blocked
+        wait_until(queue.is_full)
         self.assertEqual(queue.size(), 2)
         self.assertTrue(producer.is_running)
         
         # Consume one item to unblock producer
         queue.get()
-        time.sleep(0.1)
+        wait_until(queue.is_full)
         
         # Producer should have added another item
         self.assertEqual(queue.size(), 2)
@@ -221,6 +271,12 @@ class TestItemGenerator(unittest.TestCase):
         second = list(gen)
         
         self.assertEqual(first, second)
+    
+    def test_iter_batches(self):
+        """Test iter_batches splits items into bounded lists."""
+        gen = ItemGenerator(count=5, generator_func=lambda i: i)
+        
+        self.assertEqual(list(gen.iter_batches(2)), [[0, 1], [2, 3], [4]])
 
 
 if __name__ == '__main__':
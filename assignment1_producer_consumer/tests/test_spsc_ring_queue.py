@@ -0,0 +1,166 @@
+"""
+Unit tests for SPSCRingQueue implementation.
+
+Tests ring wrap-around, blocking on full/empty, shutdown, and use with a
+single Producer and Consumer.
+"""
+
+import threading
+import time
+import unittest
+from ..spsc_ring_queue import SPSCRingQueue
+from ..producer import Producer
+from ..consumer import Consumer
+from ._gil import gil_only
+from ._sync import wait_until
+
+
+class TestSPSCRingQueueBasic(unittest.TestCase):
+    """Test basic ring queue operations."""
+    
+    def test_init_invalid_capacity(self):
+        """Test that invalid capacity raises ValueError."""
+        with self.assertRaises(ValueError):
+            SPSCRingQueue(capacity=0)
+    
+    def test_fifo_with_wrap_around(self):
+        """Test FIFO order as indices wrap around the ring."""
+        queue = SPSCRingQueue(capacity=3)
+        received = []
+        for i in range(10):
+            self.assertTrue(queue.put(i))
+            self.assertTrue(queue.put(i + 100))
+            received.append(queue.get()[1])
+            received.append(queue.get()[1])
+        
+        self.assertEqual(received, [x for i in range(10) for x in (i, i + 100)])
+        self.assertTrue(queue.is_empty())
+    
+    def test_size_and_full(self):
+        """Test size, is_empty and is_full."""
+        queue = SPSCRingQueue(capacity=2)
+        self.assertTrue(queue.is_empty())
+        
+        queue.put("a")
+        queue.put("b")
+        self.assertEqual(queue.size(), 2)
+        self.assertTrue(queue.is_full())
+    
+    def test_timeouts(self):
+        """Test put and get time out on full and empty queues."""
+        queue = SPSCRingQueue(capacity=1)
+        self.assertEqual(queue.get(timeout=0.05), (False, None))
+        
+        queue.put("a")
+        self.assertFalse(queue.put("b", timeout=0.05))
+        self.assertEqual(queue.get(), (True, "a"))
+    
+    def test_shutdown_drains_then_stops(self):
+        """Test that items remain available after shutdown."""
+        queue = SPSCRingQueue(capacity=5)
+        queue.put("item")
+        queue.shutdown()
+        
+        self.assertFalse(queue.put("new_item"))
+        self.assertEqual(queue.get_with_status(), (True, "item", False))
+        self.assertEqual(queue.get_with_status(timeout=0.05), (False, None, True))
+
+
+class TestSPSCRingQueueBlocking(unittest.TestCase):
+    """Test blocking paths between one producer and one consumer."""
+    
+    def test_get_blocks_then_succeeds(self):
+        """Test that get waits for a put from the producer thread."""
+        queue = SPSCRingQueue(capacity=2)
+        
+        def delayed_put():
+            # Only put once the getter is blocked on the empty ring
+            wait_until(lambda: queue.get_statistics()["blocked_gets"] >= 1)
+            queue.put("delayed_item")
+        
+        putter = threading.Thread(target=delayed_put)
+        putter.start()
+        result = queue.get(timeout=1.0)
+        putter.join()
+        
+        self.assertEqual(result, (True, "delayed_item"))
+        self.assertEqual(queue.get_statistics()["blocked_gets"], 1)
+    
+    def test_shutdown_releases_waiting_put(self):
+        """Test that shutdown releases a producer blocked on a full ring."""
+        queue = SPSCRingQueue(capacity=1)
+        queue.put("item")
+        result = {}
+        
+        def waiting_producer():
+            result["success"] = queue.put("item2", timeout=5.0)
+        
+        producer = threading.Thread(target=waiting_producer)
+        producer.start()
+        self.assertTrue(wait_until(lambda: queue.get_statistics()["blocked_puts"] >= 1))
+        queue.shutdown()
+        producer.join(timeout=1.0)
+        
+        self.assertFalse(result["success"])
+    
+    def test_put_many_timeout_is_total(self):
+        """Test that put_many's timeout bounds the whole call, not each wait."""
+        queue = SPSCRingQueue(capacity=1)
+        stop = threading.Event()
+        
+        def slow_consumer():
+            while not stop.wait(0.02):
+                queue.get(timeout=0.01)
+        
+        getter = threading.Thread(target=slow_consumer)
+        getter.start()
+        start = time.monotonic()
+        added = queue.put_many(list(range(1000)), timeout=0.2)
+        elapsed = time.monotonic() - start
+        stop.set()
+        getter.join()
+        
+        self.assertLess(added, 1000)
+        self.assertLess(elapsed, 1.0)
+    
+    # The ring relies on the GIL for atomic index and slot writes
+    @gil_only
+    def test_stress_transfer(self):
+        """Test that many items pass through a tiny ring in order."""
+        queue = SPSCRingQueue(capacity=2)
+        source = list(range(5000))
+        destination = []
+        
+        producer = Producer(queue=queue, source=source)
+        consumer = Consumer(queue=queue, destination=destination, timeout=0.3)
+        
+        consumer.start()
+        producer.start()
+        producer.join()
+        queue.shutdown()
+        consumer.join()
+        
+        self.assertEqual(destination, source)
+    
+    # The ring relies on the GIL for atomic index and slot writes
+    @gil_only
+    def test_stress_transfer_single_item_path(self):
+        """Test the unbatched put/get path with a tiny ring."""
+        queue = SPSCRingQueue(capacity=1)
+        source = list(range(2000))
+        destination = []
+        
+        producer = Producer(queue=queue, source=source, batch_size=1)
+        consumer = Consumer(queue=queue, destination=destination, timeout=0.3, batch_size=1)
+        
+        consumer.start()
+        producer.start()
+        producer.join()
+        queue.shutdown()
+        consumer.join()
+        
+        self.assertEqual(destination, source)
+
+
+if __name__ == '__main__':
+    unittest.main()
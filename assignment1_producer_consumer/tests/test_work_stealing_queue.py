@@ -0,0 +1,191 @@
+"""
+Unit tests for WorkStealingQueue implementation.
+
+Tests round-robin distribution, stealing, blocking on full/empty,
+shutdown, and use with several Producers and Consumers.
+"""
+
+import threading
+import time
+import unittest
+from ..work_stealing_queue import WorkStealingQueue
+from ..producer import Producer
+from ..consumer import Consumer, DestinationContainer
+from ._sync import wait_until
+
+
+class TestWorkStealingQueueBasic(unittest.TestCase):
+    """Test basic work-stealing queue operations."""
+    
+    def test_init_invalid_arguments(self):
+        """Test that invalid num_workers or capacity raises ValueError."""
+        with self.assertRaises(ValueError):
+            WorkStealingQueue(num_workers=0)
+        with self.assertRaises(ValueError):
+            WorkStealingQueue(num_workers=2, capacity=0)
+    
+    def test_worker_index_out_of_range(self):
+        """Test that worker() rejects an invalid index."""
+        queue = WorkStealingQueue(num_workers=2)
+        with self.assertRaises(IndexError):
+            queue.worker(2)
+    
+    def test_round_robin_and_own_fifo(self):
+        """Test that items are spread round-robin and taken FIFO by owner."""
+        queue = WorkStealingQueue(num_workers=2, capacity=5)
+        for item in range(4):
+            queue.put(item)
+        
+        self.assertEqual(queue.worker(0).get_many(5), [0, 2])
+        self.assertEqual(queue.worker(1).get_many(5), [1, 3])
+        self.assertTrue(queue.is_empty())
+    
+    def test_steal_from_other_worker(self):
+        """Test that an idle worker steals from the tail of another deque."""
+        queue = WorkStealingQueue(num_workers=2, capacity=5)
+        for item in range(4):
+            queue.put(item)
+        worker = queue.worker(0)
+        
+        self.assertEqual(worker.get_many(5), [0, 2])
+        self.assertEqual(worker.get(), (True, 3))
+        self.assertEqual(worker.get(), (True, 1))
+    
+    def test_size_and_full(self):
+        """Test size, is_empty and is_full across deques."""
+        queue = WorkStealingQueue(num_workers=2, capacity=1)
+        self.assertTrue(queue.is_empty())
+        
+        queue.put("a")
+        queue.put("b")
+        self.assertEqual(queue.size(), 2)
+        self.assertTrue(queue.is_full())
+
+
+class TestWorkStealingQueueBlocking(unittest.TestCase):
+    """Test blocking behavior, timeouts and shutdown."""
+    
+    def test_get_timeout_on_empty_queue(self):
+        """Test that get times out on an empty queue."""
+        queue = WorkStealingQueue(num_workers=2)
+        self.assertEqual(queue.worker(0).get(timeout=0.05), (False, None))
+    
+    def test_put_timeout_on_full_queue(self):
+        """Test that put times out when every deque is full."""
+        queue = WorkStealingQueue(num_workers=2, capacity=1)
+        queue.put("a")
+        queue.put("b")
+        self.assertFalse(queue.put("c", timeout=0.05))
+    
+    def test_get_blocks_then_succeeds(self):
+        """Test that a waiting worker is woken by a put."""
+        queue = WorkStealingQueue(num_workers=2)
+        result = {}
+        
+        def consumer():
+            result["value"] = queue.worker(1).get(timeout=1.0)
+        
+        getter = threading.Thread(target=consumer)
+        getter.start()
+        self.assertTrue(wait_until(lambda: queue.get_statistics()["blocked_gets"] >= 1))
+        queue.put("item")
+        getter.join()
+        
+        self.assertEqual(result["value"], (True, "item"))
+    
+    def test_put_many_timeout_is_total(self):
+        """Test that put_many's timeout bounds the whole call, not each wait."""
+        queue = WorkStealingQueue(num_workers=1, capacity=1)
+        stop = threading.Event()
+        
+        def slow_consumer():
+            while not stop.wait(0.02):
+                queue.worker(0).get(timeout=0.01)
+        
+        getter = threading.Thread(target=slow_consumer)
+        getter.start()
+        start = time.monotonic()
+        added = queue.put_many(list(range(1000)), timeout=0.2)
+        elapsed = time.monotonic() - start
+        stop.set()
+        getter.join()
+        
+        self.assertLess(added, 1000)
+        self.assertLess(elapsed, 1.0)
+    
+    def test_shutdown_drains_then_done(self):
+        """Test that remaining items are drained before done=True."""
+        queue = WorkStealingQueue(num_workers=2)
+        queue.put("item")
+        queue.shutdown()
+        worker = queue.worker(1)
+        
+        self.assertFalse(queue.put("late"))
+        self.assertEqual(worker.get_with_status(), (True, "item", False))
+        self.assertEqual(worker.get_with_status(timeout=0.05), (False, None, True))
+        self.assertTrue(worker.drained())
+
+
+class TestWorkStealingQueueWithThreads(unittest.TestCase):
+    """Test WorkStealingQueue with Producer and Consumer threads."""
+    
+    def test_multiple_producers_multiple_consumers(self):
+        """Test that all items are transferred exactly once."""
+        queue = WorkStealingQueue(num_workers=3, capacity=2)
+        destination = DestinationContainer()
+        
+        producers = [
+            Producer(queue=queue, source=[f"P{i}-{j}" for j in range(50)])
+            for i in range(2)
+        ]
+        consumers = [
+            Consumer(queue=queue.worker(i), destination=destination, timeout=0.1)
+            for i in range(3)
+        ]
+        
+        for consumer in consumers:
+            consumer.start()
+        for producer in producers:
+            producer.start()
+        for producer in producers:
+            producer.join()
+        queue.shutdown()
+        for consumer in consumers:
+            consumer.join(timeout=2.0)
+        
+        items = destination.get_all()
+        self.assertEqual(len(items), 100)
+        self.assertEqual(len(set(items)), 100)
+        self.assertEqual(sum(c.items_consumed for c in consumers), 100)
+    
+    def test_put_racing_shutdown_is_never_lost(self):
+        """Test that every put() reported as successful is later delivered."""
+        for _ in range(20):
+            queue = WorkStealingQueue(num_workers=2, capacity=1000)
+            accepted = []
+            
+            def produce():
+                for i in range(1000):
+                    if not queue.put(i):
+                        break
+                    accepted.append(i)
+            
+            worker = queue.worker(0)
+            delivered = []
+            
+            def consume():
+                while not worker.drained():
+                    delivered.extend(worker.get_many(100, timeout=0.01))
+            
+            threads = [threading.Thread(target=produce), threading.Thread(target=consume)]
+            for thread in threads:
+                thread.start()
+            queue.shutdown()
+            for thread in threads:
+                thread.join()
+            
+            self.assertEqual(sorted(delivered), accepted)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,412 @@
+"""
+Work-Stealing Queue
+
+A bounded multi-consumer queue built from one deque per consumer.
+Producers spread items round-robin across the deques. Each consumer takes
+from the head of its own deque under its own lock, and only when that is
+empty steals from the tail of another consumer's deque, so consumers
+rarely contend for the same lock. A shared condition is used only when a
+thread actually has to wait.
+
+Items are delivered exactly once, but not in global FIFO order.
+"""
+
+import threading
+import time
+from collections import deque
+from itertools import count
+from typing import Any, List, Optional, Sequence, Tuple
+
+
+class WorkStealingQueue:
+    """
+    A bounded queue with one deque per consumer and work stealing.
+    
+    Producers call put()/put_many() on the queue itself. Each consumer
+    gets its own handle from worker(index), which offers the get side of
+    the BlockingQueue contract and can be passed to a Consumer.
+    
+    Attributes:
+        num_workers (int): Number of per-consumer deques.
+        capacity (int): Maximum number of items each deque can hold.
+    """
+    
+    def __init__(self, num_workers: int, capacity: int = 10):
+        """
+        Initialize the work-stealing queue.
+        
+        Args:
+            num_workers: Number of consumers, one deque each.
+            capacity: Maximum capacity of each deque. Default is 10.
+        
+        Raises:
+            ValueError: If num_workers or capacity is less than 1.
+        """
+        if num_workers < 1:
+            raise ValueError("num_workers must be at least 1")
+        if capacity < 1:
+            raise ValueError("Capacity must be at least 1")
+        
+        self._num_workers = num_workers
+        self._capacity = capacity
+        self._deques: List[deque] = [deque() for _ in range(num_workers)]
+        self._locks = [threading.Lock() for _ in range(num_workers)]
+        
+        # Round-robin cursor for producers; next() on it is atomic
+        self._next_deque = count()
+        
+        # Slow-path signalling, used only when a thread has to wait
+        self._cond = threading.Condition()
+        self._waiting_putters = 0
+        self._waiting_getters = 0
+        
+        # Flag to signal shutdown
+        self._shutdown = False
+        
+        # Statistics tracking, updated under the shared condition
+        self._total_blocked_puts = 0
+        self._total_blocked_gets = 0
+    
+    @property
+    def num_workers(self) -> int:
+        """Return the number of per-consumer deques."""
+        return self._num_workers
+    
+    @property
+    def capacity(self) -> int:
+        """Return the maximum capacity of each deque."""
+        return self._capacity
+    
+    def worker(self, index: int) -> 'WorkStealingWorker':
+        """
+        Return the consumer-side handle for one deque.
+        
+        Args:
+            index: Index of the deque owned by the consumer.
+        
+        Raises:
+            IndexError: If index is out of range.
+        """
+        if not 0 <= index < self._num_workers:
+            raise IndexError(f"worker index {index} out of range")
+        return WorkStealingWorker(self, index)
+    
+    def _try_put(self, item: Any) -> bool:
+        """
+        Append item to the first deque with space, starting round-robin.
+        
+        Returns False if every deque is full or the queue is shutdown. The
+        shutdown flag is re-checked under each deque lock, which shutdown()
+        also holds, so no item lands after consumers may have seen drained().
+        """
+        n = self._num_workers
+        start = next(self._next_deque) % n
+        for offset in range(n):
+            i = (start + offset) % n
+            with self._locks[i]:
+                if self._shutdown:
+                    return False
+                items = self._deques[i]
+                if len(items) < self._capacity:
+                    items.append(item)
+                    return True
+        return False
+    
+    def _try_take(self, index: int, max_items: int) -> List[Any]:
+        """
+        Take up to max_items from the head of the own deque, or steal them
+        from the tail of another deque if the own deque is empty.
+        """
+        with self._locks[index]:
+            own = self._deques[index]
+            if own:
+                popleft = own.popleft
+                return [popleft() for _ in range(min(max_items, len(own)))]
+        
+        n = self._num_workers
+        for offset in range(1, n):
+            victim = (index + offset) % n
+            with self._locks[victim]:
+                items = self._deques[victim]
+                if items:
+                    pop = items.pop
+                    return [pop() for _ in range(min(max_items, len(items)))]
+        return []
+    
+    def _wait(self, deadline: Optional[float]) -> bool:
+        """
+        Wait on the shared condition, which must be held.
+        
+        Returns:
+            False if the deadline has already passed, True otherwise.
+        """
+        if deadline is None:
+            self._cond.wait()
+            return True
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        self._cond.wait(timeout=remaining)
+        return True
+    
+    def put(self, item: Any, timeout: Optional[float] = None) -> bool:
+        """
+        Add an item to the queue, blocking while every deque is full.
+        
+        Args:
+            item: The item to add to the queue.
+            timeout: Maximum time to wait in seconds. None means wait forever.
+        
+        Returns:
+            True if item was added successfully, False if timeout expired
+            or queue is shutdown.
+        """
+        if self._shutdown:
+            return False
+        
+        if not self._try_put(item):
+            deadline = None if timeout is None else time.monotonic() + timeout
+            with self._cond:
+                # Announce the wait before re-checking, so a get() that
+                # frees space in between sees us and notifies
+                self._waiting_putters += 1
+                blocked = False
+                try:
+                    while True:
+                        if self._shutdown:
+                            return False
+                        if self._try_put(item):
+                            break
+                        if not blocked:
+                            self._total_blocked_puts += 1
+                            blocked = True
+                        if not self._wait(deadline):
+                            # Timeout expired
+                            return False
+                finally:
+                    self._waiting_putters -= 1
+        
+        if self._waiting_getters:
+            with self._cond:
+                self._cond.notify_all()
+        return True
+    
+    def put_many(self, items: Sequence[Any], timeout: Optional[float] = None) -> int:
+        """
+        Add several items to the queue, blocking while it is full.
+        
+        Args:
+            items: The items to add to the queue.
+            timeout: Maximum time in seconds to wait in total while the
+                    queue is full. None means wait forever.
+        
+        Returns:
+            The number of items added. Less than len(items) if the timeout
+            expired or the queue was shutdown.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        added = 0
+        for item in items:
+            # Each put() gets only the time left, so the timeout is total
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            if not self.put(item, timeout=remaining):
+                break
+            added += 1
+        return added
+    
+    def _get_many(self, index: int, max_items: int, timeout: Optional[float]) -> List[Any]:
+        """
+        Take up to max_items for worker index, blocking while all deques
+        are empty.
+        
+        Returns:
+            The items taken, empty on timeout or when the queue is
+            shutdown and empty.
+        """
+        items = self._try_take(index, max_items)
+        
+        if not items:
+            deadline = None if timeout is None else time.monotonic() + timeout
+            with self._cond:
+                # Announce the wait before re-checking, so a put() that
+                # lands in between sees us and notifies
+                self._waiting_getters += 1
+                blocked = False
+                try:
+                    while True:
+                        items = self._try_take(index, max_items)
+                        if items or self._shutdown:
+                            break
+                        if not blocked:
+                            self._total_blocked_gets += 1
+                            blocked = True
+                        if not self._wait(deadline):
+                            # Timeout expired
+                            break
+                finally:
+                    self._waiting_getters -= 1
+        
+        if items and self._waiting_putters:
+            with self._cond:
+                self._cond.notify_all()
+        return items
+    
+    def size(self) -> int:
+        """Return the current number of items across all deques."""
+        return sum(len(items) for items in self._deques)
+    
+    def is_empty(self) -> bool:
+        """Check if every deque is empty."""
+        return not any(self._deques)
+    
+    def is_full(self) -> bool:
+        """Check if every deque is at capacity."""
+        return all(len(items) >= self._capacity for items in self._deques)
+    
+    def shutdown(self) -> None:
+        """
+        Shutdown the queue, releasing all waiting threads.
+        
+        After shutdown, put() returns False and workers get remaining
+        items until the queue is empty.
+        """
+        with self._cond:
+            # Hold every deque lock while setting the flag, so a put()
+            # racing the shutdown either lands first or sees the flag
+            for lock in self._locks:
+                lock.acquire()
+            try:
+                self._shutdown = True
+            finally:
+                for lock in self._locks:
+                    lock.release()
+            self._cond.notify_all()
+    
+    def is_shutdown(self) -> bool:
+        """Check if the queue has been shutdown."""
+        return self._shutdown
+    
+    def drained(self) -> bool:
+        """Check if the queue is shutdown and empty."""
+        return self._shutdown and self.is_empty()
+    
+    def __enter__(self) -> 'WorkStealingQueue':
+        """Context manager entry - returns the queue instance."""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit - automatically shuts down the queue."""
+        self.shutdown()
+    
+    def __len__(self) -> int:
+        """Return the current size of the queue."""
+        return self.size()
+    
+    def __repr__(self) -> str:
+        """Return string representation of the queue."""
+        return (f"WorkStealingQueue(num_workers={self._num_workers}, "
+                f"capacity={self._capacity}, size={self.size()}, "
+                f"shutdown={self._shutdown})")
+    
+    def get_statistics(self) -> dict:
+        """
+        Get queue statistics.
+        
+        Returns:
+            Dictionary containing queue statistics:
+            - blocked_puts: Times put() had to wait
+            - blocked_gets: Times a worker's get() had to wait
+        """
+        with self._cond:
+            return {
+                "blocked_puts": self._total_blocked_puts,
+                "blocked_gets": self._total_blocked_gets,
+                "current_size": self.size(),
+                "capacity": self._capacity
+            }
+
+
+class WorkStealingWorker:
+    """
+    Consumer-side handle bound to one deque of a WorkStealingQueue.
+    
+    Offers get(), get_with_status(), get_many() and drained() with the
+    same contract as BlockingQueue, so it can be passed to a Consumer.
+    """
+    
+    def __init__(self, queue: WorkStealingQueue, index: int):
+        """
+        Initialize the handle.
+        
+        Args:
+            queue: The work-stealing queue to take items from.
+            index: Index of the deque owned by this worker.
+        """
+        self._queue = queue
+        self._index = index
+    
+    @property
+    def index(self) -> int:
+        """Return the index of the deque owned by this worker."""
+        return self._index
+    
+    def get(self, timeout: Optional[float] = None) -> Tuple[bool, Any]:
+        """
+        Remove and return an item, blocking while the queue is empty.
+        
+        Args:
+            timeout: Maximum time to wait in seconds. None means wait forever.
+        
+        Returns:
+            A tuple (success, item) where success is True if an item was
+            retrieved, False if timeout expired or queue is shutdown.
+            When success is False, item is None.
+        """
+        items = self._queue._get_many(self._index, 1, timeout)
+        if items:
+            return (True, items[0])
+        return (False, None)
+    
+    def get_with_status(self, timeout: Optional[float] = None) -> Tuple[bool, Any, bool]:
+        """
+        Like get(), but also reports whether the queue is finished.
+        
+        Returns:
+            A tuple (success, item, done) where done is True once the queue
+            is shutdown and empty.
+        """
+        success, item = self.get(timeout=timeout)
+        if success:
+            return (True, item, False)
+        return (False, None, self._queue.drained())
+    
+    def get_many(self, max_items: int, timeout: Optional[float] = None) -> List[Any]:
+        """
+        Remove and return up to max_items items, blocking if empty.
+        
+        Returns:
+            A list of retrieved items, empty on timeout or when the queue
+            is shutdown and empty.
+        
+        Raises:
+            ValueError: If max_items is less than 1.
+        """
+        if max_items < 1:
+            raise ValueError("max_items must be at least 1")
+        return self._queue._get_many(self._index, max_items, timeout)
+    
+    def is_shutdown(self) -> bool:
+        """Check if the underlying queue has been shutdown."""
+        return self._queue.is_shutdown()
+    
+    def is_empty(self) -> bool:
+        """Check if the underlying queue is empty."""
+        return self._queue.is_empty()
+    
+    def drained(self) -> bool:
+        """Check if the underlying queue is shutdown and empty."""
+        return self._queue.drained()
+    
+    def __repr__(self) -> str:
+        """Return string representation of the handle."""
+        return f"WorkStealingWorker(index={self._index}, queue={self._queue!r})"
@@ -12,8 +12,9 @@ Features:
 """
 
 from .models import SalesRecord
-from .data_loader import load_sales_data, load_sales_from_string
+from .data_loader import load_sales_data, load_sales_from_string, load_sales_columns
 from .analysis import SalesAnalyzer
 
-__all__ = ['SalesRecord', 'load_sales_data', 'load_sales_from_string', 'SalesAnalyzer']
+__all__ = ['SalesRecord', 'load_sales_data', 'load_sales_from_string',
+           'load_sales_columns', 'SalesAnalyzer']
 
@@ -4,63 +4,134 @@ Sales Data Analysis Module
 Provides analytical operations on sales data using functional programming:
 - map, filter, reduce operations
 - Lambda expressions
-- functools.partial for reusable functions
+- functools.partial and operator.attrgetter for reusable functions
 - Data aggregation (sum, average, min, max, median, std dev)
 - Grouping operations (group by category, region, etc.)
 """
 
-from functools import reduce, partial
-from itertools import groupby
-from typing import List, Dict, Callable, Any, Tuple, Optional
+from functools import partial, wraps
+from itertools import compress, repeat
+from typing import List, Dict, Callable, Any, Iterable, Sequence, Tuple, Optional
 from collections import defaultdict
 from datetime import date
+from operator import attrgetter, itemgetter, mul, truediv
+import heapq
 import math
+from array import array
 from .models import SalesRecord
+from .data_loader import COLUMNS
 
 
 # ==================== PARTIAL FUNCTION HELPERS ====================
 # Using functools.partial to create reusable, specialized functions
 
-def _get_attribute(attr_name: str, record: SalesRecord) -> Any:
-    """Generic attribute getter for use with partial."""
-    return getattr(record, attr_name)
-
-def _compare_attribute(attr_name: str, value: Any, record: SalesRecord) -> bool:
+def _compare_attribute(getter: Callable[[SalesRecord], Any], value: Any,
+                       record: SalesRecord) -> bool:
     """Generic attribute comparator for use with partial."""
-    return getattr(record, attr_name) == value
+    return getter(record) == value
 
 def _compare_amount_gte(threshold: float, record: SalesRecord) -> bool:
     """Compare if record's total_amount >= threshold."""
     return record.total_amount >= threshold
 
-# Pre-built partial functions for common operations
-get_amount = partial(_get_attribute, 'total_amount')
-get_quantity = partial(_get_attribute, 'quantity')
-get_category = partial(_get_attribute, 'category')
-get_region = partial(_get_attribute, 'region')
-get_product = partial(_get_attribute, 'product_name')
-get_salesperson = partial(_get_attribute, 'salesperson')
+# Pre-built attribute getters; attrgetter runs in C, with no Python frame per call
+get_amount = attrgetter('total_amount')
+get_quantity = attrgetter('quantity')
+get_category = attrgetter('category')
+get_region = attrgetter('region')
+get_product = attrgetter('product_name')
+get_salesperson = attrgetter('salesperson')
 
 # Partial function factory for creating filters
 def make_category_filter(category: str) -> Callable[[SalesRecord], bool]:
     """Create a category filter using partial application."""
-    return partial(_compare_attribute, 'category', category)
+    return partial(_compare_attribute, get_category, category)
 
 def make_region_filter(region: str) -> Callable[[SalesRecord], bool]:
     """Create a region filter using partial application."""
-    return partial(_compare_attribute, 'region', region)
+    return partial(_compare_attribute, get_region, region)
 
 def make_min_amount_filter(threshold: float) -> Callable[[SalesRecord], bool]:
     """Create a minimum amount filter using partial application."""
     return partial(_compare_amount_gte, threshold)
 
 
+def _code_typecode(size: int) -> str:
+    """Return the narrowest unsigned array typecode that can index size values."""
+    if size <= 0x100:
+        return 'B'
+    if size <= 0x10000:
+        return 'H'
+    return 'L'
+
+
+def _narrow_encoding(codes: Sequence[int], table: List[Any],
+                     pick: Callable[[Sequence[int]], List[int]]) -> Tuple[Sequence[int], List[Any]]:
+    """
+    Derive a subset's dictionary encoding from its parent's.
+    
+    Selects the subset's codes with pick, then renumbers the codes that
+    remain in first-appearance order so the table holds only values
+    present in the subset. Only integers are hashed.
+    """
+    picked = pick(codes)
+    present = list(dict.fromkeys(picked))
+    renumber = [0] * len(table)
+    for new_code, old_code in enumerate(present):
+        renumber[old_code] = new_code
+    return (array(_code_typecode(len(present)), list(map(renumber.__getitem__, picked))),
+            list(map(table.__getitem__, present)))
+
+
+def _round2(*values: float) -> List[float]:
+    """Round each value to 2 decimal places in one map() call."""
+    return list(map(round, values, repeat(2)))
+
+
+def _round2_values(mapping: Dict[Any, float]) -> Dict[Any, float]:
+    """Return a copy of mapping with each value rounded to 2 decimal places."""
+    return dict(zip(mapping, map(round, mapping.values(), repeat(2))))
+
+
+def _cached(method: Callable) -> Callable:
+    """
+    Cache the result of a zero-argument SalesAnalyzer method.
+    
+    Safe because an analyzer's records never change after construction.
+    List and dict results are returned as shallow copies, so callers
+    cannot alter the cached value; only use it for methods whose list or
+    dict elements are immutable.
+    """
+    name = method.__name__
+    
+    @wraps(method)
+    def wrapper(self):
+        cache = self._cache
+        if name not in cache:
+            cache[name] = method(self)
+        result = cache[name]
+        if isinstance(result, (list, dict)):
+            return result.copy()
+        return result
+    return wrapper
+
+
 class SalesAnalyzer:
     """
     Analyzer for sales data using functional programming paradigms.
     
     All analysis methods use functional operations like map, filter,
-    reduce, and lambda expressions.
+    reduce, and lambda expressions. The numeric columns (amounts and
+    quantities) are extracted once at construction, so the aggregations
+    run over plain lists instead of re-reading every record. Aggregations
+    are computed on first use and cached. Groupings are not: only the
+    inverted index of record positions per key (_positions) is cached,
+    and group_by_* build fresh record lists from it on every call, so
+    callers may modify them. Grouping keys are dictionary-encoded to
+    integer codes once per attribute.
+    
+    An analyzer built with from_columns keeps the column lists and only
+    builds SalesRecord objects when something needs whole records.
     """
     
     def __init__(self, records: List[SalesRecord]):
@@ -70,7 +141,73 @@ class SalesAnalyzer:
         Args:
             records: List of SalesRecord objects to analyze.
         """
-        self._records = records
+        self._record_list: Optional[List[SalesRecord]] = records
+        # Source columns for analyzers built by from_columns, else None
+        self._columns: Optional[Dict[str, List[Any]]] = None
+        # Column-wise copies of the numeric fields, built in one pass each
+        self._amounts: List[float] = list(map(get_amount, records))
+        self._quantities: List[int] = list(map(get_quantity, records))
+        # Results of @_cached methods, keyed by method name
+        self._cache: Dict[str, Any] = {}
+        # Parent encodings a filtered analyzer can narrow instead of
+        # re-encoding, keyed by attribute (see _subset)
+        self._inherited: Dict[str, Tuple[Sequence[int], List[Any], Callable]] = {}
+    
+    @classmethod
+    def from_columns(cls, columns: Dict[str, List[Any]]) -> 'SalesAnalyzer':
+        """
+        Create an analyzer from column lists (see load_sales_columns).
+        
+        The numeric columns are computed straight from the quantity and
+        unit_price lists, and grouping keys are read from their columns.
+        SalesRecord objects are only built on first use of the records.
+        
+        Args:
+            columns: Dictionary mapping each SalesRecord field to a list.
+        
+        Returns:
+            A new SalesAnalyzer over the same data.
+        """
+        quantities = columns['quantity']
+        return cls._from_state(
+            None,
+            list(map(mul, quantities, columns['unit_price'])),
+            list(quantities),
+            {name: list(columns[name]) for name in COLUMNS},
+        )
+    
+    @classmethod
+    def _from_state(cls, records: Optional[List[SalesRecord]], amounts: List[float],
+                    quantities: List[int],
+                    columns: Optional[Dict[str, List[Any]]] = None) -> 'SalesAnalyzer':
+        """
+        Create an analyzer from prebuilt numeric columns and either the
+        records or the full column lists to build them from on demand.
+        """
+        analyzer = cls.__new__(cls)
+        analyzer._record_list = records
+        analyzer._columns = columns
+        analyzer._amounts = amounts
+        analyzer._quantities = quantities
+        analyzer._cache = {}
+        analyzer._inherited = {}
+        return analyzer
+    
+    @property
+    def _records(self) -> List[SalesRecord]:
+        """Return the records, building them from the columns if needed."""
+        records = self._record_list
+        if records is None:
+            columns = self._columns
+            records = list(map(SalesRecord, *map(columns.__getitem__, COLUMNS)))
+            self._record_list = records
+        return records
+    
+    def _column(self, attr: str) -> Iterable[Any]:
+        """Return one attribute's values in record order, without building records."""
+        if self._record_list is None:
+            return self._columns[attr]
+        return map(attrgetter(attr), self._record_list)
     
     @property
     def records(self) -> List[SalesRecord]:
@@ -80,77 +217,77 @@ class SalesAnalyzer:
     @property
     def count(self) -> int:
         """Return total number of records."""
-        return len(self._records)
+        return len(self._amounts)
     
     # ==================== BASIC AGGREGATIONS ====================
     
+    @_cached
     def total_revenue(self) -> float:
         """
         Calculate total revenue across all transactions.
         
-        Uses: reduce with lambda
+        Uses: sum over the cached amounts column
         """
-        return reduce(
-            lambda acc, record: acc + record.total_amount,
-            self._records,
-            0.0
-        )
+        return sum(self._amounts, 0.0)
     
+    @_cached
     def total_quantity(self) -> int:
         """
         Calculate total quantity of items sold.
         
-        Uses: sum with map and lambda
+        Uses: sum over the cached quantities column
         """
-        return sum(map(lambda r: r.quantity, self._records))
+        return sum(self._quantities)
     
     def average_transaction_value(self) -> float:
         """
         Calculate average transaction value.
         
-        Uses: reduce for sum, then division
+        Uses: cached total revenue, then division
         """
-        if not self._records:
+        count = self.count
+        if not count:
             return 0.0
-        total = reduce(lambda acc, r: acc + r.total_amount, self._records, 0.0)
-        return total / len(self._records)
+        return self.total_revenue() / count
     
+    @_cached
     def min_transaction(self) -> Optional[SalesRecord]:
         """
         Find transaction with minimum value.
         
-        Uses: min with key lambda
+        Uses: min with attrgetter key
         """
         if not self._records:
             return None
-        return min(self._records, key=lambda r: r.total_amount)
+        return min(self._records, key=get_amount)
     
+    @_cached
     def max_transaction(self) -> Optional[SalesRecord]:
         """
         Find transaction with maximum value.
         
-        Uses: max with key lambda
+        Uses: max with attrgetter key
         """
         if not self._records:
             return None
-        return max(self._records, key=lambda r: r.total_amount)
+        return max(self._records, key=get_amount)
     
     # ==================== ADVANCED STATISTICS ====================
     
+    @_cached
     def median_transaction_value(self) -> float:
         """
         Calculate median transaction value.
         
-        Uses: sorted with lambda, functional approach
+        Uses: the cached sorted amounts column
         
         Returns:
             Median value, or 0.0 if no records.
         """
-        if not self._records:
+        if not self._amounts:
             return 0.0
         
-        # Use partial function to extract amounts
-        amounts = sorted(map(get_amount, self._records))
+        amounts = self._sorted_amounts()
         n = len(amounts)
         
         if n % 2 == 1:
@@ -160,30 +297,44 @@ class SalesAnalyzer:
             mid = n // 2
             return (amounts[mid - 1] + amounts[mid]) / 2
     
+    def _sorted_amounts(self) -> List[float]:
+        """
+        Return the amounts column in ascending order.
+        
+        Sorted once and cached, so the median, percentiles and quartiles
+        share one O(N log N) sort. The returned list must not be modified.
+        """
+        cache = self._cache
+        if '_sorted_amounts' not in cache:
+            cache['_sorted_amounts'] = sorted(self._amounts)
+        return cache['_sorted_amounts']
+    
+    @_cached
     def variance(self) -> float:
         """
         Calculate variance of transaction values.
         
-        Uses: reduce for sum of squared differences
+        Uses Welford's online algorithm for the sum of squared deviations,
+        which stays accurate when the amounts are large relative to their
+        spread. The running mean is internal; average_transaction_value()
+        stays sum / n.
         
         Returns:
             Population variance, or 0.0 if no records.
         """
-        if not self._records:
+        n = 0
+        mean = 0.0
+        m2 = 0.0
+        for x in self._amounts:
+            n += 1
+            delta = x - mean
+            mean += delta / n
+            m2 += delta * (x - mean)
+        if not n:
             return 0.0
-        
-        mean = self.average_transaction_value()
-        n = len(self._records)
-        
-        # Sum of squared differences using reduce
-        sum_sq_diff = reduce(
-            lambda acc, r: acc + (r.total_amount - mean) ** 2,
-            self._records,
-            0.0
-        )
-        
-        return sum_sq_diff / n
+        return m2 / n
     
+    @_cached
     def std_deviation(self) -> float:
         """
         Calculate standard deviation of transaction values.
@@ -199,7 +350,7 @@ class SalesAnalyzer:
         """
         Calculate the p-th percentile of transaction values.
         
-        Uses: sorted with partial function, functional approach
+        Uses: the cached sorted amounts column
         
         Args:
             p: Percentile value (0-100)
@@ -207,10 +358,10 @@ class SalesAnalyzer:
         Returns:
             The p-th percentile value, or 0.0 if no records.
         """
-        if not self._records or not (0 <= p <= 100):
+        if not self._amounts or not (0 <= p <= 100):
             return 0.0
         
-        amounts = sorted(map(get_amount, self._records))
+        amounts = self._sorted_amounts()
         n = len(amounts)
         
         # Calculate index
@@ -222,25 +373,25 @@ class SalesAnalyzer:
         weight = idx - lower
         return amounts[lower] * (1 - weight) + amounts[upper] * weight
     
+    @_cached
     def quartiles(self) -> Dict[str, float]:
         """
         Calculate Q1, Q2 (median), and Q3 quartiles.
         
-        Uses: percentile function with partial application pattern
+        Uses: map over percentile, sharing one sort of the amounts
         
         Returns:
             Dictionary with Q1, Q2, Q3 values.
         """
-        # Using partial-like pattern for percentile calculation
-        calc_percentile = lambda p: self.percentile(p)
-        
+        q1, q2, q3 = map(self.percentile, (25, 50, 75))
         return {
-            "Q1": calc_percentile(25),
-            "Q2": calc_percentile(50),  # Median
-            "Q3": calc_percentile(75),
-            "IQR": calc_percentile(75) - calc_percentile(25)  # Interquartile range
+            "Q1": q1,
+            "Q2": q2,  # Median
+            "Q3": q3,
+            "IQR": q3 - q1  # Interquartile range
         }
     
+    @_cached
     def coefficient_of_variation(self) -> float:
         """
         Calculate coefficient of variation (CV).
@@ -261,7 +412,7 @@ class SalesAnalyzer:
         """
         Filter records by a predicate function.
         
-        Uses: filter with custom predicate
+        Uses: map to build a mask, then itertools.compress
         
         Args:
             predicate: Function returning True for records to include.
@@ -269,48 +420,93 @@ class SalesAnalyzer:
         Returns:
             New SalesAnalyzer with filtered records.
         """
-        filtered = list(filter(predicate, self._records))
-        return SalesAnalyzer(filtered)
+        return self._select(list(map(predicate, self._records)))
+    
+    def _select(self, mask: List[bool]) -> 'SalesAnalyzer':
+        """
+        Build a filtered analyzer from a mask aligned with the records.
+        
+        The numeric columns are sliced with the same mask instead of being
+        re-extracted from the kept records.
+        """
+        return self._subset(lambda values: list(compress(values, mask)))
+    
+    def _subset(self, pick: Callable[[List[Any]], List[Any]]) -> 'SalesAnalyzer':
+        """
+        Build an analyzer from the rows that pick selects from each column.
+        
+        An analyzer whose records were never built passes the selection on
+        to its source columns instead, so the result stays column-backed.
+        Key encodings this analyzer has already built are handed down, so
+        the result narrows them on first use instead of re-encoding.
+        """
+        if self._record_list is None:
+            subset = self._from_state(
+                None, pick(self._amounts), pick(self._quantities),
+                {name: pick(values) for name, values in self._columns.items()},
+            )
+        else:
+            subset = self._from_state(
+                pick(self._record_list), pick(self._amounts), pick(self._quantities),
+            )
+        for key, encoded in self._cache.items():
+            if key.startswith('_encoded:'):
+                subset._inherited[key[len('_encoded:'):]] = (*encoded, pick)
+        return subset
+    
+    def _filter_equal(self, key_attr: str, value: Any) -> 'SalesAnalyzer':
+        """
+        Filter records whose attribute equals value.
+        
+        Looks the value up in the attribute's cached inverted index, so
+        repeated filters cost O(k) in the number of matches rather than
+        a scan over every record.
+        """
+        positions = self._positions(key_attr).get(value, [])
+        return self._subset(lambda values: list(map(values.__getitem__, positions)))
     
     def filter_by_category(self, category: str) -> 'SalesAnalyzer':
         """
         Filter records by product category.
         
-        Uses: filter with lambda
+        Uses: lookup in the cached inverted index
         """
-        return self.filter_by(lambda r: r.category == category)
+        return self._filter_equal('category', category)
     
     def filter_by_region(self, region: str) -> 'SalesAnalyzer':
         """
         Filter records by sales region.
         
-        Uses: filter with lambda
+        Uses: lookup in the cached inverted index
         """
-        return self.filter_by(lambda r: r.region == region)
+        return self._filter_equal('region', region)
     
     def filter_by_date_range(self, start: date, end: date) -> 'SalesAnalyzer':
         """
         Filter records within a date range.
         
-        Uses: filter with compound lambda
+        Uses: a mask from the cached date encoding, testing each
+        distinct date once instead of every record
         """
-        return self.filter_by(lambda r: start <= r.date <= end)
+        codes, table = self._encoded('date')
+        in_range = [start <= day <= end for day in table]
+        return self._select(list(map(in_range.__getitem__, codes)))
     
     def filter_by_min_amount(self, min_amount: float) -> 'SalesAnalyzer':
         """
         Filter records with total amount >= min_amount.
         
-        Uses: filter with lambda
+        Uses: a mask over the cached amounts column
         """
-        return self.filter_by(lambda r: r.total_amount >= min_amount)
+        return self._select([amount >= min_amount for amount in self._amounts])
     
     def filter_by_salesperson(self, salesperson: str) -> 'SalesAnalyzer':
         """
         Filter records by salesperson name.
         
-        Uses: filter with lambda
+        Uses: lookup in the cached inverted index
         """
-        return self.filter_by(lambda r: r.salesperson == salesperson)
+        return self._filter_equal('salesperson', salesperson)
     
     # ==================== PARTIAL FUNCTION FILTERING ====================
     
@@ -349,7 +545,7 @@ class SalesAnalyzer:
         """
         Group records by a key function.
         
-        Uses: defaultdict with functional iteration
+        Uses: defaultdict with one key_func call per record
         
         Args:
             key_func: Function to extract grouping key from record.
@@ -358,115 +554,191 @@ class SalesAnalyzer:
             Dictionary mapping keys to lists of records.
         """
         groups: Dict[Any, List[SalesRecord]] = defaultdict(list)
-        # Functional approach using map to create (key, record) pairs
-        for key, record in map(lambda r: (key_func(r), r), self._records):
-            groups[key].append(record)
+        for record in self._records:
+            groups[key_func(record)].append(record)
         return dict(groups)
     
+    def _encoded(self, key_attr: str) -> Tuple[Sequence[int], List[Any]]:
+        """
+        Dictionary-encode one record attribute.
+        
+        Each distinct value is hashed once here; the grouping and
+        aggregation helpers then work on small integer codes that index
+        plain lists. The codes are packed into an array of the narrowest
+        unsigned type that fits (one byte per record for up to 256
+        distinct values). The encoding is cached per attribute.
+        
+        Args:
+            key_attr: Record attribute to encode (e.g. 'category').
+        
+        Returns:
+            A tuple (codes, table) where table[codes[i]] is the value for
+            record i and table lists values in order of first appearance.
+        """
+        cache_key = '_encoded:' + key_attr
+        cache = self._cache
+        if cache_key not in cache and key_attr in self._inherited:
+            cache[cache_key] = _narrow_encoding(*self._inherited.pop(key_attr))
+        if cache_key not in cache:
+            values = self._column(key_attr)
+            if not isinstance(values, list):
+                values = list(values)
+            # dict.fromkeys keeps first-appearance order; both passes run in C
+            table = list(dict.fromkeys(values))
+            index = dict(zip(table, range(len(table))))
+            codes = array(_code_typecode(len(table)), list(map(index.__getitem__, values)))
+            cache[cache_key] = (codes, table)
+        return cache[cache_key]
+    
+    def _positions(self, key_attr: str) -> Dict[Any, List[int]]:
+        """
+        Build an inverted index from attribute value to record positions.
+        
+        Built once per attribute from the cached encoding; the returned
+        dictionary and its lists must not be modified.
+        """
+        cache_key = '_positions:' + key_attr
+        cache = self._cache
+        if cache_key not in cache:
+            codes, table = self._encoded(key_attr)
+            positions: List[List[int]] = [[] for _ in table]
+            for i, code in enumerate(codes):
+                positions[code].append(i)
+            cache[cache_key] = dict(zip(table, positions))
+        return cache[cache_key]
+    
+    def _group_by_attr(self, key_attr: str) -> Dict[Any, List[SalesRecord]]:
+        """
+        Group records by an attribute using its cached inverted index.
+        
+        Not cached itself: the group lists are built fresh on every call,
+        so callers own them and may modify them freely.
+        """
+        get_record = self._records.__getitem__
+        return {key: list(map(get_record, positions))
+                for key, positions in self._positions(key_attr).items()}
+    
     def group_by_category(self) -> Dict[str, List[SalesRecord]]:
         """Group records by product category."""
-        return self.group_by(lambda r: r.category)
+        return self._group_by_attr('category')
     
     def group_by_region(self) -> Dict[str, List[SalesRecord]]:
         """Group records by sales region."""
-        return self.group_by(lambda r: r.region)
+        return self._group_by_attr('region')
     
     def group_by_salesperson(self) -> Dict[str, List[SalesRecord]]:
         """Group records by salesperson."""
-        return self.group_by(lambda r: r.salesperson)
+        return self._group_by_attr('salesperson')
     
     def group_by_product(self) -> Dict[str, List[SalesRecord]]:
         """Group records by product name."""
-        return self.group_by(lambda r: r.product_name)
+        return self._group_by_attr('product_name')
     
     def group_by_date(self) -> Dict[date, List[SalesRecord]]:
         """Group records by transaction date."""
-        return self.group_by(lambda r: r.date)
+        return self._group_by_attr('date')
     
     # ==================== AGGREGATION BY GROUP ====================
     
+    def _sum_by(self, key_attr: str, values: List[Any]) -> Dict[Any, Any]:
+        """
+        Sum a column per key in a single pass.
+        
+        Accumulates into a list indexed by the key's integer code instead
+        of building per-group record lists and reducing each one.
+        
+        Args:
+            key_attr: Record attribute to group by.
+            values: Column aligned with the records (e.g. self._amounts).
+        
+        Returns:
+            Dictionary mapping keys to the sum of their values.
+        """
+        codes, table = self._encoded(key_attr)
+        totals: List[Any] = [0] * len(table)
+        for code, value in zip(codes, values):
+            totals[code] += value
+        return dict(zip(table, totals))
+    
+    def _sum_count_by(self, key_attr: str, values: List[Any]) -> Tuple[Dict[Any, Any], Dict[Any, int]]:
+        """
+        Sum a column and count records per key in a single pass.
+        
+        Returns:
+            A tuple (sums, counts) of dictionaries keyed the same way.
+        """
+        codes, table = self._encoded(key_attr)
+        totals: List[Any] = [0] * len(table)
+        counts = [0] * len(table)
+        for code, value in zip(codes, values):
+            totals[code] += value
+            counts[code] += 1
+        return dict(zip(table, totals)), dict(zip(table, counts))
+    
+    @_cached
     def revenue_by_category(self) -> Dict[str, float]:
         """
         Calculate total revenue per category.
         
-        Uses: groupby + reduce
+        Uses: single-pass accumulation over the cached key codes
         """
-        groups = self.group_by_category()
-        # Functional: map each group to (category, sum)
-        return dict(map(
-            lambda item: (
-                item[0],
-                reduce(lambda acc, r: acc + r.total_amount, item[1], 0.0)
-            ),
-            groups.items()
-        ))
+        return self._sum_by('category', self._amounts)
     
+    @_cached
     def revenue_by_region(self) -> Dict[str, float]:
         """
         Calculate total revenue per region.
         
-        Uses: groupby + reduce
+        Uses: single-pass accumulation over the cached key codes
         """
-        groups = self.group_by_region()
-        return dict(map(
-            lambda item: (
-                item[0],
-                reduce(lambda acc, r: acc + r.total_amount, item[1], 0.0)
-            ),
-            groups.items()
-        ))
+        return self._sum_by('region', self._amounts)
     
+    @_cached
     def revenue_by_salesperson(self) -> Dict[str, float]:
         """
         Calculate total revenue per salesperson.
         
-        Uses: groupby + reduce
+        Uses: single-pass accumulation over the cached key codes
         """
-        groups = self.group_by_salesperson()
-        return dict(map(
-            lambda item: (
-                item[0],
-                reduce(lambda acc, r: acc + r.total_amount, item[1], 0.0)
-            ),
-            groups.items()
-        ))
+        return self._sum_by('salesperson', self._amounts)
     
+    @_cached
+    def _revenue_by_product(self) -> Dict[str, float]:
+        """Calculate total revenue per product (backs top_products_by_revenue)."""
+        return self._sum_by('product_name', self._amounts)
+    
+    @_cached
     def quantity_by_product(self) -> Dict[str, int]:
         """
         Calculate total quantity sold per product.
         
-        Uses: groupby + sum + map
+        Uses: single-pass accumulation over the cached key codes
         """
-        groups = self.group_by_product()
-        return dict(map(
-            lambda item: (item[0], sum(map(lambda r: r.quantity, item[1]))),
-            groups.items()
-        ))
+        return self._sum_by('product_name', self._quantities)
     
+    @_cached
     def average_by_category(self) -> Dict[str, float]:
         """
         Calculate average transaction value per category.
         
-        Uses: groupby + reduce + map
+        Uses: single-pass sum and count, then map with operator.truediv
         """
-        groups = self.group_by_category()
-        return dict(map(
-            lambda item: (
-                item[0],
-                reduce(lambda acc, r: acc + r.total_amount, item[1], 0.0) / len(item[1])
-                if item[1] else 0.0
-            ),
-            groups.items()
-        ))
+        totals, counts = self._sum_count_by('category', self._amounts)
+        # Both dicts are keyed in the same order, so their values line up
+        return dict(zip(totals, map(truediv, totals.values(), counts.values())))
     
+    @_cached
     def count_by_region(self) -> Dict[str, int]:
         """
         Count transactions per region.
         
-        Uses: groupby + len
+        Uses: counting over the cached region codes
         """
-        groups = self.group_by_region()
-        return dict(map(lambda item: (item[0], len(item[1])), groups.items()))
+        codes, table = self._encoded('region')
+        counts = [0] * len(table)
+        for code in codes:
+            counts[code] += 1
+        return dict(zip(table, counts))
     
     # ==================== TRANSFORMATION OPERATIONS ====================
     
@@ -474,41 +746,46 @@ class SalesAnalyzer:
         """
         Extract all transaction amounts.
         
-        Uses: map with lambda
+        Returns:
+            A copy of the cached amounts column, in record order.
         """
-        return list(map(lambda r: r.total_amount, self._records))
+        return list(self._amounts)
     
+    @_cached
     def get_unique_categories(self) -> List[str]:
         """
         Get unique product categories.
         
-        Uses: set + map
+        Uses: the cached dictionary encoding
         """
-        return list(set(map(lambda r: r.category, self._records)))
+        return list(self._encoded('category')[1])
     
+    @_cached
     def get_unique_regions(self) -> List[str]:
         """
         Get unique sales regions.
         
-        Uses: set + map
+        Uses: the cached dictionary encoding
         """
-        return list(set(map(lambda r: r.region, self._records)))
+        return list(self._encoded('region')[1])
     
+    @_cached
     def get_unique_products(self) -> List[str]:
         """
         Get unique product names.
         
-        Uses: set + map
+        Uses: the cached dictionary encoding
         """
-        return list(set(map(lambda r: r.product_name, self._records)))
+        return list(self._encoded('product_name')[1])
     
+    @_cached
     def get_unique_salespersons(self) -> List[str]:
         """
         Get unique salesperson names.
         
-        Uses: set + map
+        Uses: the cached dictionary encoding
         """
-        return list(set(map(lambda r: r.salesperson, self._records)))
+        return list(self._encoded('salesperson')[1])
     
     # ==================== RANKING OPERATIONS ====================
     
@@ -516,69 +793,101 @@ class SalesAnalyzer:
         """
         Get top N products by total revenue.
         
-        Uses: groupby + reduce + sorted with lambda
-        """
-        product_revenue = dict(map(
-            lambda item: (
-                item[0],
-                reduce(lambda acc, r: acc + r.total_amount, item[1], 0.0)
-            ),
-            self.group_by_product().items()
-        ))
-        # Sort by revenue descending
-        sorted_products = sorted(
-            product_revenue.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )
-        return sorted_products[:n]
+        Uses: cached single-pass accumulation + heapq.nlargest
+        """
+        product_revenue = self._revenue_by_product()
+        return heapq.nlargest(n, product_revenue.items(), key=itemgetter(1))
     
     def top_salespersons_by_revenue(self, n: int = 5) -> List[Tuple[str, float]]:
         """
         Get top N salespersons by total revenue.
         
-        Uses: sorted with lambda key
+        Uses: heapq.nlargest with itemgetter key
         """
         revenue = self.revenue_by_salesperson()
-        return sorted(revenue.items(), key=lambda x: x[1], reverse=True)[:n]
+        return heapq.nlargest(n, revenue.items(), key=itemgetter(1))
     
     def top_transactions(self, n: int = 5) -> List[SalesRecord]:
         """
         Get top N transactions by value.
         
-        Uses: sorted with lambda key
+        Uses: heapq.nlargest with attrgetter key
         """
-        return sorted(self._records, key=lambda r: r.total_amount, reverse=True)[:n]
+        return heapq.nlargest(n, self._records, key=get_amount)
     
     # ==================== SUMMARY STATISTICS ====================
     
+    def _distinct_count(self, key_attr: str) -> int:
+        """Count distinct values of an attribute, reusing a cached encoding if any."""
+        encoded = self._cache.get('_encoded:' + key_attr)
+        if encoded is not None:
+            return len(encoded[1])
+        return len(set(self._column(key_attr)))
+    
+    def _fill_revenue_by_category_and_region(self) -> None:
+        """
+        Cache revenue_by_category and revenue_by_region from one pass.
+        
+        Does nothing if either is already cached, since the other then
+        costs only its own pass.
+        """
+        cache = self._cache
+        if 'revenue_by_category' in cache or 'revenue_by_region' in cache:
+            return
+        category_codes, categories = self._encoded('category')
+        region_codes, regions = self._encoded('region')
+        by_category: List[Any] = [0] * len(categories)
+        by_region: List[Any] = [0] * len(regions)
+        for category, region, amount in zip(category_codes, region_codes, self._amounts):
+            by_category[category] += amount
+            by_region[region] += amount
+        cache['revenue_by_category'] = dict(zip(categories, by_category))
+        cache['revenue_by_region'] = dict(zip(regions, by_region))
+    
     def summary(self) -> Dict[str, Any]:
         """
         Generate comprehensive summary statistics.
         
+        Shares work instead of calling each accessor from scratch: the
+        scalar statistics come from the cached Welford pass and the one
+        shared sort, the category and region revenues are accumulated in
+        a single fused pass, and distinct counts are taken with set()
+        unless an encoding is already cached.
+        
         Returns:
             Dictionary with all key metrics including advanced statistics.
         """
-        amounts = self.get_all_amounts()
-        quartiles = self.quartiles()
+        self._fill_revenue_by_category_and_region()
+        sorted_amounts = self._sorted_amounts()
+        (total_revenue, average, median, std_dev, variance, cv,
+         min_amount, max_amount) = _round2(
+            self.total_revenue(),
+            self.average_transaction_value(),
+            self.median_transaction_value(),
+            self.std_deviation(),
+            self.variance(),
+            self.coefficient_of_variation(),
+            sorted_amounts[0] if sorted_amounts else 0,
+            sorted_amounts[-1] if sorted_amounts else 0,
+        )
         
         return {
             "total_transactions": self.count,
-            "total_revenue": round(self.total_revenue(), 2),
+            "total_revenue": total_revenue,
             "total_quantity": self.total_quantity(),
-            "average_transaction": round(self.average_transaction_value(), 2),
-            "median_transaction": round(self.median_transaction_value(), 2),
-            "std_deviation": round(self.std_deviation(), 2),
-            "variance": round(self.variance(), 2),
-            "coefficient_of_variation": round(self.coefficient_of_variation(), 2),
-            "min_transaction": round(min(amounts), 2) if amounts else 0,
-            "max_transaction": round(max(amounts), 2) if amounts else 0,
-            "quartiles": {k: round(v, 2) for k, v in quartiles.items()},
-            "unique_products": len(self.get_unique_products()),
-            "unique_categories": len(self.get_unique_categories()),
-            "unique_regions": len(self.get_unique_regions()),
-            "unique_salespersons": len(self.get_unique_salespersons()),
-            "revenue_by_category": {k: round(v, 2) for k, v in self.revenue_by_category().items()},
-            "revenue_by_region": {k: round(v, 2) for k, v in self.revenue_by_region().items()},
+            "average_transaction": average,
+            "median_transaction": median,
+            "std_deviation": std_dev,
+            "variance": variance,
+            "coefficient_of_variation": cv,
+            "min_transaction": min_amount,
+            "max_transaction": max_amount,
+            "quartiles": _round2_values(self.quartiles()),
+            "unique_products": self._distinct_count('product_name'),
+            "unique_categories": self._distinct_count('category'),
+            "unique_regions": self._distinct_count('region'),
+            "unique_salespersons": self._distinct_count('salesperson'),
+            "revenue_by_category": _round2_values(self.revenue_by_category()),
+            "revenue_by_region": _round2_values(self.revenue_by_region()),
         }
 
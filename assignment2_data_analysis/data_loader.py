@@ -6,19 +6,179 @@ Uses functional programming patterns for data transformation.
 """
 
 import csv
-from typing import List, Iterator, Callable
+import gc
+import io
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import fields
+from functools import partial
+from itertools import chain, repeat, zip_longest
+from typing import Any, Dict, List, Iterable, Iterator, Callable, Optional, TextIO
 from pathlib import Path
-from .models import SalesRecord
+from .models import SalesRecord, _parse_date
 
 
-def load_sales_data(filepath: str) -> List[SalesRecord]:
+# Column names in SalesRecord field order
+COLUMNS = tuple(f.name for f in fields(SalesRecord))
+
+# Read CSV files in 1 MiB blocks instead of the default 8 KiB
+_READ_BUFFER_SIZE = 1 << 20
+
+# Smaller files are parsed on one thread; splitting them costs more than it saves
+_PARALLEL_MIN_BYTES = 1 << 20
+
+# Fill value marking the fields of a short row in load_sales_columns
+_MISSING = object()
+
+# Converters for the non-string columns, plus interning for the
+# low-cardinality string columns (as SalesRecord.row_parser does)
+_COLUMN_PARSERS: Dict[str, Callable[[str], Any]] = {
+    'date': _parse_date,
+    'category': sys.intern,
+    'quantity': int,
+    'unit_price': float,
+    'region': sys.intern,
+    'salesperson': sys.intern,
+}
+
+
+def _open_csv(path: Path) -> TextIO:
+    """Open a CSV file for reading with a large read buffer."""
+    return open(path, 'r', buffering=_READ_BUFFER_SIZE, newline='', encoding='utf-8')
+
+
+def _column_positions(header: List[str]) -> List[int]:
+    """
+    Resolve the index of each SalesRecord field in a CSV header.
+    
+    A name that appears more than once resolves to its last occurrence,
+    as it does in the dicts DictReader builds.
+    
+    Raises:
+        ValueError: If the header is missing a column.
+    """
+    index = {name: position for position, name in enumerate(header)}
+    missing = [name for name in COLUMNS if name not in index]
+    if missing:
+        raise ValueError(f"CSV is missing columns: {', '.join(missing)}")
+    return list(map(index.__getitem__, COLUMNS))
+
+
+def _read_header(reader: Iterator[List[str]]) -> Optional[List[str]]:
+    """Return the first non-blank row of a csv.reader, or None if there is none."""
+    return next(filter(None, reader), None)
+
+
+def _read_records(file: Iterable[str]) -> Iterator[SalesRecord]:
+    """
+    Parse an open CSV file into SalesRecord objects.
+    
+    Uses csv.reader with column positions resolved once from the header,
+    so no dict is built per row. Blank lines are skipped, as DictReader does.
+    """
+    reader = csv.reader(file)
+    header = _read_header(reader)
+    if header is None:
+        return iter(())
+    return map(SalesRecord.row_parser(_column_positions(header)), filter(None, reader))
+
+
+def _read_unquoted_records(csv_content: str) -> List[SalesRecord]:
+    """
+    Parse CSV text that has no quote or carriage-return characters.
+    
+    Without quoting every comma is a delimiter and every newline ends a
+    row, so str.split yields the same rows as csv.reader with less work.
+    Blank lines are skipped, before the header as well as after it.
+    """
+    lines = filter(None, csv_content.split('\n'))
+    header = next(lines, None)
+    if header is None:
+        return []
+    parse = SalesRecord.row_parser(_column_positions(header.split(',')))
+    return list(map(parse, map(str.split, lines, repeat(','))))
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    """
+    Pause the cyclic garbage collector while a bulk load runs.
+    
+    Records hold only strings, numbers and dates, so they never form
+    cycles. Without the pause, every few hundred new records trigger a
+    collection, and the older generations rescan the growing list.
+    
+    The pause is process-wide, so only wrap parsing that runs no caller
+    code (predicates, callbacks) and returns promptly.
+    """
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+def _default_workers() -> int:
+    """
+    Return the number of parser threads for the running build.
+    
+    With the GIL, threads would take turns on the pure-Python parsing and
+    only add overhead, so loading stays serial; a free-threaded build uses
+    one thread per CPU.
+    """
+    if getattr(sys, "_is_gil_enabled", lambda: True)():
+        return 1
+    return os.cpu_count() or 1
+
+
+def _parse_lines(lines: List[str], positions: List[int]) -> List[SalesRecord]:
+    """Parse a chunk of CSV data lines (no header) into records."""
+    return list(map(SalesRecord.row_parser(positions), filter(None, csv.reader(lines))))
+
+
+def _read_records_parallel(file: TextIO, workers: int) -> List[SalesRecord]:
+    """
+    Parse an open CSV file on several threads.
+    
+    The data lines are split into one contiguous chunk per worker and
+    the parsed chunks are joined back in order. A chunk boundary is only
+    a record boundary when no quoted field spans lines, so data with any
+    quote character is parsed serially instead.
+    """
+    # Pull lines one at a time so the header read leaves the rest for readlines
+    header = _read_header(csv.reader(iter(file.readline, '')))
+    if header is None:
+        return []
+    positions = _column_positions(header)
+    lines = file.readlines()
+    if not lines:
+        return []
+    if any(map(str.__contains__, lines, repeat('"'))):
+        return _parse_lines(lines, positions)
+    size = -(-len(lines) // workers)
+    chunks = [lines[start:start + size] for start in range(0, len(lines), size)]
+    with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+        parsed = executor.map(_parse_lines, chunks, repeat(positions))
+        return list(chain.from_iterable(parsed))
+
+
+def load_sales_data(filepath: str, workers: Optional[int] = None) -> List[SalesRecord]:
     """
     Load sales data from a CSV file.
     
     Uses functional approach with map() to transform CSV rows to SalesRecord objects.
+    Rows are read positionally with csv.reader rather than as dicts.
     
     Args:
         filepath: Path to the CSV file.
+        workers: Number of threads to parse with. Defaults to 1 when the
+                 GIL is enabled and to the CPU count on a free-threaded
+                 build. Files under _PARALLEL_MIN_BYTES are always parsed
+                 on the calling thread.
     
     Returns:
         List of SalesRecord objects.
@@ -31,15 +191,20 @@ def load_sales_data(filepath: str) -> List[SalesRecord]:
     if not path.exists():
         raise FileNotFoundError(f"CSV file not found: {filepath}")
     
-    with open(path, 'r', newline='', encoding='utf-8') as file:
-        reader = csv.DictReader(file)
-        # Functional: map each row dict to a SalesRecord
-        records = list(map(SalesRecord.from_dict, reader))
+    if workers is None:
+        workers = _default_workers()
+    if workers > 1 and path.stat().st_size < _PARALLEL_MIN_BYTES:
+        workers = 1
+    
+    with _open_csv(path) as file, _gc_paused():
+        if workers > 1:
+            return _read_records_parallel(file, workers)
+        records = list(_read_records(file))
     
     return records
 
 
-def load_sales_from_string(csv_content: str) -> List[SalesRecord]:
+def load_sales_from_string(csv_content: str, workers: Optional[int] = None) -> List[SalesRecord]:
     """
     Load sales data from a CSV string.
     
@@ -47,16 +212,98 @@ def load_sales_from_string(csv_content: str) -> List[SalesRecord]:
     
     Args:
         csv_content: CSV content as a string.
+        workers: Number of threads to parse with, as for load_sales_data.
+                 Strings under _PARALLEL_MIN_BYTES characters, or with any
+                 quote character, are always parsed on the calling thread.
     
     Returns:
         List of SalesRecord objects.
     """
-    import io
-    reader = csv.DictReader(io.StringIO(csv_content))
-    return list(map(SalesRecord.from_dict, reader))
+    if workers is None:
+        workers = _default_workers()
+    quoted = '"' in csv_content
+    # Line chunks are only record boundaries when no quoted field can
+    # span lines, so quoted input is always parsed serially
+    if quoted or len(csv_content) < _PARALLEL_MIN_BYTES:
+        workers = 1
+    
+    with _gc_paused():
+        file = io.StringIO(csv_content, newline='')
+        if workers > 1:
+            return _read_records_parallel(file, workers)
+        if not quoted and '\r' not in csv_content:
+            return _read_unquoted_records(csv_content)
+        return list(_read_records(file))
 
 
-def stream_sales_data(filepath: str) -> Iterator[SalesRecord]:
+def load_sales_columns(filepath: str) -> Dict[str, List[Any]]:
+    """
+    Load sales data from a CSV file column by column.
+    
+    Skips the per-row dict and SalesRecord objects: rows are read with
+    csv.reader, transposed with zip_longest(), and each column is converted
+    with a single map() call. Pass the result to SalesAnalyzer.from_columns.
+    
+    Args:
+        filepath: Path to the CSV file.
+    
+    Returns:
+        Dictionary mapping each SalesRecord field name to a list of values.
+        Every list is empty for an empty file, as load_sales_data returns [].
+    
+    Raises:
+        FileNotFoundError: If the file doesn't exist.
+        ValueError: If the CSV is missing a column, or a row is too short
+                    to hold one of the fields.
+    """
+    path = Path(filepath)
+    if not path.exists():
+        raise FileNotFoundError(f"CSV file not found: {filepath}")
+    
+    with _open_csv(path) as file, _gc_paused():
+        reader = csv.reader(file)
+        header = _read_header(reader)
+        if header is None:
+            return {name: [] for name in COLUMNS}
+        # zip_longest pads short rows instead of truncating every column
+        # to the shortest row, so a short row is detected below
+        raw_columns = list(zip_longest(*filter(None, reader), fillvalue=_MISSING))
+    
+    positions = _column_positions(header)
+    if raw_columns:
+        # A short row lacks its trailing fields, so it shows up in the
+        # rightmost column that is read
+        last = max(positions)
+        if last >= len(raw_columns) or _MISSING in raw_columns[last]:
+            raise ValueError("CSV has a row with fewer fields than the header")
+    
+    columns: Dict[str, List[Any]] = {}
+    for name, position in zip(COLUMNS, positions):
+        raw = raw_columns[position] if raw_columns else ()
+        parser = _COLUMN_PARSERS.get(name)
+        columns[name] = list(map(parser, raw)) if parser else list(raw)
+    return columns
+
+
+def _raw_field_equals(field: str, value: str, row: Dict[str, str]) -> bool:
+    """Compare one raw CSV field to a string value, for use with partial."""
+    return row[field] == value
+
+
+def raw_category_eq(category: str) -> Callable[[Dict[str, str]], bool]:
+    """Create a raw-row filter matching one category (see filter_and_load)."""
+    return partial(_raw_field_equals, 'category', category)
+
+
+def raw_region_eq(region: str) -> Callable[[Dict[str, str]], bool]:
+    """Create a raw-row filter matching one region (see filter_and_load)."""
+    return partial(_raw_field_equals, 'region', region)
+
+
+def stream_sales_data(
+    filepath: str,
+    raw_predicate: Optional[Callable[[Dict[str, str]], bool]] = None
+) -> Iterator[SalesRecord]:
     """
     Stream sales data from CSV file (memory-efficient for large files).
     
@@ -64,6 +311,9 @@ def stream_sales_data(filepath: str) -> Iterator[SalesRecord]:
     
     Args:
         filepath: Path to the CSV file.
+        raw_predicate: Optional function on the raw row dict (string
+            values). Rows it rejects are skipped before any parsing or
+            SalesRecord construction.
     
     Yields:
         SalesRecord objects one at a time.
@@ -72,27 +322,35 @@ def stream_sales_data(filepath: str) -> Iterator[SalesRecord]:
     if not path.exists():
         raise FileNotFoundError(f"CSV file not found: {filepath}")
     
-    with open(path, 'r', newline='', encoding='utf-8') as file:
-        reader = csv.DictReader(file)
-        for row in reader:
-            yield SalesRecord.from_dict(row)
+    with _open_csv(path) as file:
+        if raw_predicate is None:
+            yield from _read_records(file)
+        else:
+            # Raw predicates are written against named fields, so this
+            # path keeps DictReader rows
+            for row in filter(raw_predicate, csv.DictReader(file)):
+                yield SalesRecord.from_dict(row)
 
 
 def filter_and_load(
     filepath: str,
-    predicate: Callable[[SalesRecord], bool]
+    predicate: Callable[[SalesRecord], bool],
+    raw_predicate: Optional[Callable[[Dict[str, str]], bool]] = None
 ) -> List[SalesRecord]:
     """
     Load and filter sales data in one pass.
     
-    Combines streaming with filtering for efficient memory usage.
+    Combines streaming with filtering for efficient memory usage. A
+    raw_predicate (e.g. raw_category_eq('Furniture')) is pushed down to
+    the CSV rows, so rejected rows never become SalesRecord objects;
+    predicate is then applied to the records that remain.
     
     Args:
         filepath: Path to the CSV file.
         predicate: Function that returns True for records to include.
+        raw_predicate: Optional function on the raw row dict, checked first.
     
     Returns:
         List of filtered SalesRecord objects.
     """
-    return list(filter(predicate, stream_sales_data(filepath)))
-
+    return list(filter(predicate, stream_sales_data(filepath, raw_predicate)))
@@ -7,11 +7,15 @@ Demonstrates functional programming operations on sales data:
 - Data aggregation and grouping
 """
 
-import os
+from functools import reduce
+from operator import add, attrgetter, itemgetter
 from pathlib import Path
-from datetime import date
-from .data_loader import load_sales_data
-from .analysis import SalesAnalyzer
+from typing import Iterable
+from .data_loader import load_sales_data, load_sales_columns
+from .analysis import (
+    SalesAnalyzer, get_amount, get_quantity,
+    make_category_filter, make_region_filter, make_min_amount_filter
+)
 
 
 def get_data_path() -> str:
@@ -27,6 +31,13 @@ def print_section(title: str):
     print('=' * 60)
 
 
+def print_lines(lines: Iterable[str]):
+    """Print a block of lines with a single joined write."""
+    block = "\n".join(lines)
+    if block:
+        print(block)
+
+
 def demo_basic_loading():
     """Demonstrate loading CSV data."""
     print_section("1. Loading CSV Data")
@@ -36,8 +47,7 @@ def demo_basic_loading():
     
     print(f"Loaded {len(records)} sales records from CSV")
     print(f"\nFirst 3 records:")
-    for record in records[:3]:
-        print(f"  {record}")
+    print_lines(f"  {record}" for record in records[:3])
 
 
 def demo_basic_aggregations(analyzer: SalesAnalyzer):
@@ -72,9 +82,9 @@ def demo_filtering(analyzer: SalesAnalyzer):
     
     # Filter by region
     print(f"\nSales by Region (filtered):")
-    for region in ["North", "South", "East", "West"]:
-        regional = analyzer.filter_by_region(region)
-        print(f"  {region}: {regional.count} transactions, ${regional.total_revenue():,.2f}")
+    regions = ["North", "South", "East", "West"]
+    print_lines(f"  {region}: {regional.count} transactions, ${regional.total_revenue():,.2f}"
+                for region, regional in zip(regions, map(analyzer.filter_by_region, regions)))
     
     # Filter by minimum amount
     high_value = analyzer.filter_by_min_amount(500)
@@ -90,21 +100,21 @@ def demo_grouping(analyzer: SalesAnalyzer):
     print_section("4. Grouping Operations (using groupby)")
     
     print("\nRevenue by Category:")
-    for category, revenue in sorted(analyzer.revenue_by_category().items()):
-        print(f"  {category}: ${revenue:,.2f}")
+    print_lines(f"  {category}: ${revenue:,.2f}"
+                for category, revenue in sorted(analyzer.revenue_by_category().items()))
     
     print("\nRevenue by Region:")
-    for region, revenue in sorted(analyzer.revenue_by_region().items()):
-        print(f"  {region}: ${revenue:,.2f}")
+    print_lines(f"  {region}: ${revenue:,.2f}"
+                for region, revenue in sorted(analyzer.revenue_by_region().items()))
     
     print("\nTransactions by Region:")
-    for region, count in sorted(analyzer.count_by_region().items()):
-        print(f"  {region}: {count} transactions")
+    print_lines(f"  {region}: {count} transactions"
+                for region, count in sorted(analyzer.count_by_region().items()))
     
     print("\nQuantity Sold by Product:")
     qty_by_product = analyzer.quantity_by_product()
-    for product, qty in sorted(qty_by_product.items(), key=lambda x: x[1], reverse=True)[:5]:
-        print(f"  {product}: {qty} units")
+    top_quantities = sorted(qty_by_product.items(), key=itemgetter(1), reverse=True)[:5]
+    print_lines(f"  {product}: {qty} units" for product, qty in top_quantities)
 
 
 def demo_ranking(analyzer: SalesAnalyzer):
@@ -112,16 +122,16 @@ def demo_ranking(analyzer: SalesAnalyzer):
     print_section("5. Rankings (using sorted with lambda)")
     
     print("\nTop 5 Products by Revenue:")
-    for i, (product, revenue) in enumerate(analyzer.top_products_by_revenue(5), 1):
-        print(f"  {i}. {product}: ${revenue:,.2f}")
+    print_lines(f"  {i}. {product}: ${revenue:,.2f}"
+                for i, (product, revenue) in enumerate(analyzer.top_products_by_revenue(5), 1))
     
     print("\nTop Salespersons by Revenue:")
-    for i, (person, revenue) in enumerate(analyzer.top_salespersons_by_revenue(), 1):
-        print(f"  {i}. {person}: ${revenue:,.2f}")
+    print_lines(f"  {i}. {person}: ${revenue:,.2f}"
+                for i, (person, revenue) in enumerate(analyzer.top_salespersons_by_revenue(), 1))
     
     print("\nTop 5 Transactions by Value:")
-    for i, record in enumerate(analyzer.top_transactions(5), 1):
-        print(f"  {i}. {record.transaction_id}: {record.product_name} - ${record.total_amount:,.2f}")
+    print_lines(f"  {i}. {record.transaction_id}: {record.product_name} - ${record.total_amount:,.2f}"
+                for i, record in enumerate(analyzer.top_transactions(5), 1))
 
 
 def demo_functional_patterns(analyzer: SalesAnalyzer):
@@ -142,22 +152,16 @@ def demo_functional_patterns(analyzer: SalesAnalyzer):
     for r in high_value[:3]:
         print(f"    {r.transaction_id}: ${r.total_amount:.2f}")
     
-    # REDUCE: Calculate total
-    from functools import reduce
+    # REDUCE: Calculate total (operator.add keeps each step in C)
     print("\nREDUCE - Sum all quantities:")
-    total_qty = reduce(lambda acc, r: acc + r.quantity, records, 0)
+    total_qty = reduce(add, map(attrgetter('quantity'), records), 0)
     print(f"  Total quantity: {total_qty}")
     
-    # Combined: Filter -> Map -> Reduce
-    print("\nCOMBINED (filter -> map -> reduce):")
+    # Combined: Filter -> Map -> Reduce, fused into one generator over sum()
+    print("\nCOMBINED (filter -> map -> sum in one generator):")
     print("  Electronics total revenue:")
-    electronics_revenue = reduce(
-        lambda acc, amount: acc + amount,
-        map(
-            lambda r: r.total_amount,
-            filter(lambda r: r.category == "Electronics", records)
-        ),
-        0.0
+    electronics_revenue = sum(
+        r.total_amount for r in records if r.category == "Electronics"
     )
     print(f"  ${electronics_revenue:,.2f}")
     
@@ -173,16 +177,11 @@ def demo_partial_functions(analyzer: SalesAnalyzer):
     """Demonstrate functools.partial usage."""
     print_section("7. Partial Functions (functools.partial)")
     
-    from assignment2_data_analysis.analysis import (
-        get_amount, get_quantity, get_category,
-        make_category_filter, make_region_filter, make_min_amount_filter
-    )
-    
     records = analyzer.records
     
-    # Using partial functions to extract attributes
-    print("\nUsing partial functions for attribute extraction:")
-    print(f"  get_amount(record) = partial(_get_attribute, 'total_amount')")
+    # Using attrgetter to extract attributes
+    print("\nUsing operator.attrgetter for attribute extraction:")
+    print(f"  get_amount = attrgetter('total_amount')")
     amounts = list(map(get_amount, records[:3]))
     print(f"  First 3 amounts: {[f'${a:.2f}' for a in amounts]}")
     
@@ -244,20 +243,22 @@ def demo_summary(analyzer: SalesAnalyzer):
     
     summary = analyzer.summary()
     
-    print(f"\n{'Metric':<30} {'Value':>20}")
-    print("-" * 52)
-    print(f"{'Total Transactions':<30} {summary['total_transactions']:>20,}")
-    print(f"{'Total Revenue':<30} ${summary['total_revenue']:>19,.2f}")
-    print(f"{'Total Quantity':<30} {summary['total_quantity']:>20,}")
-    print(f"{'Average Transaction':<30} ${summary['average_transaction']:>19,.2f}")
-    print(f"{'Median Transaction':<30} ${summary['median_transaction']:>19,.2f}")
-    print(f"{'Std Deviation':<30} ${summary['std_deviation']:>19,.2f}")
-    print(f"{'Min Transaction':<30} ${summary['min_transaction']:>19,.2f}")
-    print(f"{'Max Transaction':<30} ${summary['max_transaction']:>19,.2f}")
-    print(f"{'Unique Products':<30} {summary['unique_products']:>20}")
-    print(f"{'Unique Categories':<30} {summary['unique_categories']:>20}")
-    print(f"{'Unique Regions':<30} {summary['unique_regions']:>20}")
-    print(f"{'Unique Salespersons':<30} {summary['unique_salespersons']:>20}")
+    print_lines([
+        f"\n{'Metric':<30} {'Value':>20}",
+        "-" * 52,
+        f"{'Total Transactions':<30} {summary['total_transactions']:>20,}",
+        f"{'Total Revenue':<30} ${summary['total_revenue']:>19,.2f}",
+        f"{'Total Quantity':<30} {summary['total_quantity']:>20,}",
+        f"{'Average Transaction':<30} ${summary['average_transaction']:>19,.2f}",
+        f"{'Median Transaction':<30} ${summary['median_transaction']:>19,.2f}",
+        f"{'Std Deviation':<30} ${summary['std_deviation']:>19,.2f}",
+        f"{'Min Transaction':<30} ${summary['min_transaction']:>19,.2f}",
+        f"{'Max Transaction':<30} ${summary['max_transaction']:>19,.2f}",
+        f"{'Unique Products':<30} {summary['unique_products']:>20}",
+        f"{'Unique Categories':<30} {summary['unique_categories']:>20}",
+        f"{'Unique Regions':<30} {summary['unique_regions']:>20}",
+        f"{'Unique Salespersons':<30} {summary['unique_salespersons']:>20}",
+    ])
 
 
 def main():
@@ -267,10 +268,9 @@ def main():
     print("  map | filter | reduce | lambda | partial | groupby")
     print("=" * 60)
     
-    # Load data
+    # Load data column-wise; records are only built once a demo needs them
     data_path = get_data_path()
-    records = load_sales_data(data_path)
-    analyzer = SalesAnalyzer(records)
+    analyzer = SalesAnalyzer.from_columns(load_sales_columns(data_path))
     
     # Run demos
     demo_basic_loading()
@@ -6,7 +6,19 @@ Defines the SalesRecord dataclass representing a single sales transaction.
 
 from dataclasses import dataclass
 from datetime import date
-from typing import Optional
+from functools import lru_cache
+from operator import itemgetter
+from sys import intern
+from typing import Callable, Optional, Sequence
+
+
+# Sales files repeat the same few hundred dates, so parse each one once;
+# equal dates then also share a single date object
+_parse_date: Callable[[str], date] = lru_cache(maxsize=4096)(date.fromisoformat)
+
+# Reads every field from a row dict in one C call, in field order
+_pick_fields = itemgetter('transaction_id', 'date', 'product_name', 'category',
+                          'quantity', 'unit_price', 'region', 'salesperson')
 
 
 @dataclass(frozen=True)
@@ -23,7 +35,17 @@ class SalesRecord:
         unit_price: Price per unit
         region: Sales region (e.g., North, South, East, West)
         salesperson: Name of the salesperson
+        total_amount: quantity * unit_price, computed once at construction
+    
+    Instances use __slots__ instead of a per-instance __dict__, so records
+    are smaller and attribute reads in the analysis loops are offset loads.
+    (Declared by hand rather than with dataclass(slots=True), which needs
+    Python 3.10.)
     """
+    __slots__ = ('transaction_id', 'date', 'product_name', 'category',
+                 'quantity', 'unit_price', 'region', 'salesperson',
+                 'total_amount')
+    
     transaction_id: str
     date: date
     product_name: str
@@ -33,16 +55,20 @@ class SalesRecord:
     region: str
     salesperson: str
     
-    @property
-    def total_amount(self) -> float:
-        """Calculate total amount for this transaction."""
-        return self.quantity * self.unit_price
+    def __post_init__(self) -> None:
+        # total_amount is a plain slot rather than a dataclass field, so it
+        # is derived here and stays out of __init__, equality and hashing.
+        # Frozen instances reject normal assignment, so bypass __setattr__.
+        object.__setattr__(self, 'total_amount', self.quantity * self.unit_price)
     
     @classmethod
     def from_dict(cls, data: dict) -> 'SalesRecord':
         """
         Create a SalesRecord from a dictionary.
         
+        The low-cardinality category, region and salesperson strings are
+        interned, so records share one object per distinct value.
+        
         Args:
             data: Dictionary with keys matching field names.
                   Date should be in 'YYYY-MM-DD' format.
@@ -50,16 +76,55 @@ class SalesRecord:
         Returns:
             A new SalesRecord instance.
         """
-        return cls(
-            transaction_id=data['transaction_id'],
-            date=date.fromisoformat(data['date']),
-            product_name=data['product_name'],
-            category=data['category'],
-            quantity=int(data['quantity']),
-            unit_price=float(data['unit_price']),
-            region=data['region'],
-            salesperson=data['salesperson']
-        )
+        (transaction_id, day, product_name, category,
+         quantity, unit_price, region, salesperson) = _pick_fields(data)
+        return cls(transaction_id, _parse_date(day), product_name, intern(category),
+                   int(quantity), float(unit_price), intern(region), intern(salesperson))
+    
+    @classmethod
+    def from_row(cls, row: Sequence[str], positions: Sequence[int]) -> 'SalesRecord':
+        """
+        Create a SalesRecord from a positional CSV row.
+        
+        Interns category, region and salesperson, as from_dict does.
+        For many rows with the same layout, build one row_parser instead.
+        
+        Args:
+            row: Field values as strings, e.g. a list from csv.reader.
+            positions: Index in row of each field, in field order
+                       (transaction_id, date, ..., salesperson).
+        
+        Returns:
+            A new SalesRecord instance.
+        """
+        return cls.row_parser(positions)(row)
+    
+    @classmethod
+    def row_parser(cls, positions: Sequence[int]) -> Callable[[Sequence[str]], 'SalesRecord']:
+        """
+        Build a parser for CSV rows with a fixed column layout.
+        
+        The positions are baked into one itemgetter, so each row is picked
+        apart by a single C call instead of a lookup per field.
+        
+        Args:
+            positions: Index in each row of each field, in field order.
+        
+        Returns:
+            Function turning one row into a SalesRecord (see from_row).
+            It raises ValueError for a row too short to hold every field.
+        """
+        pick = itemgetter(*positions)
+        def parse(row: Sequence[str]) -> 'SalesRecord':
+            try:
+                (transaction_id, day, product_name, category,
+                 quantity, unit_price, region, salesperson) = pick(row)
+            except IndexError:
+                raise ValueError("CSV has a row with fewer fields than the header") from None
+            return cls(transaction_id, _parse_date(day), product_name, intern(category),
+                       int(quantity), float(unit_price), intern(region), intern(salesperson))
+        
+        return parse
     
     def to_dict(self) -> dict:
         """Convert record to dictionary."""
@@ -75,6 +140,14 @@ class SalesRecord:
             'total_amount': self.total_amount
         }
     
+    def __getstate__(self) -> tuple:
+        return tuple(getattr(self, name) for name in self.__slots__)
+    
+    def __setstate__(self, state: tuple) -> None:
+        # Frozen instances reject normal assignment, so bypass __setattr__
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+    
     def __repr__(self) -> str:
         return (f"SalesRecord({self.transaction_id}, {self.date}, "
                 f"{self.product_name}, ${self.total_amount:.2f})")
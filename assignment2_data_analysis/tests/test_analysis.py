@@ -4,40 +4,44 @@ Unit tests for SalesAnalyzer class.
 Tests functional programming operations: map, filter, reduce, lambda, groupby.
 """
 
+import statistics
 import unittest
 from datetime import date
-from functools import reduce
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-from assignment2_data_analysis.models import SalesRecord
-from assignment2_data_analysis.analysis import SalesAnalyzer
+from ..models import SalesRecord
+from ..analysis import SalesAnalyzer
 
 
 class TestAnalyzerSetup(unittest.TestCase):
-    """Base class with test data setup."""
+    """
+    Base class with test data setup.
     
-    def setUp(self):
+    The records and analyzer are built once per class: both are immutable,
+    and the analyzer's caches hand out copies, so tests cannot disturb
+    each other through them.
+    """
+    
+    @classmethod
+    def setUpClass(cls):
         """Create test records."""
-        self.records = [
+        cls.records = [
             SalesRecord("TXN001", date(2024, 1, 15), "Laptop", "Electronics", 2, 1000.00, "North", "Alice"),
             SalesRecord("TXN002", date(2024, 1, 16), "Chair", "Furniture", 3, 200.00, "South", "Bob"),
             SalesRecord("TXN003", date(2024, 1, 17), "Mouse", "Electronics", 5, 30.00, "North", "Alice"),
             SalesRecord("TXN004", date(2024, 1, 18), "Desk", "Furniture", 1, 500.00, "East", "Carol"),
             SalesRecord("TXN005", date(2024, 1, 19), "Monitor", "Electronics", 2, 400.00, "South", "Bob"),
         ]
-        self.analyzer = SalesAnalyzer(self.records)
+        cls.analyzer = SalesAnalyzer(cls.records)
 
 
 class TestBasicAggregations(TestAnalyzerSetup):
-    """Test basic aggregation operations using reduce."""
+    """Test basic aggregation operations."""
     
     def test_count(self):
         """Test record count."""
         self.assertEqual(self.analyzer.count, 5)
     
     def test_total_revenue(self):
-        """Test total revenue calculation (uses reduce)."""
+        """Test total revenue calculation (uses sum)."""
         # Manual calculation: 2000 + 600 + 150 + 500 + 800 = 4050
         expected = 2000.00 + 600.00 + 150.00 + 500.00 + 800.00
         self.assertAlmostEqual(self.analyzer.total_revenue(), expected, places=2)
@@ -53,6 +57,16 @@ class TestBasicAggregations(TestAnalyzerSetup):
         expected = total / 5
         self.assertAlmostEqual(self.analyzer.average_transaction_value(), expected, places=2)
     
+    def test_average_is_total_over_count(self):
+        """Test that the average is exactly total revenue divided by count."""
+        records = [
+            SalesRecord(f"TXN{i}", date(2024, 1, 1), "Pen", "Office", 1, price, "North", "Alice")
+            for i, price in enumerate([1526.94, 14.19, 896.32, 1445.86])
+        ]
+        analyzer = SalesAnalyzer(records)
+        self.assertEqual(analyzer.average_transaction_value(),
+                         analyzer.total_revenue() / analyzer.count)
+    
     def test_min_transaction(self):
         """Test finding minimum (uses min with lambda)."""
         min_record = self.analyzer.min_transaction()
@@ -105,6 +119,8 @@ class TestFilterOperations(TestAnalyzerSetup):
             date(2024, 1, 18)
         )
         self.assertEqual(filtered.count, 3)
+        self.assertEqual([r.transaction_id for r in filtered.records],
+                         ["TXN002", "TXN003", "TXN004"])
     
     def test_custom_filter(self):
         """Test custom predicate filter."""
@@ -126,6 +142,43 @@ class TestFilterOperations(TestAnalyzerSetup):
         
         self.assertEqual(self.analyzer.count, original_count)
         self.assertNotEqual(filtered.count, original_count)
+    
+    def test_filter_unknown_value(self):
+        """Test filtering on a value no record has."""
+        filtered = self.analyzer.filter_by_category("Toys")
+        
+        self.assertEqual(filtered.count, 0)
+        self.assertEqual(filtered.total_revenue(), 0.0)
+    
+    def test_repeated_filter_uses_same_index(self):
+        """Test that repeated equality filters agree with a predicate scan."""
+        for category in ("Electronics", "Furniture", "Electronics"):
+            with self.subTest(category=category):
+                indexed = self.analyzer.filter_by_category(category)
+                scanned = self.analyzer.filter_by(lambda r: r.category == category)
+                self.assertEqual(indexed.records, scanned.records)
+                self.assertEqual(indexed.get_all_amounts(), scanned.get_all_amounts())
+    
+    def test_filter_narrows_inherited_encodings(self):
+        """Test that a filtered analyzer's groupings match a fresh analyzer's."""
+        parent = SalesAnalyzer(self.records)
+        parent.revenue_by_region()
+        parent.get_unique_categories()
+        filtered = parent.filter_by_min_amount(500).filter_by_category("Electronics")
+        fresh = SalesAnalyzer(filtered.records)
+        
+        self.assertEqual(filtered.revenue_by_region(), fresh.revenue_by_region())
+        self.assertEqual(filtered.get_unique_regions(), ["North", "South"])
+        self.assertEqual(filtered.get_unique_categories(), ["Electronics"])
+        self.assertEqual(filtered.group_by_region(), fresh.group_by_region())
+    
+    def test_filtered_columns_match_records(self):
+        """Test that masked numeric columns stay aligned with the records."""
+        filtered = self.analyzer.filter_by_region("South").filter_by_min_amount(700)
+        
+        self.assertEqual([r.transaction_id for r in filtered.records], ["TXN005"])
+        self.assertEqual(filtered.get_all_amounts(), [800.00])
+        self.assertEqual(filtered.total_quantity(), 2)
 
 
 class TestGroupingOperations(TestAnalyzerSetup):
@@ -148,6 +201,28 @@ class TestGroupingOperations(TestAnalyzerSetup):
         self.assertEqual(len(groups["South"]), 2)
         self.assertEqual(len(groups["East"]), 1)
     
+    def test_group_by_results_are_isolated(self):
+        """Test that mutating a returned group leaves later results intact."""
+        analyzer = SalesAnalyzer(self.records)
+        analyzer.group_by_category()["Electronics"].clear()
+        analyzer.group_by_region().clear()
+        
+        self.assertEqual(len(analyzer.group_by_category()["Electronics"]), 3)
+        self.assertEqual(len(analyzer.group_by_region()), 3)
+        self.assertEqual(analyzer.summary(), self.analyzer.summary())
+    
+    def test_group_by_many_distinct_values(self):
+        """Test grouping when there are more distinct keys than fit in one byte."""
+        records = [
+            SalesRecord(f"TXN{i}", date(2024, 1, 1), f"Product {i % 300}",
+                        "Electronics", 1, 1.0, "North", "Alice")
+            for i in range(600)
+        ]
+        quantities = SalesAnalyzer(records).quantity_by_product()
+        
+        self.assertEqual(len(quantities), 300)
+        self.assertEqual(quantities["Product 299"], 2)
+    
     def test_group_by_salesperson(self):
         """Test grouping by salesperson."""
         groups = self.analyzer.group_by_salesperson()
@@ -171,7 +246,7 @@ class TestAggregationByGroup(TestAnalyzerSetup):
     """Test aggregations per group."""
     
     def test_revenue_by_category(self):
-        """Test revenue aggregation by category (uses groupby + reduce)."""
+        """Test revenue aggregation by category."""
         revenue = self.analyzer.revenue_by_category()
         
         # Electronics: 2000 + 150 + 800 = 2950
@@ -200,6 +275,22 @@ class TestAggregationByGroup(TestAnalyzerSetup):
         self.assertEqual(counts["North"], 2)
         self.assertEqual(counts["South"], 2)
         self.assertEqual(counts["East"], 1)
+    
+    def test_average_by_category(self):
+        """Test average transaction value per category."""
+        averages = self.analyzer.average_by_category()
+        
+        self.assertAlmostEqual(averages["Electronics"], (2000.00 + 150.00 + 800.00) / 3, places=2)
+        self.assertAlmostEqual(averages["Furniture"], (600.00 + 500.00) / 2, places=2)
+    
+    def test_revenue_by_group_matches_group_by(self):
+        """Test that the fused revenue sums agree with group_by + sum."""
+        for grouped, revenue in [
+            (self.analyzer.group_by_category(), self.analyzer.revenue_by_category()),
+            (self.analyzer.group_by_salesperson(), self.analyzer.revenue_by_salesperson()),
+        ]:
+            expected = {key: sum(r.total_amount for r in group) for key, group in grouped.items()}
+            self.assertEqual(revenue, expected)
 
 
 class TestRankingOperations(TestAnalyzerSetup):
@@ -226,6 +317,13 @@ class TestRankingOperations(TestAnalyzerSetup):
         
         self.assertEqual(len(top), 3)
         self.assertEqual(top[0].transaction_id, "TXN001")  # $2000
+    
+    def test_top_transactions_matches_full_sort(self):
+        """Test that the heap-based ranking agrees with a full sort."""
+        expected = sorted(self.records, key=lambda r: r.total_amount, reverse=True)
+        for n in (0, 1, 3, 10):
+            with self.subTest(n=n):
+                self.assertEqual(self.analyzer.top_transactions(n), expected[:n])
 
 
 class TestTransformations(TestAnalyzerSetup):
@@ -238,6 +336,13 @@ class TestTransformations(TestAnalyzerSetup):
         self.assertEqual(len(amounts), 5)
         self.assertIn(2000.00, amounts)
     
+    def test_get_all_amounts_returns_copy(self):
+        """Test that mutating the returned amounts leaves the analyzer intact."""
+        self.analyzer.get_all_amounts().clear()
+        
+        self.assertEqual(len(self.analyzer.get_all_amounts()), 5)
+        self.assertAlmostEqual(self.analyzer.total_revenue(), 4050.00, places=2)
+    
     def test_get_unique_categories(self):
         """Test getting unique categories (uses set + map)."""
         categories = self.analyzer.get_unique_categories()
@@ -251,6 +356,11 @@ class TestTransformations(TestAnalyzerSetup):
         regions = self.analyzer.get_unique_regions()
         
         self.assertEqual(len(regions), 3)  # North, South, East
+    
+    def test_unique_values_in_first_seen_order(self):
+        """Test that the encoded value tables keep first-appearance order."""
+        self.assertEqual(self.analyzer.get_unique_regions(), ["North", "South", "East"])
+        self.assertEqual(list(self.analyzer.group_by_region()), ["North", "South", "East"])
 
 
 class TestSummary(TestAnalyzerSetup):
@@ -276,6 +386,50 @@ class TestSummary(TestAnalyzerSetup):
         
         self.assertEqual(summary["total_transactions"], 5)
         self.assertEqual(summary["unique_categories"], 2)
+    
+    def test_summary_matches_individual_accessors(self):
+        """Test that the fused summary agrees with a fresh analyzer's accessors."""
+        summary = self.analyzer.summary()
+        fresh = SalesAnalyzer(self.records)
+        
+        self.assertEqual(summary["revenue_by_category"],
+                         {k: round(v, 2) for k, v in fresh.revenue_by_category().items()})
+        self.assertEqual(summary["revenue_by_region"],
+                         {k: round(v, 2) for k, v in fresh.revenue_by_region().items()})
+        self.assertEqual(summary["unique_products"], len(fresh.get_unique_products()))
+        self.assertEqual(summary["unique_salespersons"], 3)
+
+
+class TestCaching(TestAnalyzerSetup):
+    """Test that cached aggregations stay correct and isolated."""
+    
+    def test_repeated_calls_return_same_values(self):
+        """Test that a cached result matches the first computation."""
+        first = self.analyzer.revenue_by_category()
+        self.assertEqual(self.analyzer.revenue_by_category(), first)
+        self.assertEqual(self.analyzer.summary(), self.analyzer.summary())
+    
+    def test_mutating_result_does_not_change_cache(self):
+        """Test that callers get copies of cached lists and dicts."""
+        self.analyzer.revenue_by_category().clear()
+        self.analyzer.get_unique_regions().append("Nowhere")
+        
+        self.assertEqual(len(self.analyzer.revenue_by_category()), 2)
+        self.assertNotIn("Nowhere", self.analyzer.get_unique_regions())
+    
+    def test_cached_min_max_and_rankings(self):
+        """Test that cached record results are stable across calls."""
+        self.assertIs(self.analyzer.max_transaction(), self.analyzer.max_transaction())
+        self.assertEqual(self.analyzer.min_transaction().transaction_id, "TXN003")
+        self.assertEqual(self.analyzer.top_products_by_revenue(2),
+                         self.analyzer.top_products_by_revenue(2))
+    
+    def test_filtered_analyzer_has_own_cache(self):
+        """Test that a filtered analyzer does not reuse the parent's results."""
+        self.analyzer.total_revenue()
+        electronics = self.analyzer.filter_by_category("Electronics")
+        
+        self.assertAlmostEqual(electronics.total_revenue(), 2950.00, places=2)
 
 
 class TestAdvancedStatistics(TestAnalyzerSetup):
@@ -309,6 +463,24 @@ class TestAdvancedStatistics(TestAnalyzerSetup):
         variance = self.analyzer.variance()
         # Variance should be positive
         self.assertGreater(variance, 0)
+        self.assertAlmostEqual(variance, statistics.pvariance([2000, 600, 150, 500, 800]), places=2)
+    
+    def test_variance_large_offset(self):
+        """Test that the single-pass variance stays accurate for large, close amounts."""
+        records = [
+            SalesRecord(f"TXN{i}", date(2024, 1, 15), "Server", "Electronics", 1, price, "North", "Alice")
+            for i, price in enumerate([1e9 + 4, 1e9 + 7, 1e9 + 13, 1e9 + 16])
+        ]
+        analyzer = SalesAnalyzer(records)
+        
+        self.assertAlmostEqual(analyzer.variance(), 22.5, places=6)
+        self.assertAlmostEqual(analyzer.average_transaction_value(), 1e9 + 10, places=6)
+    
+    def test_variance_empty(self):
+        """Test variance and std deviation with no records."""
+        empty = SalesAnalyzer([])
+        self.assertEqual(empty.variance(), 0.0)
+        self.assertEqual(empty.std_deviation(), 0.0)
     
     def test_std_deviation(self):
         """Test standard deviation calculation."""
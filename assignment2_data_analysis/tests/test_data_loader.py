@@ -2,21 +2,27 @@
 Unit tests for data loading functions.
 """
 
+import csv
+import gc
+import os
+import sys
+import tempfile
 import unittest
+from unittest import mock
 from datetime import date
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-from assignment2_data_analysis.data_loader import load_sales_from_string, load_sales_data
-from assignment2_data_analysis.models import SalesRecord
+from .. import data_loader
+from ..analysis import SalesAnalyzer
+from ..data_loader import (
+    load_sales_from_string, load_sales_data, load_sales_columns,
+    filter_and_load, raw_category_eq,
+)
+from ..models import SalesRecord
 
 
 class TestDataLoader(unittest.TestCase):
     """Test CSV loading functions."""
     
-    def setUp(self):
-        """Set up test CSV data."""
-        self.csv_content = """transaction_id,date,product_name,category,quantity,unit_price,region,salesperson
+    csv_content = """transaction_id,date,product_name,category,quantity,unit_price,region,salesperson
 TXN001,2024-01-15,Laptop,Electronics,2,999.99,North,Alice
 TXN002,2024-01-16,Chair,Furniture,3,199.99,South,Bob
 TXN003,2024-01-17,Mouse,Electronics,5,29.99,East,Carol"""
@@ -39,6 +45,13 @@ TXN003,2024-01-17,Mouse,Electronics,5,29.99,East,Carol"""
         self.assertEqual(first.unit_price, 999.99)
         self.assertEqual(first.date, date(2024, 1, 15))
     
+    def test_low_cardinality_fields_interned(self):
+        """Test that repeated category strings share one object."""
+        records = load_sales_from_string(self.csv_content)
+        
+        self.assertIs(records[0].category, records[2].category)
+        self.assertIs(records[0].category, sys.intern("Electronics"))
+    
     def test_load_preserves_order(self):
         """Test that records are loaded in order."""
         records = load_sales_from_string(self.csv_content)
@@ -53,18 +66,250 @@ TXN003,2024-01-17,Mouse,Electronics,5,29.99,East,Carol"""
         
         self.assertEqual(len(records), 0)
     
+    def test_reordered_columns_and_blank_lines(self):
+        """Test that columns are matched by header name and blank lines skipped."""
+        csv_content = """salesperson,transaction_id,date,product_name,category,quantity,unit_price,region
+Alice,TXN001,2024-01-15,Laptop,Electronics,2,999.99,North
+
+Bob,TXN002,2024-01-16,Chair,Furniture,3,199.99,South
+"""
+        records = load_sales_from_string(csv_content)
+        
+        self.assertEqual([r.transaction_id for r in records], ["TXN001", "TXN002"])
+        self.assertEqual(records[1].salesperson, "Bob")
+    
+    def test_quoted_and_crlf_content_parsed_as_csv(self):
+        """Test that quoted fields and CRLF line endings parse like plain rows."""
+        csv_content = self.csv_content.replace("Laptop", '"Laptop, 15in"').replace("\n", "\r\n")
+        records = load_sales_from_string(csv_content)
+        
+        self.assertEqual(records[0].product_name, "Laptop, 15in")
+        self.assertEqual(records[1:], load_sales_from_string(self.csv_content)[1:])
+    
+    def test_split_fast_path_matches_csv_reader(self):
+        """Test that unquoted LF text parses exactly as the csv.reader path does."""
+        header = self.csv_content.split("\n")[0]
+        cases = {
+            "header only": header + "\n",
+            "blank": "\n",
+            "empty": "",
+            "leading blank lines": "\n\n" + self.csv_content,
+            "trailing blank lines": self.csv_content + "\n\n",
+            "short row": self.csv_content + "\nTXN004,2024-01-18,Desk",
+            "space-only line": self.csv_content + "\n   \n",
+        }
+        for name, csv_content in cases.items():
+            with self.subTest(name):
+                # A carriage return sends the string down the csv.reader path
+                crlf_content = csv_content.replace("\n", "\r\n")
+                try:
+                    expected = load_sales_from_string(crlf_content)
+                except ValueError as error:
+                    with self.assertRaises(ValueError) as caught:
+                        load_sales_from_string(csv_content)
+                    self.assertEqual(str(caught.exception), str(error))
+                else:
+                    self.assertEqual(load_sales_from_string(csv_content), expected)
+    
+    def test_missing_column_raises(self):
+        """Test that a header without a required column raises ValueError."""
+        with self.assertRaises(ValueError):
+            load_sales_from_string("transaction_id,date\nTXN001,2024-01-15")
+    
+    def test_gc_state_restored(self):
+        """Test that loading leaves the garbage collector as it found it."""
+        self.assertTrue(gc.isenabled())
+        load_sales_from_string(self.csv_content)
+        self.assertTrue(gc.isenabled())
+        
+        gc.disable()
+        self.addCleanup(gc.enable)
+        load_sales_from_string(self.csv_content)
+        self.assertFalse(gc.isenabled())
+    
     def test_file_not_found(self):
         """Test that FileNotFoundError is raised for missing file."""
         with self.assertRaises(FileNotFoundError):
             load_sales_data("/nonexistent/path/data.csv")
 
 
+class TestFileLoading(unittest.TestCase):
+    """Test loading from a CSV file on disk."""
+    
+    csv_content = """transaction_id,date,product_name,category,quantity,unit_price,region,salesperson
+TXN001,2024-01-15,Laptop,Electronics,2,999.99,North,Alice
+TXN002,2024-01-16,Chair,Furniture,3,199.99,South,Bob"""
+    
+    def setUp(self):
+        """Write test CSV data to a temporary file."""
+        handle, self.path = tempfile.mkstemp(suffix=".csv")
+        with os.fdopen(handle, "w", newline="", encoding="utf-8") as file:
+            file.write(self.csv_content)
+        self.addCleanup(os.remove, self.path)
+    
+    def test_column_values(self):
+        """Test that columns are parsed to the field types."""
+        columns = load_sales_columns(self.path)
+        
+        self.assertEqual(columns["transaction_id"], ["TXN001", "TXN002"])
+        self.assertEqual(columns["date"], [date(2024, 1, 15), date(2024, 1, 16)])
+        self.assertEqual(columns["quantity"], [2, 3])
+        self.assertEqual(columns["unit_price"], [999.99, 199.99])
+    
+    def test_analyzer_from_columns(self):
+        """Test that from_columns matches an analyzer built from records."""
+        from_columns = SalesAnalyzer.from_columns(load_sales_columns(self.path))
+        from_records = SalesAnalyzer(load_sales_from_string(self.csv_content))
+        
+        self.assertEqual(from_columns.records, from_records.records)
+        self.assertEqual(from_columns.summary(), from_records.summary())
+    
+    def test_parallel_load_matches_serial(self):
+        """Test that parsing on several threads keeps every record in order."""
+        with open(self.path, "a", encoding="utf-8") as file:
+            for i in range(3, 20):
+                file.write(f"\nTXN{i:03d},2024-02-{i:02d},Desk,Furniture,{i},10.5,East,Carol")
+        serial = load_sales_data(self.path, workers=1)
+        
+        with mock.patch.object(data_loader, "_PARALLEL_MIN_BYTES", 0):
+            for workers in (2, 3, 64):
+                with self.subTest(workers=workers):
+                    self.assertEqual(load_sales_data(self.path, workers=workers), serial)
+        self.assertEqual(len(serial), 19)
+    
+    def test_parallel_load_with_quoted_newlines(self):
+        """Test that quoted fields spanning lines survive a parallel load."""
+        with open(self.path, "a", encoding="utf-8") as file:
+            for i in range(3, 20):
+                file.write(f'\nTXN{i:03d},2024-02-{i:02d},"Desk\nmodel {i}",Furniture,{i},10.5,East,Carol')
+        serial = load_sales_data(self.path, workers=1)
+        
+        with mock.patch.object(data_loader, "_PARALLEL_MIN_BYTES", 0):
+            for workers in (2, 3, 4):
+                with self.subTest(workers=workers):
+                    self.assertEqual(load_sales_data(self.path, workers=workers), serial)
+        self.assertEqual(len(serial), 19)
+        self.assertEqual(serial[-1].product_name, "Desk\nmodel 19")
+    
+    def test_parallel_string_load_matches_serial(self):
+        """Test that a string split across threads parses to the same records."""
+        serial = load_sales_from_string(self.csv_content, workers=1)
+        
+        with mock.patch.object(data_loader, "_PARALLEL_MIN_BYTES", 0):
+            self.assertEqual(load_sales_from_string(self.csv_content, workers=2), serial)
+    
+    def test_parallel_string_load_with_quoted_newlines(self):
+        """Test that quoted multi-line fields are never split across threads."""
+        csv_content = self.csv_content + "".join(
+            f'\nTXN{i:03d},2024-02-{i:02d},"Desk\nmodel {i}",Furniture,{i},10.5,East,Carol'
+            for i in range(3, 20)
+        )
+        serial = load_sales_from_string(csv_content, workers=1)
+        
+        with mock.patch.object(data_loader, "_PARALLEL_MIN_BYTES", 0):
+            self.assertEqual(load_sales_from_string(csv_content, workers=3), serial)
+        self.assertEqual(serial[-1].product_name, "Desk\nmodel 19")
+    
+    def test_filter_and_load_runs_predicates_with_gc_enabled(self):
+        """Test that caller predicates never run with the collector paused."""
+        states = []
+        
+        def predicate(record):
+            states.append(gc.isenabled())
+            return True
+        
+        filter_and_load(self.path, predicate)
+        self.assertEqual(states, [True, True])
+    
+    def test_filter_and_load_raw_predicate(self):
+        """Test that a pushed-down raw predicate filters before parsing."""
+        records = filter_and_load(self.path, lambda r: True, raw_category_eq("Furniture"))
+        
+        self.assertEqual([r.transaction_id for r in records], ["TXN002"])
+    
+    def test_from_columns_builds_records_lazily(self):
+        """Test that aggregations and filters work without building records."""
+        analyzer = SalesAnalyzer.from_columns(load_sales_columns(self.path))
+        
+        with mock.patch.object(SalesRecord, "__init__", side_effect=AssertionError):
+            furniture = analyzer.filter_by_category("Furniture")
+            self.assertEqual(furniture.count, 1)
+            self.assertEqual(analyzer.revenue_by_region(), {"North": 2 * 999.99, "South": 3 * 199.99})
+            analyzer.summary()
+        
+        self.assertEqual(furniture.records[0].transaction_id, "TXN002")
+    
+    def test_columns_from_empty_file(self):
+        """Test that an empty file gives empty columns, as load_sales_data gives []."""
+        with open(self.path, "w", encoding="utf-8"):
+            pass
+        columns = load_sales_columns(self.path)
+        
+        self.assertEqual(load_sales_data(self.path), [])
+        self.assertEqual(columns["transaction_id"], [])
+        self.assertEqual(set(columns), set(data_loader.COLUMNS))
+    
+    def test_columns_short_row_raises(self):
+        """Test that a short row raises instead of shifting later columns."""
+        with open(self.path, "a", encoding="utf-8") as file:
+            file.write("\nTXN003,2024-01-17,Mouse,Electronics,5,29.99,East")
+        with self.assertRaises(ValueError):
+            load_sales_columns(self.path)
+    
+    def test_short_row_raises(self):
+        """Test that a row with fewer fields than the header raises ValueError."""
+        with open(self.path, "a", encoding="utf-8") as file:
+            file.write("\nTXN003,2024-01-17,Mouse,Electronics,5,29.99,East")
+        with self.assertRaisesRegex(ValueError, "fewer fields"):
+            load_sales_data(self.path)
+    
+    def test_space_only_line_raises(self):
+        """Test that a line holding only spaces raises ValueError."""
+        with open(self.path, "a", encoding="utf-8") as file:
+            file.write("\n   \n")
+        with self.assertRaisesRegex(ValueError, "fewer fields"):
+            load_sales_data(self.path)
+    
+    def test_leading_blank_lines_skipped(self):
+        """Test that blank lines before the header are skipped, as DictReader does."""
+        with open(self.path, "w", encoding="utf-8") as file:
+            file.write("\n")
+        self.assertEqual(load_sales_data(self.path), [])
+        
+        with open(self.path, "w", encoding="utf-8") as file:
+            file.write("\n\n" + self.csv_content)
+        self.assertEqual(load_sales_data(self.path),
+                         load_sales_from_string(self.csv_content))
+        with mock.patch.object(data_loader, "_PARALLEL_MIN_BYTES", 0):
+            self.assertEqual(load_sales_data(self.path, workers=2),
+                             load_sales_from_string(self.csv_content))
+    
+    def test_duplicate_header_uses_last_column(self):
+        """Test that a repeated column name resolves to its last occurrence."""
+        with open(self.path, "w", encoding="utf-8") as file:
+            file.write("region,transaction_id,date,product_name,category,quantity,"
+                       "unit_price,region,salesperson\n"
+                       "Ignored,TXN001,2024-01-15,Laptop,Electronics,2,999.99,North,Alice\n")
+        records = load_sales_data(self.path)
+        
+        with open(self.path, newline="", encoding="utf-8") as file:
+            expected = list(map(SalesRecord.from_dict, csv.DictReader(file)))
+        self.assertEqual(records, expected)
+        self.assertEqual(records[0].region, "North")
+        self.assertEqual(load_sales_columns(self.path)["region"], ["North"])
+    
+    def test_missing_column(self):
+        """Test that a missing column raises ValueError."""
+        with open(self.path, "w", encoding="utf-8") as file:
+            file.write("transaction_id,date\nTXN001,2024-01-15\n")
+        with self.assertRaises(ValueError):
+            load_sales_columns(self.path)
+
+
 class TestFunctionalLoading(unittest.TestCase):
     """Test functional aspects of data loading."""
     
-    def setUp(self):
-        """Set up test data."""
-        self.csv_content = """transaction_id,date,product_name,category,quantity,unit_price,region,salesperson
+    csv_content = """transaction_id,date,product_name,category,quantity,unit_price,region,salesperson
 TXN001,2024-01-15,Laptop,Electronics,2,999.99,North,Alice
 TXN002,2024-01-16,Chair,Furniture,3,199.99,South,Bob
 TXN003,2024-01-17,Mouse,Electronics,5,29.99,East,Carol
@@ -78,7 +323,8 @@ TXN004,2024-01-18,Desk,Furniture,1,499.99,West,David"""
         amounts = list(map(lambda r: r.total_amount, records))
         
         self.assertEqual(len(amounts), 4)
-        self.assertAlmostEqual(amounts[0], 1999.98, places=2)
+        # total_amount is exactly quantity * unit_price, so no tolerance is needed
+        self.assertEqual(amounts[0], 2 * 999.99)
     
     def test_filter_transformation(self):
         """Test using filter on loaded data."""
@@ -2,12 +2,11 @@
 Unit tests for SalesRecord model.
 """
 
+import pickle
 import unittest
+from dataclasses import replace
 from datetime import date
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-from assignment2_data_analysis.models import SalesRecord
+from ..models import SalesRecord
 
 
 class TestSalesRecord(unittest.TestCase):
@@ -38,6 +37,13 @@ class TestSalesRecord(unittest.TestCase):
         expected = 2 * 999.99
         self.assertAlmostEqual(self.record.total_amount, expected, places=2)
     
+    def test_total_amount_follows_replace(self):
+        """Test that the stored total_amount is recomputed for a replaced record."""
+        updated = replace(self.record, quantity=3)
+        self.assertAlmostEqual(updated.total_amount, 3 * 999.99, places=2)
+        self.assertEqual(pickle.loads(pickle.dumps(updated)).total_amount,
+                         updated.total_amount)
+    
     def test_from_dict(self):
         """Test creating record from dictionary."""
         data = {
@@ -57,6 +63,36 @@ class TestSalesRecord(unittest.TestCase):
         self.assertEqual(record.quantity, 5)
         self.assertEqual(record.unit_price, 29.99)
     
+    def test_from_row(self):
+        """Test creating record from a positional row."""
+        row = ["Bob", "TXN002", "2024-01-20", "Mouse", "Electronics", "5", "29.99", "South"]
+        record = SalesRecord.from_row(row, [1, 2, 3, 4, 5, 6, 7, 0])
+        
+        self.assertEqual(record.transaction_id, "TXN002")
+        self.assertEqual(record.date, date(2024, 1, 20))
+        self.assertEqual(record.quantity, 5)
+        self.assertEqual(record.salesperson, "Bob")
+    
+    def test_row_parser(self):
+        """Test a row parser built once for a column layout."""
+        parse = SalesRecord.row_parser([1, 2, 3, 4, 5, 6, 7, 0])
+        rows = [
+            ["Bob", "TXN002", "2024-01-20", "Mouse", "Electronics", "5", "29.99", "South"],
+            ["Ann", "TXN003", "2024-01-21", "Desk", "Furniture", "1", "199.99", "East"],
+        ]
+        records = list(map(parse, rows))
+        
+        self.assertEqual(records[0], SalesRecord.from_row(rows[0], [1, 2, 3, 4, 5, 6, 7, 0]))
+        self.assertEqual(records[1].category, "Furniture")
+        self.assertEqual(records[1].salesperson, "Ann")
+    
+    def test_parsed_dates_are_shared(self):
+        """Test that equal date strings parse to one shared date object."""
+        parse = SalesRecord.row_parser(range(8))
+        first = parse(["TXN001", "2024-01-20", "Mouse", "Electronics", "5", "29.99", "South", "Bob"])
+        second = parse(["TXN002", "2024-01-20", "Desk", "Furniture", "1", "199.99", "East", "Ann"])
+        self.assertIs(first.date, second.date)
+    
     def test_to_dict(self):
         """Test converting record to dictionary."""
         result = self.record.to_dict()
@@ -71,6 +107,15 @@ class TestSalesRecord(unittest.TestCase):
         with self.assertRaises(AttributeError):
             self.record.quantity = 10
     
+    def test_slots(self):
+        """Test that records carry no per-instance __dict__."""
+        self.assertFalse(hasattr(self.record, "__dict__"))
+    
+    def test_pickle_roundtrip(self):
+        """Test that slotted frozen records survive pickling."""
+        restored = pickle.loads(pickle.dumps(self.record))
+        self.assertEqual(restored, self.record)
+    
     def test_repr(self):
         """Test string representation."""
         repr_str = repr(self.record)
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Test runner for both assignments
+
+Runs every test module in its own Python process, several at a time.
+Each process has its own GIL, and the threading tests spend most of their
+time waiting on condition variables, so modules run side by side instead
+of adding up their waits.
+
+Usage:
+    python3 run_tests.py            # one process per CPU
+    python3 run_tests.py -j 1       # run modules one after another
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Tuple
+
+ROOT = Path(__file__).resolve().parent
+TEST_PACKAGES = [
+    "assignment1_producer_consumer.tests",
+    "assignment2_data_analysis.tests",
+]
+
+
+def find_test_modules() -> List[str]:
+    """Return the dotted names of all test_*.py modules."""
+    modules = []
+    for package in TEST_PACKAGES:
+        directory = ROOT.joinpath(*package.split("."))
+        for path in sorted(directory.glob("test_*.py")):
+            modules.append(f"{package}.{path.stem}")
+    return modules
+
+
+def run_module(module: str) -> Tuple[str, int, str]:
+    """
+    Run one test module with unittest in a subprocess.
+    
+    Returns:
+        A tuple (module, return code, combined output).
+    """
+    result = subprocess.run(
+        [sys.executable, "-m", "unittest", module],
+        cwd=ROOT,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+    )
+    return module, result.returncode, result.stdout
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Run all test modules in parallel.")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                        help="number of test modules to run at once")
+    args = parser.parse_args()
+    
+    modules = find_test_modules()
+    failed = []
+    with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+        for module, returncode, output in pool.map(run_module, modules):
+            status = "ok" if returncode == 0 else "FAILED"
+            print(f"{module} ... {status}")
+            if returncode != 0:
+                failed.append(module)
+                print(output)
+    
+    print(f"\n{len(modules) - len(failed)}/{len(modules)} test modules passed")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())